@@ -1,83 +0,0 @@
-'''
-Arı Kolonisi Optimizasyonu (Bee Colony Optimization - BCO), arı kolonilerinin doğal davranışlarından ilham alınarak geliştirilen bir optimizasyon algoritmasıdır. 
-Bu algoritma, özellikle karmaşık problemleri çözmek için kullanılır ve arıların yiyecek kaynaklarını bulma ve değerlendirme stratejilerine dayanır. 
-Algoritma, çözüm uzayında iyi sonuçlar veren bölgeleri keşfetmeye ve bu bölgelerdeki çözümleri iyileştirmeye odaklanır.
-
-BCO algoritmasının temel adımları şunlardır:
-
-1) Başlangıç Popülasyonunun Oluşturulması: Algoritma, çözüm uzayında rastgele seçilmiş başlangıç noktalarıyla (arılar) başlar.
-
-2) Çözümlerin Değerlendirilmesi: Her bir arı (veya çözüm), belirlenen bir amaç fonksiyonuna göre değerlendirilir. Bu değerlendirme, çözümün kalitesini belirler.
-
-3) Seçilmiş Çözümlere Göre Arama: En iyi çözümlere göre çevrede arama yapılır. Bu, arıların çiçekler arasında nektar aramasına benzer. 
-Çözümler arasında geçişler yaparak daha iyi çözümler aranır.
-
-
-4) Çözümlerin Güncellenmesi: Yeni bulunan çözümler, mevcut çözümlerle karşılaştırılır ve daha iyi olanlar seçilir.
-Sonlanma Kriteri: Belirli bir iterasyon sayısına ulaşıldığında veya başka bir sonlanma kriteri karşılandığında algoritma sonlandırılır.
-
-
-Şimdi, basit bir BCO algoritmasını Python kullanarak bir örnekle gösterelim. 
-Bu örnekte, basit bir optimizasyon problemi çözmek için BCO algoritmasını kullanacağız. 
-Örneğin amaç fonksiyonu olarak, basit bir matematiksel fonksiyonu (örneğin, bir parabol) optimize edeceğiz.
-
-'''
-
-
-import numpy as np
-
-# Amaç fonksiyonu (minimize etmeye çalışıyoruz)
-def objective_function(x):
-    return x**2
-
-# Arı sınıfı
-class Bee:
-    def __init__(self, position):
-        self.position = position
-        self.value = objective_function(self.position)
-
-# BCO algoritmasının uygulanması
-def bee_colony_optimization(num_bees, num_iterations, search_space):
-    # Başlangıç popülasyonunu oluştur
-    bees = [Bee(np.random.uniform(low=search_space[0], high=search_space[1])) for _ in range(num_bees)]
-    
-    # En iyi çözümü takip et
-    best_position = bees[0].position
-    best_value = bees[0].value
-    
-    for iteration in range(num_iterations):
-        for bee in bees:
-            # Yeni pozisyon oluştur
-            candidate_position = bee.position + np.random.uniform(-1, 1)
-            candidate_value = objective_function(candidate_position)
-            
-            # Daha iyi bir çözüm bulunursa güncelle
-            if candidate_value < bee.value:
-                bee.position = candidate_position
-                bee.value = candidate_value
-                
-                # En iyi çözümü güncelle
-                if candidate_value < best_value:
-                    best_position = candidate_position
-                    best_value = candidate_value
-        
-        print(f"Iterasyon: {iteration+1}, En İyi Değer: {best_value}, En İyi Pozisyon: {best_position}")
-    
-    return best_position, best_value
-
-# Algoritmanın çalıştırılması
-num_bees = 50
-num_iterations = 20
-search_space = [-10, 10] # Arama uzayının sınırları
-
-best_position, best_value = bee_colony_optimization(num_bees, num_iterations, search_space)
-print(f"Optimizasyon sonucu elde edilen en iyi pozisyon: {best_position}, En iyi değer: {best_value}")
-
-
-'''
-
-Bu kod, belirli bir arama alanında (search_space) belirli sayıda arı (num_bees) ve iterasyon (num_iterations) kullanarak bir amaç fonksiyonunu (objective_function) minimize etmeye çalışır. 
-Her iterasyonda, her arı mevcut konumunun etrafında rastgele bir arama yapar ve daha iyi bir çözüm bulursa, o yöne doğru hareket eder. 
-Bu basit örnekte, amaç fonksiyonu olarak bir parabol kullanılmıştır, ancak BCO algoritması çok daha karmaşık fonksiyonlar ve gerçek dünya optimizasyon problemleri için de uygulanabilir.
-
-'''
\ No newline at end of file
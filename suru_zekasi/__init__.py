@@ -0,0 +1,85 @@
+'''
+Sürü zekâsı optimizasyon algoritmaları.
+
+Algoritmalar:
+    pso         Parçacık Sürü Optimizasyonu (ParticleSwarm, AsyncParticleSwarm, BatchedParticleSwarm)
+    firefly     Ateşböceği Algoritması (FireflySwarm, firefly_algorithm)
+    bee_colony  Arı Kolonisi Optimizasyonu (BeeColony, AsyncBeeColony, bee_colony_optimization)
+    dolphin     Yunus Sürüsü Optimizasyonu (DolphinSwarm, dolphin_swarm_optimization)
+    ais         Yapay Bağışıklık Sistemleri (ClonalSelection, ais_algorithm)
+    aco         Karınca Koloni Optimizasyonu (AntColonyOptimizer, BatchAntColonySolver, run_parallel_colonies)
+
+Ortak altyapı: degerlendirme (amaç fonksiyonları ve değerlendiriciler), sonlandirma, izleme, kontrol_noktasi,
+rastgele, sor_bildir, hassasiyet, cekirdekler, fonksiyonlar (test fonksiyonları) ve kiyaslama.
+
+Alt modüller ilk erişimde yüklenir: import suru_zekasi numpy'ı bile yüklemez, suru_zekasi.ParticleSwarm ya da
+from suru_zekasi import pso yalnızca pso modülünü ve ortak bağımlılıklarını yükler. Her işi yeni bir süreçte
+çalıştıran servislerde kullanılmayan algoritmaların içe aktarma maliyeti ödenmez.
+
+Komut satırı arayüzü: python -m suru_zekasi --help
+'''
+
+import importlib
+
+__version__ = '0.1.0'
+
+ALGORITHMS = ('pso', 'firefly', 'bee_colony', 'dolphin', 'ais', 'aco')
+
+_SUBMODULES = ALGORITHMS + ('cekirdekler', 'degerlendirme', 'fonksiyonlar', 'hassasiyet', 'izleme', 'kiyaslama',
+                            'kontrol_noktasi', 'rastgele', 'sonlandirma', 'sor_bildir')
+
+# Paket düzeyinde sunulan adlar -> tanımlandıkları alt modül
+_EXPORTS = {
+    'ParticleSwarm': 'pso',
+    'AsyncParticleSwarm': 'pso',
+    'BatchedParticleSwarm': 'pso',
+    'FireflySwarm': 'firefly',
+    'firefly_algorithm': 'firefly',
+    'firefly_algorithm_vectorized': 'firefly',
+    'BeeColony': 'bee_colony',
+    'AsyncBeeColony': 'bee_colony',
+    'bee_colony_optimization': 'bee_colony',
+    'DolphinSwarm': 'dolphin',
+    'dolphin_swarm_optimization': 'dolphin',
+    'ClonalSelection': 'ais',
+    'ais_algorithm': 'ais',
+    'AntColonyOptimizer': 'aco',
+    'BatchAntColonySolver': 'aco',
+    'EuclideanDistances': 'aco',
+    'HaversineDistances': 'aco',
+    'build_candidate_list': 'aco',
+    'run_parallel_colonies': 'aco',
+    'vectorized': 'degerlendirme',
+    'BatchObjective': 'degerlendirme',
+    'CachedObjective': 'degerlendirme',
+    'SerialEvaluator': 'degerlendirme',
+    'ThreadPoolEvaluator': 'degerlendirme',
+    'ProcessPoolEvaluator': 'degerlendirme',
+    'AsyncioEvaluator': 'degerlendirme',
+    'Termination': 'sonlandirma',
+    'Profiler': 'izleme',
+    'Checkpointer': 'kontrol_noktasi',
+    'BufferedRandom': 'rastgele',
+    'make_rng': 'rastgele',
+    'interleave': 'sor_bildir',
+    'memory_report': 'hassasiyet',
+    'total_bytes': 'hassasiyet',
+    'TEST_FUNCTIONS': 'fonksiyonlar',
+}
+
+__all__ = sorted(_SUBMODULES + tuple(_EXPORTS))
+
+
+def __getattr__(name):
+    # PEP 562: alt modüller ve dışa aktarılan adlar ilk erişimde yüklenir.
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f'.{_EXPORTS[name]}', __name__), name)
+        globals()[name] = value  # Sonraki erişimler __getattr__'a uğramaz
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return __all__
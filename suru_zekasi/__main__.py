@@ -0,0 +1,371 @@
+'''
+Algoritmaları Python yazmadan çalıştırmak için komut satırı arayüzü.
+
+Her iş bir algoritma, bir problem ve parametrelerden oluşur. Sonuçlar ve süreler JSON Lines olarak yazılır
+(her iş, ACO'da her örnek için bir satır). Böylece toplu çalıştırmalar betiklerle kurulup sonuçları
+satır satır işlenebilir.
+
+Sürekli algoritmalar (pso, firefly, bee_colony, dolphin, ais) bir test fonksiyonunu (fonksiyonlar modülü) ya da
+modul:fonksiyon biçiminde verilen bir amaç fonksiyonunu küçültür. aco, JSON Lines problem dosyasındaki
+(aco.read_instances biçimi) ya da iş tanımında verilen (distances/coordinates) TSP örneklerini çözer.
+
+Örnekler:
+    python -m suru_zekasi pso --function rastrigin --dim 30 --iterations 200 --seed 0
+    python -m suru_zekasi bee_colony --objective paketim.modul:maliyet --bounds -1 1 --dim 5 --option limit=20
+    python -m suru_zekasi aco --problem ornekler.jsonl --iterations 50 --output cozumler.jsonl
+    python -m suru_zekasi --config isler.json --profile
+
+İş tanımı dosyası bir JSON nesnesi, nesne listesi ya da JSON Lines olabilir; anahtarlar komut satırı
+seçenekleriyle aynıdır ve komut satırında açıkça verilen seçenekler dosyadakileri geçersiz kılar:
+    {"algorithm": "pso", "function": "ackley", "dim": 10, "iterations": 100, "seed": 1,
+     "precision": "float32", "options": {"n_particles": 50, "topology": "ring"}}
+
+Çıktı satırı:
+    {"algorithm": "pso", "problem": "ackley", "size": 10, "seed": 1, "best_value": ..., "best_solution": [...],
+     "iterations": 100, "evaluations": 5050, "stop_reason": null,
+     "timings": {"import": ..., "setup": ..., "run": ..., "total": ...}}
+
+Yükleme süresi (import) yalnızca ilk satırda raporlanır. --profile ile satırlara aşama süreleri (phases) ve
+sayaçlar (counters) eklenir. Toplu ACO'da (--batch) örnekler 256'lık parçalar halinde birlikte çözülür; aynı
+parçanın satırları parça numarasını (chunk) taşır ve süreleri ile profili parçanın tamamına aittir.
+'''
+
+import argparse
+import importlib
+import itertools
+import json
+import sys
+import time
+
+from . import ALGORITHMS
+
+DEFAULTS = {
+    'algorithm': None,
+    'function': 'sphere',
+    'objective': None,
+    'bounds': None,
+    'dim': 10,
+    'iterations': 100,
+    'seed': None,
+    'precision': 'float64',
+    'problem': None,
+    'batch': False,
+    'termination': {},
+    'options': {},
+}
+
+# Termination seçenekleri (komut satırında --max-time gibi yazılır)
+TERMINATION_KEYS = ('max_evaluations', 'max_time', 'target', 'patience', 'tolerance', 'rtol')
+
+
+def _import_timed(name, timings):
+    # Algoritma modülünü yükler; yükleme süresi (sürecin ilk işinde numpy dahil) ayrıca raporlanır.
+    start = time.perf_counter()
+    module = importlib.import_module(f'.{name}', __package__)
+    timings['import'] = time.perf_counter() - start
+    return module
+
+
+def load_objective(spec):
+    """'paket.modul:fonksiyon' biçimindeki amaç fonksiyonunu yükler."""
+    module_name, _, attribute = spec.partition(':')
+    if not attribute:
+        raise ValueError(f"Amaç fonksiyonu 'modul:fonksiyon' biçiminde verilmelidir: {spec}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def _scaled(objective, bounds, sign=1):
+    # [0, 1] aralığında çalışan algoritmalar için adayları arama aralığına ölçekleyen toplu amaç fonksiyonu.
+    from .degerlendirme import vectorized
+    low, high = bounds
+    return vectorized(lambda X: sign * objective(low + X * (high - low)))
+
+
+def _to_json(value):
+    # numpy skalerleri ve dizileri JSON'a Python değerleri olarak yazılır.
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"JSON'a yazılamayan değer: {type(value)}")
+
+
+# Algoritma başına çalıştırıcılar: algoritmayı kurar, çalıştırır ve (algoritma, en iyi çözüm, en iyi değer) döndürür.
+# options algoritma sınıfının parametreleridir; popülasyon büyüklüğü de options ile değiştirilebilir.
+def run_pso(module, objective, bounds, dim, iterations, termination, common, options):
+    options = {'n_particles': 30, **options}
+    swarm = module.ParticleSwarm(objective, options.pop('n_particles'), dim, bounds[0], bounds[1], **common,
+                                 **options)
+    return swarm, lambda: swarm.run(iterations, termination=termination)
+
+
+def run_firefly(module, objective, bounds, dim, iterations, termination, common, options):
+    # Ateşböceği [0, 1] aralığında başlar; adaylar sınırlara ölçeklenir.
+    low, high = bounds
+    swarm = module.FireflySwarm(_scaled(objective, bounds), dim, **common, **options)
+
+    def run():
+        solution, value = swarm.run(iterations, termination=termination)
+        return low + solution * (high - low), value
+
+    return swarm, run
+
+
+def run_bee_colony(module, objective, bounds, dim, iterations, termination, common, options):
+    options = {'num_bees': 30, **options}
+    colony = module.BeeColony(objective, bounds, options.pop('num_bees'), dim, **common, **options)
+    return colony, lambda: colony.run(iterations, termination=termination)
+
+
+def run_dolphin(module, objective, bounds, dim, iterations, termination, common, options):
+    options = {'population_size': 30, **options}
+    swarm = module.DolphinSwarm(objective, bounds, options.pop('population_size'), dim, **common, **options)
+    return swarm, lambda: swarm.run(iterations, termination=termination)
+
+
+def run_ais(module, objective, bounds, dim, iterations, termination, common, options):
+    # AIS afiniteyi büyütür ve [0, 1] genlerle çalışır: genler sınırlara ölçeklenir, afinite -f olur.
+    low, high = bounds
+    system = module.ClonalSelection(gene_length=dim, affinity=_scaled(objective, bounds, -1), **common, **options)
+
+    def run():
+        genes, affinities = system.run(iterations, termination=termination)
+        best = int(affinities.argmax())
+        return low + genes[best] * (high - low), -affinities[best]
+
+    return system, run
+
+
+RUNNERS = {
+    'pso': run_pso,
+    'firefly': run_firefly,
+    'bee_colony': run_bee_colony,
+    'dolphin': run_dolphin,
+    'ais': run_ais,
+}
+
+
+def make_termination(job, maximize=False):
+    settings = {key: value for key, value in job['termination'].items() if value is not None}
+    if not settings:
+        return None
+    from .sonlandirma import Termination
+    if maximize and settings.get('target') is not None:
+        settings['target'] = -settings['target']  # AIS afinitesi -f olduğundan hedef de çevrilir
+    return Termination(**settings, maximize=maximize)
+
+
+def run_continuous(job, profiler=None):
+    """Sürekli bir optimizasyon işini çalıştırır; sonuç sözlüğünü döndürür."""
+    timings = {}
+    start = time.perf_counter()
+    algorithm = job['algorithm']
+    module = _import_timed(algorithm, timings)
+    from .degerlendirme import as_batch_objective
+    from .fonksiyonlar import TEST_FUNCTIONS
+    from .hassasiyet import PRECISIONS
+
+    if job['objective'] is not None:
+        function, problem, bounds = load_objective(job['objective']), job['objective'], job['bounds']
+        if bounds is None:
+            raise ValueError("Özel amaç fonksiyonu için bounds verilmelidir.")
+    else:
+        if job['function'] not in TEST_FUNCTIONS:
+            raise ValueError(f"Bilinmeyen test fonksiyonu: {job['function']}")
+        function, default_bounds = TEST_FUNCTIONS[job['function']]
+        problem, bounds = job['function'], job['bounds'] or default_bounds
+    objective = as_batch_objective(function)
+    common = {'rng': job['seed'], 'dtype': PRECISIONS[job['precision']]}
+    if profiler is not None:
+        common['profiler'] = profiler
+    termination = make_termination(job, maximize=algorithm == 'ais')
+
+    setup = time.perf_counter()
+    optimizer, run = RUNNERS[algorithm](module, objective, tuple(bounds), job['dim'], job['iterations'], termination,
+                                        common, dict(job['options']))
+    timings['setup'] = time.perf_counter() - setup
+    started = time.perf_counter()
+    solution, value = run()
+    timings['run'] = time.perf_counter() - started
+    timings['total'] = time.perf_counter() - start
+    return {
+        'algorithm': algorithm, 'problem': problem, 'size': job['dim'], 'seed': job['seed'],
+        'precision': job['precision'],
+        'best_value': float(value),
+        'best_solution': solution,
+        'iterations': optimizer.iteration,
+        'evaluations': objective.n_evaluations,
+        'stop_reason': None if termination is None else termination.reason,
+        'timings': timings,
+    }
+
+
+def _instances(job):
+    # (id, mesafe matrisi) çiftleri: problem dosyasından ya da iş tanımındaki distances/coordinates'tan.
+    from . import aco
+    if job['problem'] is not None:
+        return aco.read_instances(job['problem'])
+    if job.get('distances') is not None or job.get('coordinates') is not None:
+        return iter([(job.get('id', 0), aco.instance_distances(job))])
+    raise ValueError("aco için problem dosyası (--problem) ya da distances/coordinates verilmelidir.")
+
+
+def run_tsp(job, profiler=None):
+    """
+    TSP işini çalıştırır ve örnek başına bir sonuç sözlüğü üretir. batch seçiliyse örnekler
+    BatchAntColonySolver ile 256'lık parçalar halinde birlikte çözülür (süreler parça başınadır).
+    """
+    timings = {}
+    module = _import_timed('aco', timings)
+    from .hassasiyet import PRECISIONS
+
+    common = {'rng': job['seed'], 'dtype': PRECISIONS[job['precision']]}
+    if profiler is not None:
+        common['profiler'] = profiler
+    instances = _instances(job)
+    if job['batch']:
+        solver = module.BatchAntColonySolver(n_iterations=job['iterations'], **common, **job['options'])
+        for chunk_index in itertools.count():
+            chunk = list(itertools.islice(instances, 256))
+            if not chunk:
+                break
+            ids, distances = zip(*chunk)
+            start = time.perf_counter()
+            tours, costs = solver.solve(list(distances))
+            timings['run'] = timings['total'] = time.perf_counter() - start
+            for instance_id, matrix, tour, cost in zip(ids, distances, tours, costs):
+                yield {'algorithm': 'aco', 'problem': instance_id, 'size': len(matrix), 'seed': job['seed'],
+                       'precision': job['precision'], 'best_value': float(cost), 'tour': tour,
+                       'iterations': job['iterations'], 'evaluations': job['iterations'] * solver.n_ants,
+                       'stop_reason': None, 'timings': dict(timings), 'chunk': chunk_index}
+                timings.pop('import', None)  # Yükleme süresi yalnızca ilk satırda raporlanır
+        return
+
+    options = {'n_ants': 10, 'n_best': 3, 'decay': 0.9, **job['options']}
+    for instance_id, distances in instances:
+        start = time.perf_counter()
+        termination = make_termination(job)
+        optimizer = module.AntColonyOptimizer(distances, n_iterations=job['iterations'], **common, **options)
+        timings['setup'] = time.perf_counter() - start
+        started = time.perf_counter()
+        tour, cost = optimizer.run(termination=termination)
+        timings['run'] = time.perf_counter() - started
+        timings['total'] = time.perf_counter() - start
+        yield {'algorithm': 'aco', 'problem': instance_id, 'size': len(distances), 'seed': job['seed'],
+               'precision': job['precision'], 'best_value': float(cost), 'tour': tour,
+               'iterations': optimizer.iteration, 'evaluations': optimizer.iteration * optimizer.n_ants,
+               'stop_reason': None if termination is None else termination.reason, 'timings': dict(timings)}
+        timings.pop('import', None)
+
+
+def run_job(job, profile=False):
+    """Bir işi çalıştırır ve sonuç sözlüklerini üretir (ACO'da örnek başına bir tane)."""
+    job = {**DEFAULTS, **job}
+    if job['algorithm'] not in ALGORITHMS:
+        raise ValueError(f"Bilinmeyen algoritma: {job['algorithm']} (seçenekler: {', '.join(ALGORITHMS)})")
+    profiler = None
+    if profile:
+        from .izleme import Profiler
+        profiler = Profiler(keep_events=False)
+    results = run_tsp(job, profiler) if job['algorithm'] == 'aco' else [run_continuous(job, profiler)]
+    profile, chunk = None, None
+    for result in results:
+        if profiler is not None:
+            # Profil satır (toplu ACO'da parça) başına bir kez alınır ve sıfırlanır; aynı parçanın satırları
+            # aynı profili paylaşır.
+            if result.get('chunk') is None or result['chunk'] != chunk:
+                summary = profiler.summary()
+                profile = {'phases': {name: phase['total'] for name, phase in summary['phases'].items()},
+                           'counters': summary['counters']}
+                chunk = result.get('chunk')
+                profiler.totals.clear()
+                profiler.calls.clear()
+                profiler.counters.clear()
+            result['phases'] = dict(profile['phases'])
+            result['counters'] = dict(profile['counters'])
+        yield result
+
+
+def read_jobs(path):
+    """İş tanımlarını okur: JSON nesnesi, nesne listesi ya da JSON Lines ('-': standart girdi)."""
+    if path == '-':
+        text = sys.stdin.read()
+    else:
+        with open(path, encoding='utf-8') as file:
+            text = file.read()
+    try:
+        jobs = json.loads(text)
+    except json.JSONDecodeError:
+        jobs = [json.loads(line) for line in text.splitlines() if line.strip()]
+    return [jobs] if isinstance(jobs, dict) else jobs
+
+
+def _option(text):
+    # --option anahtar=değer; değer JSON olarak okunamazsa metin kabul edilir.
+    key, separator, value = text.partition('=')
+    if not separator:
+        raise argparse.ArgumentTypeError(f"Seçenek anahtar=değer biçiminde olmalıdır: {text}")
+    try:
+        return key, json.loads(value)
+    except json.JSONDecodeError:
+        return key, value
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='suru-zekasi', description='Sürü zekâsı algoritmalarını çalıştırır.')
+    parser.add_argument('algorithm', nargs='?', choices=ALGORITHMS, help='Çalıştırılacak algoritma')
+    parser.add_argument('--config', help="İş tanımları (JSON, JSON listesi ya da JSON Lines; '-': standart girdi)")
+    parser.add_argument('--function', help='Test fonksiyonu (varsayılan: sphere)')
+    parser.add_argument('--objective', help="Amaç fonksiyonu, 'paket.modul:fonksiyon'")
+    parser.add_argument('--bounds', nargs=2, type=float, metavar=('ALT', 'UST'), help='Arama aralığı')
+    parser.add_argument('--dim', type=int, help='Boyut sayısı (varsayılan: 10)')
+    parser.add_argument('--iterations', type=int, help='İterasyon sayısı (varsayılan: 100)')
+    parser.add_argument('--seed', type=int, help='Rastgele sayı üreteci tohumu')
+    # hassasiyet.PRECISIONS anahtarları; --help numpy yüklenmeden yanıt verebilsin diye burada yazılıdır.
+    parser.add_argument('--precision', choices=('float64', 'float32'), help='Durum dizilerinin hassasiyeti')
+    parser.add_argument('--problem', help='aco için JSON Lines TSP örnekleri dosyası')
+    parser.add_argument('--batch', action='store_true', default=None,
+                        help='aco örneklerini BatchAntColonySolver ile birlikte çöz')
+    parser.add_argument('--option', action='append', type=_option, default=[], metavar='ANAHTAR=DEGER',
+                        help='Algoritma parametresi (tekrarlanabilir), ör. --option n_particles=50')
+    for key in TERMINATION_KEYS:
+        parser.add_argument('--' + key.replace('_', '-'), type=int if key in ('max_evaluations', 'patience')
+                            else float, help='Erken durdurma ölçütü (sonlandirma.Termination)')
+    parser.add_argument('--profile', action='store_true', help='Aşama sürelerini de yaz')
+    parser.add_argument('--output', help='Sonuçların yazılacağı JSON Lines dosyası (varsayılan: standart çıktı)')
+    parser.add_argument('--list', action='store_true', help='Algoritmaları ve test fonksiyonlarını listele')
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.list:
+        from .fonksiyonlar import TEST_FUNCTIONS
+        print('Algoritmalar:', ', '.join(ALGORITHMS))
+        print('Test fonksiyonları:', ', '.join(TEST_FUNCTIONS))
+        return 0
+
+    # Komut satırında açıkça verilen seçenekler iş tanımlarındakileri geçersiz kılar.
+    overrides = {key: value for key, value in vars(args).items()
+                 if key in DEFAULTS and key not in ('termination', 'options') and value is not None}
+    termination = {key: getattr(args, key) for key in TERMINATION_KEYS if getattr(args, key) is not None}
+    jobs = read_jobs(args.config) if args.config else [{}]
+    if not args.config and args.algorithm is None:
+        parser.error('Bir algoritma ya da --config verilmelidir.')
+
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        for job in jobs:
+            job = {**job, **overrides}
+            job['termination'] = {**job.get('termination', {}), **termination}
+            job['options'] = {**job.get('options', {}), **dict(args.option)}
+            for result in run_job(job, profile=args.profile):
+                output.write(json.dumps(result, default=_to_json) + '\n')
+                output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
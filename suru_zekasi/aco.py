@@ -0,0 +1,1008 @@
+'''
+Karınca Koloni Optimizasyonu (ACO), yapay zekâ ve optimizasyon problemlerinde sıkça kullanılan bir algoritmadır. 
+Bu algoritma, gerçek dünyadaki karınca kolonilerinin davranışlarından esinlenerek geliştirilmiştir. 
+Karıncalar, yiyecek bulma ve en kısa yolu bulma konusunda etkileyici bir yeteneğe sahiptir. 
+Bu yetenek, karıncaların birbirleriyle ve çevreleriyle etkileşim kurarak bilgi paylaşımı yapmalarından kaynaklanır. 
+ACO, bu doğal davranışı matematiksel bir modelle taklit eder ve çeşitli optimizasyon problemlerinin çözümünde kullanılır.
+
+
+----- ACO'nun Temel Prensipleri -----
+
+1) Feromon Biriktirme: 
+Karıncalar, geçtikleri yolda feromon adı verilen kimyasal izler bırakır. 
+Bu izler, diğer karıncaların yolu takip etmesine yardımcı olur. ACO'da, bir çözüm yolunun kalitesi, üzerinde biriktirilen feromon miktarıyla ilişkilendirilir. 
+İyi bir çözüm yolundan geçen "sanal karıncalar" daha fazla feromon bırakır, böylece bu yolun gelecekte tercih edilme olasılığı artar.
+
+
+2) Feromon Buharlaşması: 
+Gerçek dünyada feromon izleri zamanla buharlaşır. 
+Bu mekanizma, eski bilgilerin zamanla unutulmasını ve yeni çözümlerin keşfedilmesini sağlar. 
+ACO'da da buharlaşma, algoritmanın yerel optimumlarda takılıp kalmamasına yardımcı olur.
+
+3) Çözüm Yolu Oluşturma: Her bir karınca, çözüm uzayında rastgele veya önceki deneyimlere dayanarak bir yol oluşturur. 
+Bu süreçte, karıncaların yolu seçme olasılığı, yol üzerindeki feromon miktarına bağlıdır.
+
+
+4) Yerel ve Global Güncellemeler: 
+Yol oluşturma sürecinin sonunda, geçilen yollar üzerindeki feromon miktarı güncellenir. 
+Bu güncellemeler, yerel (yol oluşturma sırasında) ve global (en iyi çözüm bulunduktan sonra) olmak üzere iki seviyede gerçekleşir.
+
+
+
+---- ACO'nun Uygulama Alanları ----
+ACO, çeşitli optimizasyon problemlerinde kullanılabilir:
+
+* Seyahat Eden Satıcı Problemi (TSP)
+* Araç Rotalama Problemi (VRP)
+* Zamanlama ve Planlama Problemleri
+* Ağ Yönlendirme ve Bant Genişliği Tahsisi
+
+'''
+
+# karıncaların şehirler arasındaki en kısa yolu bulmasını amaçlayan bir seyahat satış temsilcisi problemi (TSP) için basit bir ACO uygulamasıdır.
+
+import abc
+import itertools
+import json
+import time
+
+import numpy as np
+
+from .hassasiyet import float_dtype
+from .izleme import NULL_PROFILER
+from .kontrol_noktasi import Checkpointable
+from .rastgele import get_rng_state, make_rng, set_rng_state
+from .sonlandirma import Termination, iteration_range
+from .sor_bildir import AskTell
+
+
+class DistanceProvider(abc.ABC):
+    """
+    Mesafeleri koordinatlardan ihtiyaç anında hesaplayan mesafe kaynağı; yoğun n x n matris saklanmaz.
+    Yoğun bir mesafe matrisi gibi indekslenebilir: d[i, j] (dizilerle de), d[satırlar], len(d), d.shape.
+    Alt sınıflar pairwise(a, b) ile iki koordinat kümesi arasındaki mesafeyi tanımlar.
+    dtype: Koordinatların ve hesaplanan mesafelerin tipi (ör. np.float32; varsayılan float64).
+    """
+    def __init__(self, coordinates, dtype=None):
+        self.coordinates = np.asarray(coordinates, dtype=float_dtype(dtype))
+        self.shape = (len(self.coordinates), len(self.coordinates))
+
+    def __len__(self):
+        return len(self.coordinates)
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            i, j = key
+            return self.pairwise(self.coordinates[i], self.coordinates[j])
+        # Satır seçimi: seçilen şehirlerden tüm şehirlere olan mesafeler.
+        rows = self.coordinates[key]
+        return self.pairwise(rows[..., None, :], self.coordinates)
+
+    @abc.abstractmethod
+    def pairwise(self, a, b):
+        """a ve b koordinatları arasındaki mesafeler (son eksen boyut, diğer eksenler yayınlanır)."""
+
+
+class EuclideanDistances(DistanceProvider):
+    """(n, boyut) koordinatlarından Öklid mesafeleri."""
+    def pairwise(self, a, b):
+        return np.sqrt(((a - b) ** 2).sum(axis=-1))
+
+
+class HaversineDistances(DistanceProvider):
+    """
+    (enlem, boylam) derece koordinatlarından büyük çember (haversine) mesafeleri.
+    radius: Küre yarıçapı; varsayılan değerle sonuç kilometre cinsindendir.
+    """
+    def __init__(self, coordinates, radius=6371.0, dtype=None):
+        super().__init__(np.radians(coordinates), dtype)
+        self.radius = radius
+
+    def pairwise(self, a, b):
+        lat_a, lon_a = a[..., 0], a[..., 1]
+        lat_b, lon_b = b[..., 0], b[..., 1]
+        h = np.sin((lat_b - lat_a) / 2) ** 2 + np.cos(lat_a) * np.cos(lat_b) * np.sin((lon_b - lon_a) / 2) ** 2
+        return 2 * self.radius * np.arcsin(np.sqrt(np.clip(h, 0, 1)))
+
+
+class SparsePheromone:
+    """
+    Feromonu yalnızca aday kenarlarda (n x k) saklayan depo; bellek O(n^2) yerine O(n*k) büyür.
+    Aday olmayan kenarlar ortak bir taban değeri döndürür ve bu kenarlara yapılan yazmalar yok sayılır.
+    Yoğun feromon matrisi gibi kullanılabilir: tau[i, j], tau[i, j] += x, tau[satırlar], tau *= decay.
+    candidates: (n, k) boyutlu aday listesi.
+    initial: Başlangıç feromon değeri.
+    dtype: Feromon değerlerinin tipi (varsayılan float64).
+    """
+    def __init__(self, candidates, initial, dtype=None):
+        self.candidates = candidates
+        self.dtype = float_dtype(dtype)
+        self.values = np.full(candidates.shape, float(initial), dtype=self.dtype)
+        self.base = float(initial)  # Aday olmayan kenarların (buharlaşan) feromon değeri
+        self.shape = (len(candidates), len(candidates))
+
+    def __len__(self):
+        return len(self.candidates)
+
+    def locate(self, i, j):
+        # (i, j) kenarının i satırındaki aday sırasını bulur.
+        i, j = np.broadcast_arrays(np.asarray(i), np.asarray(j))
+        match = self.candidates[i] == j[..., None]
+        return i, match.argmax(axis=-1), match.any(axis=-1)
+
+    def __getitem__(self, key):
+        if isinstance(key, tuple):
+            i, slot, found = self.locate(*key)
+            return np.where(found, self.values[i, slot], self.base)
+        # Satır seçimi: seçilen satırlar yoğun olarak döndürülür.
+        rows = np.arange(len(self.candidates))[key]
+        dense = np.full(np.shape(rows) + (len(self.candidates),), self.base, dtype=self.dtype)
+        np.put_along_axis(dense, self.candidates[rows], self.values[rows], axis=-1)
+        return dense
+
+    def __setitem__(self, key, value):
+        i, slot, found = self.locate(*key)
+        value = np.broadcast_to(value, found.shape)
+        self.values[i[found], slot[found]] = value[found]
+
+    def __imul__(self, factor):
+        self.values *= factor
+        self.base *= factor
+        return self
+
+    def add_at(self, i, j, values):
+        # np.add.at karşılığı: tekrar eden kenarlara yapılan eklemeler birikir.
+        i, slot, found = self.locate(i, j)
+        np.add.at(self.values, (i[found], slot[found]), np.broadcast_to(values, found.shape)[found])
+
+    def clip(self, minimum, maximum):
+        np.clip(self.values, minimum, maximum, out=self.values)
+        self.base = float(np.clip(self.base, minimum, maximum))
+
+
+def build_candidate_list(distances, k, block_size=256):
+    """
+    Her şehir için en yakın k komşuyu (şehrin kendisi hariç) yakından uzağa sıralı olarak bulur.
+    Sonuç yalnızca mesafe matrisine bağlıdır; aynı matris üzerindeki farklı çalıştırmalarda
+    AntColonyOptimizer'a candidates parametresiyle tekrar verilebilir.
+    distances: Şehirler arası mesafeleri içeren matris ya da DistanceProvider.
+    k: Her şehir için aday (komşu) sayısı.
+    block_size: Bellek kullanımını sınırlamak için aynı anda işlenen satır sayısı.
+    Dönüş: (n, k) boyutlu şehir indisleri matrisi.
+    """
+    n = len(distances)
+    k = min(k, n - 1)
+    candidates = np.empty((n, k), dtype=np.intp)
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        rows = np.arange(start, stop)
+        block = np.array(distances[start:stop], dtype=float)
+        block[rows - start, rows] = np.inf  # Şehir kendi komşusu sayılmaz.
+        nearest = np.argpartition(block, k - 1, axis=1)[:, :k]
+        order = np.argsort(np.take_along_axis(block, nearest, axis=1), axis=1, kind='stable')
+        candidates[start:stop] = np.take_along_axis(nearest, order, axis=1)
+    return candidates
+
+
+def heuristic_values(distances, beta):
+    """Heuristik bilgi (1/d)^beta; sıfır mesafeli kenarlar (köşegen) seçilemez olarak işaretlenir."""
+    with np.errstate(divide='ignore'):
+        heuristic = 1.0 / np.asarray(distances, dtype=float)
+    heuristic[~np.isfinite(heuristic)] = 0
+    return heuristic ** beta
+
+
+def improve_tour(tour, distances, neighbours, moves=('2opt', 'oropt'), max_segment=3):
+    """
+    Turu 2-opt ve Or-opt hamleleriyle yerel olarak iyileştirir.
+    Her hamlenin maliyet farkı yalnızca değişen kenarlardan O(1) zamanda hesaplanır; aday hamleler
+    komşu listeleriyle sınırlandırılır ve iyileşme bulunamayan şehirler "don't-look" bitleriyle atlanır.
+    tour: Başlangıç şehrine dönüşü içermeyen (n,) boyutlu şehir sırası.
+    distances: Mesafe matrisi ya da DistanceProvider.
+    neighbours: (n, k) boyutlu, yakından uzağa sıralı komşu listesi (build_candidate_list).
+    moves: Uygulanacak hamleler ('2opt' ve/veya 'oropt').
+    max_segment: Or-opt ile yeri değiştirilecek en uzun parça.
+    Dönüş: İyileştirilmiş tur (liste) ve toplam maliyet değişimi.
+    """
+    tour = np.asarray(tour).tolist()  # Python tamsayıları: numpy skalerlerinden hızlı ve taşmasız
+    n = len(tour)
+    if n < 5:
+        return tour, 0.0
+    if isinstance(neighbours, np.ndarray):
+        neighbours = neighbours.tolist()
+    pos = [0] * n
+    for i, city in enumerate(tour):
+        pos[city] = i
+    eps = 1e-10
+
+    def reverse(i, j):
+        # i'den j'ye (ileri yönde) uzanan parçayı ters çevirir; parça sondan başa taşıyorsa
+        # aynı turu veren tümleyen parça ters çevrilir.
+        if i > j:
+            i, j = j + 1, i - 1
+        tour[i:j + 1] = tour[i:j + 1][::-1]
+        for k in range(i, j + 1):
+            pos[tour[k]] = k
+
+    def move_segment(i, length, c, after, flip):
+        # tour[i:i+length] parçasını c şehrinin hemen sonrasına (after) ya da öncesine taşır.
+        segment = tour[i:i + length]
+        del tour[i:i + length]
+        if flip:
+            segment.reverse()
+        target = pos[c] - length if pos[c] > i else pos[c]
+        target += 1 if after else 0
+        tour[target:target] = segment
+        for k in range(min(i, target), max(i, target) + length):
+            pos[tour[k]] = k
+
+    def two_opt(a):
+        i = pos[a]
+        for step in (1, -1):
+            b = tour[(i + step) % n]
+            d_ab = distances[a, b]
+            for c in neighbours[a]:
+                d_ac = distances[a, c]
+                if d_ac >= d_ab:
+                    break
+                d = tour[(pos[c] + step) % n]
+                if c == b or d == a:
+                    continue
+                delta = d_ac + distances[b, d] - d_ab - distances[c, d]
+                if delta < -eps:
+                    # a-b ve c-d kenarları a-c ve b-d ile değiştirilir.
+                    if step == 1:
+                        reverse(pos[b], pos[c])
+                    else:
+                        reverse(pos[c], pos[b])
+                    return delta, (a, b, c, d)
+        return None
+
+    def or_opt(a):
+        i = pos[a]
+        for length in range(1, max_segment + 1):
+            if i + length > n or n < length + 3:
+                break
+            s_first, s_last = a, tour[i + length - 1]
+            prev, nxt = tour[i - 1], tour[(i + length) % n]
+            removal = distances[prev, s_first] + distances[s_last, nxt] - distances[prev, nxt]
+            if removal <= eps:
+                continue
+            for c in neighbours[s_first]:
+                d_c = distances[s_first, c]
+                if d_c >= removal:
+                    break
+                if i <= pos[c] < i + length:
+                    continue
+                # c, s_first..s_last, c'nin ardılı
+                e = tour[(pos[c] + 1) % n]
+                if c != prev:
+                    delta = d_c + distances[s_last, e] - distances[c, e] - removal
+                    if delta < -eps:
+                        move_segment(i, length, c, after=True, flip=False)
+                        return delta, (prev, nxt, s_first, s_last, c, e)
+                # c'nin öncülü, s_last..s_first, c
+                e = tour[pos[c] - 1]
+                if c != nxt:
+                    delta = d_c + distances[s_last, e] - distances[e, c] - removal
+                    if delta < -eps:
+                        move_segment(i, length, c, after=False, flip=True)
+                        return delta, (prev, nxt, s_first, s_last, c, e)
+        return None
+
+    searches = [search for name, search in (('2opt', two_opt), ('oropt', or_opt)) if name in moves]
+    total = 0.0
+    queue = tour[::-1]
+    queued = [True] * n  # False: şehrin don't-look biti açık
+    while queue:
+        a = queue.pop()
+        queued[a] = False
+        for search in searches:
+            result = search(a)
+            if result is not None:
+                delta, touched = result
+                total += delta
+                for city in touched:
+                    if not queued[city]:
+                        queued[city] = True
+                        queue.append(city)
+                break
+    return tour, total
+
+
+class AntColonyOptimizer(AskTell, Checkpointable):
+    def __init__(self, distances, n_ants, n_best, n_iterations, decay, alpha=1, beta=1,
+                 n_candidates=None, candidates=None, sparse_pheromone=None, local_search=(), n_local_search=1,
+                 symmetric=False, tau_min=None, tau_max=None, pheromone=None, heuristic=None, neighbours=None,
+                 profiler=None, rng=None, dtype=None, index_dtype=None):
+        """
+        AntColonyOptimizer sınıfının başlatıcısı.
+        distances: Şehirler arası mesafeleri içeren matris ya da DistanceProvider (ör. EuclideanDistances).
+        n_ants: Kolonideki karınca sayısı.
+        n_best: Her iterasyonda en iyi çözümleri seçmek için kullanılacak karınca sayısı.
+        n_iterations: Algoritmanın toplam iterasyon sayısı (None: durma run'a verilen termination'a bırakılır).
+        decay: Feromonun buharlaşma oranı.
+        alpha: Feromon bilgisinin önem derecesi.
+        beta: Uzaklık bilgisinin (heuristik bilgi) önem derecesi.
+        n_candidates: Verilirse karıncalar her adımda yalnızca en yakın n_candidates şehir arasından seçim yapar.
+        candidates: build_candidate_list ile önceden hesaplanmış (n, k) aday listesi (n_candidates yerine).
+        sparse_pheromone: Feromonun yalnızca aday kenarlarda saklanması (DistanceProvider için varsayılan).
+        local_search: Her iterasyonda en iyi turlara uygulanacak yerel arama hamleleri, ör. ('2opt', 'oropt').
+        n_local_search: Yerel aramanın uygulanacağı en iyi karınca sayısı.
+        symmetric: Simetrik problemlerde feromon (i, j) ile birlikte (j, i) kenarına da bırakılır.
+        tau_min, tau_max: MMAS tarzı feromon alt ve üst sınırları (None: sınır yok).
+        pheromone: Başlangıç feromon matrisi; verilirse kopyalanmadan yerinde güncellenir (ör. paylaşılan bellek).
+        heuristic: Önceden hesaplanmış heuristik bilgi (1/d)^beta; aday listesi varsa (n, k), yoksa (n, n) boyutlu.
+                   Aynı mesafeler üzerinde tekrar tekrar kurulan optimizasyoncular (ör. paralel koloni dönemleri)
+                   için; verilmezse mesafelerden hesaplanır.
+        neighbours: Yerel arama için önceden hesaplanmış (n, k) komşu listesi (None: aday listesi ya da en yakın
+                    10 şehir).
+        profiler: Aşama süreleri için izleme.Profiler (None: izleme kapalı).
+        rng: Tohum, numpy.random.Generator ya da rastgele.BufferedRandom (adım başına küçük çekilişler yapıldığından
+             BufferedRandom çağrı maliyetini azaltır).
+        dtype: Feromon, heuristik ve çekicilik matrislerinin tipi (ör. np.float32; varsayılan float64).
+        index_dtype: Turların ve aday listesinin şehir indisi tipi (None: np.intp). hassasiyet.index_dtype(n)
+                     şehir sayısına yeten en küçük tipi (ör. 10k şehir için int16) verir.
+        """
+        self.profiler = profiler or NULL_PROFILER
+        self.rng = make_rng(rng)
+        self.dtype = float_dtype(dtype)
+        self.index_dtype = np.dtype(np.intp if index_dtype is None else index_dtype)
+        self.distances = distances
+        self.n_cities = len(distances)
+        self.n_ants = n_ants
+        self.n_best = n_best
+        self.n_iterations = n_iterations
+        self.decay = decay
+        self.alpha = alpha
+        self.beta = beta
+        if candidates is None and n_candidates is not None:
+            candidates = build_candidate_list(distances, n_candidates)
+        self.candidates = None if candidates is None else np.asarray(candidates, dtype=self.index_dtype)
+        if sparse_pheromone is None:
+            sparse_pheromone = isinstance(distances, DistanceProvider)
+        if pheromone is not None:
+            self.pheromone = pheromone
+        elif sparse_pheromone:
+            if self.candidates is None:
+                raise ValueError("Seyrek feromon deposu için n_candidates ya da candidates verilmelidir.")
+            self.pheromone = SparsePheromone(self.candidates, 1.0 / self.n_cities, self.dtype)
+        else:
+            self.pheromone = np.ones(self.distances.shape, dtype=self.dtype) / self.n_cities
+        # Heuristik bilgi (1/d)^beta mesafeler değişmediği için yalnızca bir kez hesaplanır.
+        # Aday listesi kullanılıyorsa yalnızca aday kenarlar için (n x k) saklanır.
+        if heuristic is None:
+            if self.candidates is None:
+                heuristic = self.heuristic_values(self.distances)
+            else:
+                rows = np.arange(self.n_cities)[:, None]
+                heuristic = self.heuristic_values(self.distances[rows, self.candidates])
+        heuristic = np.asarray(heuristic).astype(self.dtype, copy=False)
+        if self.candidates is None:
+            self.heuristic = heuristic
+        else:
+            self.candidate_heuristic = heuristic
+        self.attractiveness = None
+        self.candidate_attractiveness = None
+        self.symmetric = symmetric
+        self.tau_min = tau_min
+        self.tau_max = tau_max
+        self.local_search = tuple(local_search)
+        self.n_local_search = n_local_search
+        if self.local_search:
+            # Yerel arama komşu listeleri; aday listesi varsa o kullanılır.
+            if neighbours is None:
+                neighbours = self.candidates if self.candidates is not None else build_candidate_list(distances, 10)
+            self.neighbour_lists = np.asarray(neighbours).tolist()
+        # Çalışmalar arasında (ve kontrol noktasından sürdürülürken) korunan arama durumu
+        self.iteration = 0
+        self.shortest_path = None
+        self.best_cost = float('inf')
+
+    def heuristic_values(self, distances):
+        return heuristic_values(distances, self.beta)
+
+    def run(self, callback=None, termination=None, checkpoint=None):
+        """
+        Kalan iterasyonları (n_iterations'a kadar) çalıştırır ve (en kısa yol, maliyeti) döndürür.
+        callback: Her iterasyondan sonra callback(iterasyon, en kısa yol, maliyeti) çağrılır.
+        termination: Erken durdurma için sonlandirma.Termination; değerlendirme sayısı oluşturulan tur sayısıdır
+                     (n_iterations None ise zorunludur).
+        checkpoint: Her iterasyon sonunda durumu kaydeden kontrol_noktasi.Checkpointer.
+        """
+        remaining = None if self.n_iterations is None else self.n_iterations - self.iteration
+        for i in iteration_range(remaining, termination):
+            self.step()
+            # ACO'da değerlendirme sayısı oluşturulan tur sayısıdır.
+            tours = self.iteration * self.n_ants
+            self.profiler.iteration(self.iteration, best=float(self.best_cost), evaluations=tours)
+            if callback is not None:
+                callback(self.iteration, self.shortest_path, self.best_cost)
+            if checkpoint is not None:
+                checkpoint.update(self)
+            if termination is not None and termination.should_stop(i + 1, self.best_cost, tours):
+                break
+        return self.shortest_path, self.best_cost
+
+    def get_state(self):
+        # Feromon (seyrek depoda yalnızca aday kenar değerleri), en iyi tur ve üreteç durumu kaydedilir.
+        sparse = isinstance(self.pheromone, SparsePheromone)
+        arrays = {'pheromone': self.pheromone.values if sparse else self.pheromone}
+        values = {'iteration': self.iteration, 'best_cost': self.best_cost, 'rng': get_rng_state(self.rng)}
+        if self.shortest_path is not None:
+            arrays['shortest_path'] = self.shortest_path
+        if sparse:
+            values['pheromone_base'] = self.pheromone.base
+        return arrays, values
+
+    def set_state(self, arrays, values):
+        if isinstance(self.pheromone, SparsePheromone):
+            self.pheromone.values[...] = arrays['pheromone']
+            self.pheromone.base = values['pheromone_base']
+        else:
+            self.pheromone[...] = arrays['pheromone']  # Paylaşılan ya da eşlemeli feromon dizisi korunur
+        self.shortest_path = np.array(arrays['shortest_path']) if 'shortest_path' in arrays else None
+        self.best_cost = values['best_cost']
+        self.iteration = values['iteration']
+        set_rng_state(self.rng, values['rng'])
+
+    def _evaluate(self, paths):
+        return self.path_cost(paths)
+
+    def _iterate(self):
+        # Bir iterasyon: turlar ask ile verilir, maliyetleri tell ile alınır (ör. zamana bağlı ya da kısıtlı
+        # maliyetler dışarıda hesaplanabilir); ardından yerel arama, feromon güncellemesi ve en iyi tur güncellenir.
+        paths = self.construct_paths()
+        costs = yield paths
+        self.improve_paths(paths, costs)
+        all_paths = (paths, costs)
+        self.spread_pheromone(all_paths, self.n_best, shortest_path=self.shortest_path)
+        new_shortest_path, new_best_cost = self.find_shortest_path(all_paths, self.best_cost)
+        if new_best_cost < self.best_cost:  # Yeni bir en iyi maliyet bulunduysa güncelle
+            self.best_cost = new_best_cost
+            self.shortest_path = new_shortest_path
+        self.iteration += 1
+
+    def generate_all_paths(self):
+        """
+        Tüm karıncaların turlarını birlikte oluşturur, maliyetlerini hesaplar ve yerel aramayla iyileştirir.
+        Dönüş: (n_ants, n+1) boyutlu yol matrisi ve (n_ants,) boyutlu maliyet vektörü.
+        """
+        paths = self.construct_paths()
+        costs = self.path_cost(paths)
+        self.improve_paths(paths, costs)
+        return paths, costs
+
+    def construct_paths(self):
+        # Tüm karıncaların turları birlikte oluşturulur: (n_ants, n+1) boyutlu yol matrisi.
+        with self.profiler.phase('construct'):
+            with self.profiler.phase('attractiveness'):
+                self.update_attractiveness()
+            return self.generate_paths(0)  # Başlangıç şehri olarak 0'ı varsayalım.
+
+    def improve_paths(self, paths, costs):
+        # En iyi n_local_search karıncanın turu yerel aramayla yerinde iyileştirilir.
+        if not self.local_search:
+            return
+        with self.profiler.phase('local_search'):
+            k = min(self.n_local_search, len(costs))
+            for ant in np.argpartition(costs, k - 1)[:k]:
+                tour, delta = improve_tour(paths[ant, :-1], self.distances, self.neighbour_lists,
+                                           self.local_search)
+                start = tour.index(paths[ant, 0])
+                paths[ant, :-1] = tour[start:] + tour[:start]
+                costs[ant] += delta
+
+    def update_attractiveness(self):
+        # pheromone^alpha * (1/d)^beta matrisi her iterasyonda bir kez yenilenir.
+        if self.candidates is None:
+            self.attractiveness = self.pheromone ** self.alpha * self.heuristic
+        else:
+            self.candidate_attractiveness = self.candidate_pheromone() ** self.alpha * self.candidate_heuristic
+
+    def candidate_pheromone(self):
+        # Aday kenarlardaki (n x k) feromon değerleri; seyrek depoda doğrudan saklanan dizidir.
+        if isinstance(self.pheromone, SparsePheromone):
+            return self.pheromone.values
+        rows = np.arange(self.n_cities)[:, None]
+        return self.pheromone[rows, self.candidates]
+
+    def generate_paths(self, start):
+        ants = np.arange(self.n_ants)
+        paths = np.empty((self.n_ants, self.n_cities + 1), dtype=self.index_dtype)
+        paths[:, 0] = start
+        paths[:, -1] = start  # Başlangıç noktasına dönüş eklenir.
+        visited = np.zeros((self.n_ants, self.n_cities), dtype=bool)  # (karınca x şehir) ziyaret maskesi
+        visited[:, start] = True
+        for step in range(1, self.n_cities):
+            moves = self.select_next_cities(paths[:, step - 1], visited)
+            paths[:, step] = moves
+            visited[ants, moves] = True
+        return paths
+
+    def path_cost(self, path):
+        # Tek bir yol (n+1,) ya da yol matrisi (n_ants, n+1) için maliyet döndürür.
+        path = np.asarray(path)
+        return self.distances[path[..., :-1], path[..., 1:]].sum(axis=-1)
+
+    def spread_pheromone(self, all_paths, n_best, shortest_path):
+        paths, costs = all_paths
+        # En iyi n_best yol tam sıralama yapılmadan seçilir.
+        if n_best < len(costs):
+            paths = paths[np.argpartition(costs, n_best - 1)[:n_best]]
+        else:
+            paths = paths[:n_best]
+        with self.profiler.phase('deposit'):
+            self.deposit(paths)
+        with self.profiler.phase('evaporate'):
+            self.pheromone *= self.decay  # Feromon buharlaşması (yerinde)
+            if self.tau_min is not None or self.tau_max is not None:
+                if isinstance(self.pheromone, SparsePheromone):
+                    self.pheromone.clip(self.tau_min, self.tau_max)
+                else:
+                    np.clip(self.pheromone, self.tau_min, self.tau_max, out=self.pheromone)
+
+    def deposit(self, paths):
+        # Verilen (m, n+1) yolların kenarlarına 1/d kadar feromon bırakır.
+        starts, ends = paths[:, :-1].ravel(), paths[:, 1:].ravel()
+        deposits = 1.0 / self.distances[starts, ends]
+        if self.symmetric:
+            starts, ends = np.concatenate([starts, ends]), np.concatenate([ends, starts])
+            deposits = np.concatenate([deposits, deposits])
+        # Seçilen turların tüm kenarlarına tek bir dağıtarak-toplama (scatter-add) işlemi.
+        if isinstance(self.pheromone, SparsePheromone):
+            self.pheromone.add_at(starts, ends, deposits)
+        else:
+            np.add.at(self.pheromone, (starts, ends), deposits)
+
+    def select_next_cities(self, current, visited):
+        """
+        Her karınca için bir sonraki şehri aynı anda seçer.
+        current: (n_ants,) boyutlu, karıncaların bulunduğu şehirler.
+        visited: (n_ants, n) boyutlu ziyaret maskesi.
+        """
+        if self.candidates is None:
+            return self.sample_cities(self.attractiveness[current], visited)
+        # Yalnızca ziyaret edilmemiş adaylar arasından seçim yapılır: adım maliyeti O(n) yerine O(k).
+        rows = np.arange(len(current))
+        candidates = self.candidates[current]
+        blocked = visited[rows[:, None], candidates]
+        moves = candidates[rows, self.sample_cities(self.candidate_attractiveness[current], blocked)]
+        exhausted = np.flatnonzero(blocked.all(axis=1))
+        if len(exhausted):
+            self.profiler.count('candidate_fallbacks', len(exhausted))
+            # Tüm adaylar ziyaret edildiyse tüm şehir kümesine geri dönülür.
+            origins = current[exhausted]
+            weights = self.pheromone[origins] ** self.alpha * self.heuristic_values(self.distances[origins])
+            moves[exhausted] = self.sample_cities(weights, visited[exhausted])
+        return moves
+
+    def sample_cities(self, weights, blocked):
+        """
+        Her satırdan, engellenmemiş sütunlar arasından ağırlıklarla orantılı bir indis seçer.
+        weights: (m, c) boyutlu çekicilik değerleri (yerinde değiştirilir).
+        blocked: (m, c) boyutlu, seçilemeyecek sütunların maskesi.
+        """
+        weights[blocked] = 0
+        cumulative = np.cumsum(weights, axis=1)
+        # Feromon sıfıra yaklaştığında engellenmemiş sütunlar arasından eşit olasılıkla seçilir.
+        stuck = cumulative[:, -1] <= 0
+        if stuck.any():
+            cumulative[stuck] = np.cumsum(~blocked[stuck], axis=1)
+        # Kümülatif toplam üzerinden örnekleme: eşiği ilk aşan sütun seçilir.
+        thresholds = self.rng.random(len(weights)) * cumulative[:, -1]
+        return np.argmax(cumulative > thresholds[:, None], axis=1)
+
+    def find_shortest_path(self, all_paths, best_cost):
+        paths, costs = all_paths
+        best = np.argmin(costs)
+        if costs[best] < best_cost:
+            return paths[best], costs[best]  # Yeni en iyi yol ve maliyeti döndür
+        else:
+            return paths[best], best_cost  # Mevcut en iyi yolu koru (None döndürme)
+
+
+def _colony_epoch(task):
+    # İşçi süreç: bir koloniyi paylaşılan bellekteki matrisler üzerinde bir dönem boyunca çalıştırır.
+    # Heuristik, aday ve komşu listeleri de paylaşılan bellekten bağlanır; her dönemde yeniden hesaplanmaz.
+    (distance_spec, pheromone_spec, shared_specs, colony, seed, epoch, n_iterations, immigrant, options) = task
+    handles = []
+    try:
+        distances = _attach_array(distance_spec, handles)
+        pheromones = _attach_array(pheromone_spec, handles)
+        shared = {name: _attach_array(spec, handles) for name, spec in shared_specs.items()}
+        # Üreteç yalnızca (seed, koloni, dönem) üçlüsüne bağlıdır; sonuç iş dağılımından bağımsızdır.
+        rng = np.random.SeedSequence([seed, colony, epoch])
+        aco = AntColonyOptimizer(distances, n_iterations=n_iterations, pheromone=pheromones[colony], rng=rng,
+                                 **shared, **options)
+        if immigrant is not None:
+            aco.deposit(immigrant[None, :])  # Komşu koloniden gelen en iyi tur
+        path, cost = aco.run()
+        del distances, pheromones, shared, aco
+    finally:
+        for shm in handles:
+            shm.close()
+    return path, cost
+
+
+def _shared_array(array):
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _attach_array(spec, handles):
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name=spec[0])
+    handles.append(shm)
+    return np.ndarray(spec[1], dtype=spec[2], buffer=shm.buf)
+
+
+def run_parallel_colonies(distances, n_colonies, n_iterations, exchange_interval=10, seed=0,
+                          max_workers=None, **options):
+    """
+    Birden fazla bağımsız koloniyi ProcessPoolExecutor ile ayrı süreçlerde ada modeliyle çalıştırır.
+    Mesafe ve feromon matrisleri ile bir kez hesaplanan heuristik, aday ve komşu listeleri
+    multiprocessing.shared_memory üzerinden paylaşılır, işçilere pickle edilmez.
+    Her exchange_interval iterasyonda koloniler halka düzeninde en iyi turlarını bir sonraki koloniye gönderir.
+    distances: Şehirler arası mesafeleri içeren (yoğun) matris.
+    n_colonies: Koloni (ada) sayısı.
+    n_iterations: Her koloninin toplam iterasyon sayısı.
+    exchange_interval: En iyi tur değişimleri arasındaki iterasyon sayısı.
+    seed: Koloni ve dönem başına belirlenimci tohumların türetildiği ana tohum.
+    max_workers: Süreç sayısı (varsayılan: min(n_colonies, işlemci sayısı)).
+    options: AntColonyOptimizer'a aktarılan diğer parametreler (n_ants, n_best, decay, alpha, beta, ...).
+    Dönüş: En iyi yol, maliyeti ve kolonilerin en iyi maliyetleri.
+    """
+    # Süreç havuzu yalnızca paralel çalıştırmada gerekir; modül içe aktarılırken yüklenmez.
+    from concurrent.futures import ProcessPoolExecutor
+    distances = np.ascontiguousarray(distances)
+    n = len(distances)
+    dtype = float_dtype(options.get('dtype'))
+    # Mesafelerden türetilen diziler (aday listesi, heuristik, yerel arama komşuları) bir kez hesaplanır ve
+    # paylaşılan belleğe konur; işçiler her dönemde bunlara bağlanır.
+    candidates = options.pop('candidates', None)
+    n_candidates = options.pop('n_candidates', None)
+    if candidates is None and n_candidates is not None:
+        candidates = build_candidate_list(distances, n_candidates)
+    derived = {}
+    if candidates is None:
+        derived['heuristic'] = heuristic_values(distances, options.get('beta', 1)).astype(dtype, copy=False)
+    else:
+        candidates = np.asarray(candidates, dtype=options.get('index_dtype') or np.intp)
+        derived['candidates'] = candidates
+        derived['heuristic'] = heuristic_values(distances[np.arange(n)[:, None], candidates],
+                                                options.get('beta', 1)).astype(dtype, copy=False)
+    if options.get('local_search') and options.get('neighbours') is None and candidates is None:
+        derived['neighbours'] = build_candidate_list(distances, 10)
+    shared = {name: _shared_array(array) for name, array in derived.items()}
+    shared_specs = {name: spec for name, (_, spec) in shared.items()}
+    distance_shm, distance_spec = _shared_array(distances)
+    pheromone_shm, pheromone_spec = _shared_array(np.full((n_colonies, n, n), 1.0 / n, dtype=dtype))
+    best_paths = [None] * n_colonies
+    best_costs = np.full(n_colonies, np.inf)
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers or n_colonies) as pool:
+            done, epoch = 0, 0
+            while done < n_iterations:
+                length = min(exchange_interval, n_iterations - done)
+                tasks = [(distance_spec, pheromone_spec, shared_specs, colony, seed, epoch, length,
+                          best_paths[colony - 1], options) for colony in range(n_colonies)]
+                for colony, (path, cost) in enumerate(pool.map(_colony_epoch, tasks)):
+                    if cost < best_costs[colony]:
+                        best_paths[colony], best_costs[colony] = path, cost
+                done += length
+                epoch += 1
+    finally:
+        distance_shm.close()
+        distance_shm.unlink()
+        pheromone_shm.close()
+        pheromone_shm.unlink()
+        for shm, _ in shared.values():
+            shm.close()
+            shm.unlink()
+    best = int(np.argmin(best_costs))
+    return best_paths[best], best_costs[best], best_costs
+
+
+def parallel_speedup(distances, n_colonies, n_iterations, seed=0, **options):
+    """
+    run_parallel_colonies'i tek süreçli AntColonyOptimizer.run ile karşılaştırır.
+    Paralel çalıştırma n_colonies kat iş yaptığından hızlanma, aynı işin tek süreçte
+    alacağı tahmini süreye (n_colonies * tek çalıştırma süresi) göre hesaplanır.
+    Dönüş: Süreler, maliyetler ve hızlanmayı içeren sözlük.
+    """
+    start = time.perf_counter()
+    _, serial_cost = AntColonyOptimizer(distances, n_iterations=n_iterations, rng=seed, **options).run()
+    serial_time = time.perf_counter() - start
+    start = time.perf_counter()
+    _, parallel_cost, _ = run_parallel_colonies(distances, n_colonies, n_iterations, seed=seed, **options)
+    parallel_time = time.perf_counter() - start
+    return {
+        'serial_time': serial_time,
+        'serial_cost': serial_cost,
+        'parallel_time': parallel_time,
+        'parallel_cost': parallel_cost,
+        'speedup': n_colonies * serial_time / parallel_time,
+    }
+
+
+class BatchAntColonySolver:
+    def __init__(self, n_ants=10, n_best=3, n_iterations=100, decay=0.9, alpha=1, beta=2, local_search=(),
+                 symmetric=False, profiler=None, rng=None, dtype=None, index_dtype=None):
+        """
+        Çok sayıda küçük TSP örneğini (ör. 10-60 durak) birlikte çözen toplu ACO. Örnek başına nesne kurulumu
+        ve adım başına Python yükü tüm örnekler arasında paylaşılır: mesafe, heuristik ve feromon
+        (örnek x n x n), yollar (örnek x karınca x n+1) ve ziyaret maskesi (örnek x karınca x n) dizilerde tutulur
+        ve her adım tüm örnekler için tek bir vektörleştirilmiş işlemle ilerler.
+        Farklı boyutlu örnekler en büyük örneğin boyutuna doldurulur (padding); doldurma şehirleri başlangıçta
+        ziyaret edilmiş sayılır. Örnekler boyuta göre sıralanır ve her adımda yalnızca turu bitmemiş örnekler
+        işlenir.
+        n_ants, n_best, n_iterations, decay, alpha, beta, symmetric: AntColonyOptimizer ile aynıdır
+        (tüm örneklerde ortak).
+        local_search: Her iterasyonda her örneğin en iyi turuna uygulanacak yerel arama hamleleri, ör. ('2opt',).
+        profiler: Aşama süreleri için izleme.Profiler (None: izleme kapalı).
+        rng: Tohum, numpy.random.Generator ya da rastgele.BufferedRandom.
+        dtype: Mesafe, heuristik ve feromon dizilerinin tipi (ör. np.float32; varsayılan float64).
+        index_dtype: Yol dizilerinin şehir indisi tipi (None: np.intp; ör. 60 duraklık örnekler için np.int16).
+        """
+        self.n_ants = n_ants
+        self.n_best = min(n_best, n_ants)
+        self.n_iterations = n_iterations
+        self.decay = decay
+        self.alpha = alpha
+        self.beta = beta
+        self.local_search = tuple(local_search)
+        self.symmetric = symmetric
+        self.profiler = profiler or NULL_PROFILER
+        self.rng = make_rng(rng)
+        self.dtype = float_dtype(dtype)
+        self.index_dtype = np.dtype(np.intp if index_dtype is None else index_dtype)
+
+    @staticmethod
+    def pad(distances):
+        """
+        Farklı boyutlu mesafe matrislerini (örnek, N, N) boyutlu tek bir diziye doldurur (N: en büyük boyut).
+        Dönüş: Doldurulmuş dizi ve (örnek,) boyutlu gerçek boyutlar.
+        """
+        sizes = np.array([len(matrix) for matrix in distances], dtype=np.intp)
+        padded = np.zeros((len(distances), sizes.max(initial=1), sizes.max(initial=1)))
+        for matrix, size, out in zip(distances, sizes, padded):
+            out[:size, :size] = matrix
+        return padded, sizes
+
+    def solve(self, distances, sizes=None, callback=None):
+        """
+        Tüm örnekleri birlikte çözer.
+        distances: (örnek, N, N) boyutlu doldurulmuş dizi ya da farklı boyutlu matrislerin listesi.
+        sizes: Doldurulmuş dizide örneklerin gerçek boyutları (None: hepsi N).
+        callback: Her iterasyondan sonra callback(iterasyon, en iyi maliyetler) çağrılır.
+        Dönüş: Örnek başına en iyi tur (başlangıç şehri 0'a dönüş dahil, (n+1,) boyutlu) listesi ve
+               (örnek,) boyutlu en iyi maliyetler.
+        """
+        if isinstance(distances, np.ndarray) and distances.ndim == 3:
+            padded = np.asarray(distances, dtype=self.dtype)
+            sizes = np.full(len(padded), padded.shape[1], dtype=np.intp) if sizes is None else np.asarray(sizes)
+        else:
+            padded, sizes = self.pad(distances)
+            padded = padded.astype(self.dtype, copy=False)
+        m = len(padded)
+        if m == 0:
+            return [], np.empty(0)
+        # Büyükten küçüğe sıralanan örneklerde, turu bitmemiş örnekler her adımda dizilerin başında kalır.
+        order = np.argsort(-sizes, kind='stable')
+        padded, sizes = padded[order], sizes[order]
+        n = padded.shape[1]
+        instances = np.arange(m)
+        valid = np.arange(n) < sizes[:, None]  # (örnek, N): gerçek şehirler
+        edge_mask = (np.arange(n) < sizes[:, None])[:, None, :]  # Tur kenarları: konum k -> k+1, k < n_i
+        with np.errstate(divide='ignore'):
+            heuristic = 1.0 / padded
+        heuristic[~np.isfinite(heuristic)] = 0
+        heuristic *= valid[:, :, None] & valid[:, None, :]
+        heuristic **= self.beta
+        pheromone = np.broadcast_to((1.0 / np.maximum(sizes, 1))[:, None, None], padded.shape).astype(self.dtype)
+        active_counts = (sizes[None, :] > np.arange(n)[:, None]).sum(axis=1)  # Adım başına bitmemiş örnek sayısı
+        neighbours = [None] * m
+        best_paths = np.zeros((m, n + 1), dtype=self.index_dtype)
+        best_costs = np.full(m, np.inf)
+        profiler = self.profiler
+
+        for iteration in range(self.n_iterations):
+            with profiler.phase('construct'):
+                with profiler.phase('attractiveness'):
+                    attractiveness = pheromone ** self.alpha * heuristic
+                paths = self._construct(attractiveness, valid, active_counts)
+                # Doldurma konumları 0 -> 0 kenarlarıdır ve maskelenir.
+                costs = (padded[instances[:, None, None], paths[..., :-1], paths[..., 1:]] * edge_mask).sum(axis=2)
+            if self.local_search:
+                with profiler.phase('local_search'):
+                    self._improve(padded, sizes, paths, costs, neighbours)
+            with profiler.phase('deposit'):
+                self._deposit(pheromone, padded, paths, costs, edge_mask)
+            with profiler.phase('evaporate'):
+                pheromone *= self.decay
+            iteration_best = np.argmin(costs, axis=1)
+            iteration_costs = costs[instances, iteration_best]
+            improved = iteration_costs < best_costs
+            best_paths[improved] = paths[improved, iteration_best[improved]]
+            best_costs[improved] = iteration_costs[improved]
+            profiler.iteration(iteration + 1, best=float(best_costs.mean()), evaluations=(iteration + 1) * m * self.n_ants)
+            if callback is not None:
+                callback(iteration + 1, best_costs[np.argsort(order)])
+
+        tours = [None] * m
+        for position, instance in enumerate(order):
+            size = sizes[position]
+            tours[instance] = np.append(best_paths[position, :size], best_paths[position, 0])
+        costs = np.empty(m)
+        costs[order] = best_costs
+        return tours, costs
+
+    def _construct(self, attractiveness, valid, active_counts):
+        # Tüm örneklerin tüm karıncaları için turlar; t. adımda yalnızca ilk active_counts[t] örnek ilerler.
+        m, n = valid.shape
+        paths = np.zeros((m, self.n_ants, n + 1), dtype=self.index_dtype)  # Başlangıç şehri 0; bitmiş turlar 0'da kalır
+        # Ziyaret maskesi 1/0 değerli tutulur: ağırlıklar maske ile çarpılır (boolean atamadan belirgin hızlıdır).
+        unvisited = np.broadcast_to(valid[:, None, :], (m, self.n_ants, n)).astype(self.dtype)
+        unvisited[:, :, 0] = 0
+        ants = np.arange(self.n_ants)
+        for step in range(1, n):
+            k = active_counts[step]
+            if k == 0:
+                break
+            rows = np.arange(k)[:, None]
+            weights = attractiveness[rows, paths[:k, :, step - 1]]  # (k, karınca, N)
+            weights *= unvisited[:k]
+            cumulative = np.cumsum(weights, axis=2)
+            # Feromon sıfıra yaklaştığında ziyaret edilmemiş şehirler arasından eşit olasılıkla seçilir.
+            stuck = cumulative[..., -1] <= 0
+            if stuck.any():
+                cumulative[stuck] = np.cumsum(unvisited[:k][stuck], axis=1)
+            thresholds = self.rng.random((k, self.n_ants)) * cumulative[..., -1]
+            moves = np.argmax(cumulative > thresholds[..., None], axis=2)
+            paths[:k, :, step] = moves
+            unvisited[rows, ants, moves] = 0
+        return paths
+
+    def _improve(self, padded, sizes, paths, costs, neighbours):
+        # Her örneğin iterasyondaki en iyi turu yerel aramayla yerinde iyileştirilir.
+        for instance, ant in enumerate(np.argmin(costs, axis=1)):
+            size = sizes[instance]
+            if size < 5:
+                continue
+            distances = padded[instance, :size, :size]
+            if neighbours[instance] is None:
+                neighbours[instance] = build_candidate_list(distances, 10).tolist()
+            tour, delta = improve_tour(paths[instance, ant, :size], distances, neighbours[instance],
+                                       self.local_search)
+            start = tour.index(0)
+            paths[instance, ant, :size] = tour[start:] + tour[:start]
+            costs[instance, ant] += delta
+
+    def _deposit(self, pheromone, padded, paths, costs, edge_mask):
+        # Her örneğin en iyi n_best turunun kenarlarına 1/d kadar feromon; doldurma kenarlarına bırakılmaz.
+        m = len(paths)
+        if self.n_best < self.n_ants:
+            best = np.argpartition(costs, self.n_best - 1, axis=1)[:, :self.n_best]
+        else:
+            best = np.broadcast_to(np.arange(self.n_ants), (m, self.n_ants))
+        instances = np.arange(m)[:, None, None]
+        best_paths = paths[instances[..., 0], best]  # (örnek, n_best, N+1)
+        starts, ends = best_paths[..., :-1], best_paths[..., 1:]
+        lengths = padded[instances, starts, ends]
+        deposits = np.divide(1.0, lengths, out=np.zeros(lengths.shape, dtype=self.dtype), where=edge_mask & (lengths > 0))
+        instances = np.broadcast_to(instances, starts.shape)
+        np.add.at(pheromone, (instances, starts, ends), deposits)
+        if self.symmetric:
+            np.add.at(pheromone, (instances, ends, starts), deposits)
+
+
+def instance_distances(record):
+    """Bir TSP örneği kaydının ({"distances": ...} ya da {"coordinates": ...}) mesafe matrisi."""
+    if record.get('distances') is not None:
+        return np.asarray(record['distances'], dtype=float)
+    return EuclideanDistances(record['coordinates'])[:]
+
+
+def read_instances(path):
+    """
+    JSON Lines dosyasından TSP örneklerini tek tek okur (dosya belleğe bütünüyle yüklenmez).
+    Her satır {"id": ..., "distances": [[...], ...]} ya da {"id": ..., "coordinates": [[x, y], ...]} biçimindedir;
+    koordinat verilirse Öklid mesafeleri kullanılır. id verilmezse satır numarası kullanılır.
+    Dönüş: (id, mesafe matrisi) üreteci.
+    """
+    with open(path, encoding='utf-8') as file:
+        for number, line in enumerate(file):
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            yield record.get('id', number), instance_distances(record)
+
+
+def write_solutions(file, ids, tours, costs):
+    """Çözümleri JSON Lines olarak yazar: her satır {"id": ..., "tour": [...], "cost": ...}."""
+    for instance_id, tour, cost in zip(ids, tours, costs):
+        file.write(json.dumps({'id': instance_id, 'tour': tour.tolist(), 'cost': float(cost)}) + '\n')
+
+
+def solve_stream(input_path, output_path, chunk_size=256, **options):
+    """
+    input_path'teki örnekleri chunk_size'lık parçalar halinde okur, her parçayı BatchAntColonySolver ile
+    birlikte çözer ve sonuçları girdi sırasıyla output_path'e yazar. Bellek kullanımı örnek sayısından
+    bağımsızdır ve parça boyutuyla (chunk_size * N^2) sınırlıdır.
+    options: BatchAntColonySolver parametreleri (n_ants, n_iterations, rng, ...).
+    Dönüş: Çözülen örnek sayısı.
+    """
+    solver = BatchAntColonySolver(**options)
+    instances = read_instances(input_path)
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as file:
+        while True:
+            chunk = list(itertools.islice(instances, chunk_size))
+            if not chunk:
+                break
+            ids, distances = zip(*chunk)
+            tours, costs = solver.solve(list(distances))
+            write_solutions(file, ids, tours, costs)
+            count += len(chunk)
+    return count
+
+
+if __name__ == "__main__":
+    distances = np.array([
+        [0, 1, 2, 3],  # 1. şehirden diğer şehirlere olan mesafeler
+        [1, 0, 4, 5],  # 2. şehirden diğer şehirlere olan mesafeler
+        [2, 4, 0, 6],  # 3. şehirden diğer şehirlere olan mesafeler
+        [3, 5, 6, 0]   # 4. şehirden diğer şehirlere olan mesafeler
+    ])
+    aco = AntColonyOptimizer(distances, n_ants=10, n_best=5, n_iterations=100, decay=0.5, alpha=1, beta=2)
+    # En iyi maliyet 10 iterasyon boyunca iyileşmezse durulur.
+    termination = Termination(patience=10)
+    path, cost = aco.run(termination=termination)
+    print("Durma nedeni:", termination.reason, "- iterasyon:", termination.iteration)
+    print("En kısa yol:", path)
+    print("Yolun maliyeti:", cost)
+
+
+'''
+
+Bu kodun çalışma prensibi şöyledir:
+
+-- Başlangıç:
+
+İlk olarak, şehirler arası mesafeler distances matrisi ile tanımlanır. 
+Her yol için başlangıç feromon miktarı ayarlanır.
+
+
+
+-- Yol Oluşturma: 
+Tüm karıncaların yolları, generate_all_paths fonksiyonu kullanılarak başlangıç şehrinden başlayarak birlikte oluşturulur. 
+generate_paths fonksiyonu, her adımda select_next_cities ile tüm karıncalar için ziyaret edilmemiş şehirlerden bir sonraki şehri seçer; 
+olasılıklar feromon miktarı ve şehirler arası mesafeye dayalı, iterasyon başına bir kez hesaplanan çekicilik matrisinden gelir.
+
+
+
+-- Feromon Yayılımı: 
+Tüm karıncaların yolları oluşturulduktan sonra, spread_pheromone fonksiyonu ile her bir yol üzerindeki feromon miktarı güncellenir.
+ En iyi yollar daha fazla feromon alır.
+
+ 
+
+-- En İyi Yolun Bulunması: 
+find_shortest_path fonksiyonu, tüm yollar arasından en düşük maliyete sahip olanı bulur ve bu en iyi yol olarak kaydedilir.
+
+
+
+--İterasyon: 
+Yukarıdaki adımlar, belirlenen iterasyon sayısı kadar tekrarlanır. 
+Her iterasyon sonunda, en iyi yol güncellenir.
+
+
+
+--Sonuç: 
+Algoritma tamamlandığında, en kısa yol ve bu yolun maliyeti döndürülür.
+
+
+'''
\ No newline at end of file
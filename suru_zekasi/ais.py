@@ -0,0 +1,174 @@
+'''
+--Yapay Bağışıklık Sistemleri (AIS - Artificial Immune Systems),
+biyolojik bağışıklık sistemlerinin davranışlarını taklit eden bilgisayar algoritmalarıdır. 
+Bu sistemler, özellikle tanıma, öğrenme, hafıza ve kendini iyileştirme yeteneklerini modellemek için kullanılır. 
+AIS, özellikle desen tanıma, anormallik tespiti ve fonksiyon optimizasyonu gibi alanlarda kullanılmaktadır.
+
+
+AIS'in Temel Bileşenleri ve Mekanizmaları
+Yapay Bağışıklık Sistemleri, aşağıdaki biyolojik mekanizmalardan ilham alır:
+
+* Antijenler (Ag): Sisteme zarar verebilecek herhangi bir dış etken veya girdi.
+
+* Antikorlar (Ab): Antijenleri tanıyıp bağlanarak onları etkisiz hale getiren protein molekülleri. AIS'de, çözüm adaylarını veya durumu temsil eder.
+
+* Afinite: Antikorların antijenlere ne kadar iyi bağlandığının bir ölçüsü. Genellikle uygunluk fonksiyonu ile modellenir.
+
+* Klonal Seçilim: En iyi antikorların (en yüksek afiniteye sahip olanların) seçilip klonlanması ve mutasyona uğratılması işlemidir. 
+Bu, arama alanında çeşitliliği ve optimal çözüme ulaşmayı sağlar.
+
+* Hafıza Hücreleri: Geçmişte karşılaşılan antijenlere hızlı yanıt vermek üzere saklanan antikorlar. Sistemin öğrenme ve hafıza yeteneğini temsil eder.
+
+
+
+-- Basit Bir AIS Algoritması
+1) Başlangıç Popülasyonunun Oluşturulması: Rastgele antikorlar (çözüm adayları) üretilir.
+2) Afinite Değerlendirmesi: Her antikor için afinite (uygunluk) hesaplanır.
+3) Klonal Seçilim: En iyi antikorlar seçilir ve klonlanır. Klon sayısı, antikorun afinite değerine bağlıdır.
+4) Mutasyon: Klonlanan antikorlar, çeşitliliği artırmak için mutasyona uğratılır. Mutasyon oranı, genellikle antikorun afinite değerine ters orantılıdır.
+5) Hafıza Güncellemesi: En iyi antikorlar hafıza hücrelerine eklenir veya güncellenir.
+6) Yeni Popülasyonun Oluşturulması: Yeni antikorlar (çözümler) rastgele veya mevcut antikorlardan türetilerek oluşturulur.
+7) Terminasyon Kriteri: Belirlenen iterasyon sayısına ulaşılıncaya veya başka bir durdurma kriteri karşılanıncaya kadar adımlar tekrarlanır.
+'''
+
+import numpy as np
+
+from .degerlendirme import as_batch_objective
+from .hassasiyet import float_dtype
+from .izleme import NULL_PROFILER
+from .kontrol_noktasi import Checkpointable
+from .rastgele import make_rng
+from .sor_bildir import AskTell
+from .sonlandirma import iteration_range
+
+# Antikorlar dizi olarak tutulur: genler (popülasyon x gen uzunluğu), afiniteler (popülasyon,)
+
+# Afinite (uygunluk) fonksiyonu: Basit bir örnek
+def affinity_function(genes):
+    # Afinite, genlerin toplamı olarak hesaplanır (basitleştirilmiş bir örnek)
+    return sum(genes)
+
+# Başlangıç popülasyonunu oluşturma: (size, gene_length) boyutlu gen matrisi
+def create_initial_population(size, gene_length, rng=None, dtype=np.float64):
+    return make_rng(rng).random((size, gene_length), dtype=dtype)
+
+# Klonal seçilim ve mutasyon
+def clonal_selection_and_mutation(genes, affinities, clone_factor, mutation_rate, max_clones=None, rng=None):
+    """
+    Seçilmiş antikorları afiniteleriyle orantılı sayıda klonlar ve klonları mutasyona uğratır.
+    genes: (m, L) boyutlu seçilmiş antikor genleri.
+    affinities: (m,) boyutlu afinite değerleri.
+    clone_factor: Antikor başına klon sayısı int(clone_factor * afinite) olur.
+    mutation_rate: Her klonda rastgele değiştirilecek genlerin oranı.
+    max_clones: En fazla klon sayısı (seçilim sırasına göre ilk klonlar tutulur).
+    rng: Tohum, numpy.random.Generator ya da rastgele.BufferedRandom.
+    Dönüş: (klon sayısı, L) boyutlu klon genleri.
+    """
+    rng = make_rng(rng)
+    counts = np.maximum((clone_factor * affinities).astype(int), 0)  # Afiniteye bağlı klon sayısı
+    if max_clones is not None:
+        # Sayılar kopyalamadan önce kırpılır: toplam en fazla max_clones olur, fazla klonlar hiç ayrılmaz.
+        before = np.cumsum(counts) - counts  # Her antikordan önce üretilmiş klon sayısı
+        counts = np.minimum(counts, np.maximum(max_clones - before, 0))
+    clones = np.repeat(genes, counts, axis=0)
+    n_mutations = int(mutation_rate * genes.shape[1])
+    if n_mutations and len(clones):
+        # Mutasyon: her klon için birbirinden farklı n_mutations gen indisi tek bir çekilişle seçilir
+        mutation_indices = np.argpartition(rng.random(clones.shape), n_mutations - 1, axis=1)[:, :n_mutations]
+        np.put_along_axis(clones, mutation_indices, rng.random(mutation_indices.shape), axis=1)
+    return clones
+
+# Ana algoritma
+class ClonalSelection(AskTell, Checkpointable):
+    checkpoint_arrays = ('genes', 'affinities')
+    checkpoint_values = ('iteration',)
+
+    def __init__(self, population_size=100, gene_length=10, clone_factor=0.1, mutation_rate=0.05,
+                 affinity=affinity_function, evaluator=None, rng=None, profiler=None, dtype=None):
+        """
+        Klonal seçilim (CLONALG) algoritması. Popülasyon büyüklüğü sabit tutulur: klonlar popülasyonu aşarsa
+        fazlası atılır, kalan yerler rastgele yeni antikorlarla doldurulur.
+        affinity: Büyütülen afinite fonksiyonu (skaler ya da @vectorized toplu fonksiyon); None ise afiniteler
+                  ask/tell ile dışarıda hesaplanır.
+        evaluator: Toplu değerlendirmeleri dağıtan değerlendirici (degerlendirme modülü).
+        rng: Tohum, numpy.random.Generator ya da rastgele.BufferedRandom.
+        profiler: Aşama süreleri için izleme.Profiler (None: izleme kapalı).
+        dtype: Gen ve afinite dizilerinin tipi (ör. np.float32; varsayılan float64).
+        """
+        self.objective = as_batch_objective(affinity, evaluator=evaluator)
+        self.profiler = profiler or NULL_PROFILER
+        self.dtype = float_dtype(dtype)
+        self.population_size = population_size
+        self.gene_length = gene_length
+        self.clone_factor = clone_factor
+        self.mutation_rate = mutation_rate
+        self.n_selected = int(0.2 * population_size)
+        self.rng = make_rng(rng)
+        self.iteration = 0
+        # Başlangıç popülasyonunu oluştur ve afiniteyi tek çağrıda hesapla
+        self.genes = create_initial_population(population_size, gene_length, self.rng, self.dtype)
+        self.affinities = None if affinity is None else self.objective(self.genes).astype(self.dtype, copy=False)
+
+    def _iterate(self):
+        # Seçilim, klonlama ve mutasyon, popülasyonun yenilenmesi ve afinitelerin hesaplanmasından oluşan iterasyon.
+        if self.affinities is None:
+            self.affinities = (yield self.genes).astype(self.dtype, copy=False)
+        profiler, affinities = self.profiler, self.affinities
+        with profiler.phase('select'):
+            # En iyi antikorları tam sıralama yapmadan seç; yalnızca seçilenler kendi aralarında sıralanır
+            if self.n_selected:
+                selected = np.argpartition(-affinities, self.n_selected - 1)[:self.n_selected]
+                selected = selected[np.argsort(-affinities[selected], kind='stable')]
+            else:
+                selected = np.empty(0, dtype=int)
+        with profiler.phase('clone'):
+            # Klonlama ve mutasyon
+            clones = clonal_selection_and_mutation(self.genes[selected], affinities[selected], self.clone_factor,
+                                                   self.mutation_rate, max_clones=self.population_size, rng=self.rng)
+            # Yeni popülasyon; afiniteler her yenilemeden sonra hesaplandığından güncel kalır
+            self.genes = np.concatenate([clones, create_initial_population(self.population_size - len(clones),
+                                                                           self.gene_length, self.rng, self.dtype)])
+        profiler.count('clones', len(clones))
+        self.affinities = (yield self.genes).astype(self.dtype, copy=False)
+        self.iteration += 1
+
+    def run(self, iterations, callback=None, termination=None, checkpoint=None):
+        """
+        En fazla iterations iterasyon çalıştırır.
+        callback: Her iterasyondan sonra callback(iterasyon, genler, afiniteler) çağrılır.
+        termination: Erken durdurma için sonlandirma.Termination; afinite büyütüldüğünden maximize=True olmalıdır.
+        checkpoint: Her iterasyon sonunda durumu kaydeden kontrol_noktasi.Checkpointer.
+        Dönüş: Son popülasyonun genleri (population_size, gene_length) ve afiniteleri (population_size,).
+        """
+        for i in iteration_range(iterations, termination):
+            self.step()
+            best = self.affinities.max()
+            self.profiler.iteration(self.iteration, best=float(best), evaluations=self.objective.n_evaluations)
+            if callback is not None:
+                callback(self.iteration, self.genes, self.affinities)
+            if checkpoint is not None:
+                checkpoint.update(self)
+            if termination is not None and termination.should_stop(i + 1, best, self.objective.n_evaluations):
+                break
+        return self.genes, self.affinities
+
+def ais_algorithm(population_size=100, gene_length=10, clone_factor=0.1, mutation_rate=0.05, iterations=100,
+                  affinity=affinity_function, evaluator=None, rng=None, callback=None, profiler=None,
+                  termination=None, checkpoint=None, dtype=None):
+    """
+    ClonalSelection ile klonal seçilim algoritması.
+    checkpoint: kontrol_noktasi.Checkpointer; kontrol noktası varsa çalışma kaldığı iterasyondan sürdürülür.
+    Dönüş: Son popülasyonun genleri (population_size, gene_length) ve afiniteleri (population_size,).
+    """
+    system = ClonalSelection(population_size, gene_length, clone_factor, mutation_rate, affinity, evaluator, rng,
+                             profiler, dtype)
+    if checkpoint is not None:
+        checkpoint.restore(system)
+    return system.run(None if iterations is None else iterations - system.iteration, callback, termination,
+                      checkpoint)
+
+if __name__ == "__main__":
+    # Algoritmayı çalıştır ve en iyi çözümü bul
+    final_genes, final_affinities = ais_algorithm()
+    best = np.argmax(final_affinities)
+    print("En iyi çözüm:", final_genes[best], "Afinite:", final_affinities[best])
@@ -0,0 +1,306 @@
+'''
+Arı Kolonisi Optimizasyonu (Bee Colony Optimization - BCO), arı kolonilerinin doğal davranışlarından ilham alınarak geliştirilen bir optimizasyon algoritmasıdır. 
+Bu algoritma, özellikle karmaşık problemleri çözmek için kullanılır ve arıların yiyecek kaynaklarını bulma ve değerlendirme stratejilerine dayanır. 
+Algoritma, çözüm uzayında iyi sonuçlar veren bölgeleri keşfetmeye ve bu bölgelerdeki çözümleri iyileştirmeye odaklanır.
+
+BCO algoritmasının temel adımları şunlardır:
+
+1) Başlangıç Popülasyonunun Oluşturulması: Algoritma, çözüm uzayında rastgele seçilmiş başlangıç noktalarıyla (arılar) başlar.
+
+2) Çözümlerin Değerlendirilmesi: Her bir arı (veya çözüm), belirlenen bir amaç fonksiyonuna göre değerlendirilir. Bu değerlendirme, çözümün kalitesini belirler.
+
+3) Seçilmiş Çözümlere Göre Arama: En iyi çözümlere göre çevrede arama yapılır. Bu, arıların çiçekler arasında nektar aramasına benzer. 
+Çözümler arasında geçişler yaparak daha iyi çözümler aranır.
+
+
+4) Çözümlerin Güncellenmesi: Yeni bulunan çözümler, mevcut çözümlerle karşılaştırılır ve daha iyi olanlar seçilir.
+Sonlanma Kriteri: Belirli bir iterasyon sayısına ulaşıldığında veya başka bir sonlanma kriteri karşılandığında algoritma sonlandırılır.
+
+
+Şimdi, basit bir BCO algoritmasını Python kullanarak bir örnekle gösterelim. 
+Bu örnekte, basit bir optimizasyon problemi çözmek için BCO algoritmasını kullanacağız. 
+Örneğin amaç fonksiyonu olarak, basit bir matematiksel fonksiyonu (örneğin, bir parabol) optimize edeceğiz.
+
+'''
+
+
+from collections import deque
+
+import numpy as np
+
+from .degerlendirme import as_batch_objective
+from .hassasiyet import float_dtype
+from .izleme import NULL_PROFILER
+from .kontrol_noktasi import Checkpointable
+from .rastgele import make_rng
+from .sor_bildir import AskTell, SteadyState
+from .sonlandirma import iteration_range
+
+# Amaç fonksiyonu (minimize etmeye çalışıyoruz): tek boyutta bir parabol, çok boyutta küre fonksiyonu
+def objective_function(x):
+    return np.sum(x**2)
+
+# Arı sınıfı: BeeColony dizilerinin nesne görünümü
+class Bee:
+    __slots__ = ('position', 'value', 'trials')
+
+    def __init__(self, position, value, trials=0):
+        self.position = position
+        self.value = value
+        self.trials = trials
+
+# BCO algoritmasının dizi tabanlı (structure-of-arrays) uygulaması
+class BeeColony(AskTell, Checkpointable):
+    checkpoint_arrays = ('positions', 'values', 'trials', 'best_position')
+    checkpoint_values = ('best_value', 'iteration')
+
+    def __init__(self, objective, search_space, num_bees, n_dimensions=1, limit=None, evaluator=None, rng=None,
+                 profiler=None, dtype=None):
+        """
+        Besin kaynakları arı nesnelerinde değil, dizilerde tutulur: konumlar (num_bees x d), değerler (num_bees,)
+        ve kaynak başına deneme sayaçları (num_bees,). İşçi, gözcü ve kâşif arı aşamalarının her biri
+        tek bir toplu değerlendirmeyle ilerler.
+        objective: Amaç fonksiyonu (skaler ya da @vectorized toplu fonksiyon); None ise değerlendirmeler ask/tell ile
+                   dışarıda yapılır ve başlangıç kaynakları da ilk ask ile istenir.
+        search_space: Arama uzayının [alt, üst] sınırları; skaler ya da boyut başına dizi.
+        num_bees: Besin kaynağı (işçi arı) sayısı; gözcü arı sayısı da aynıdır.
+        n_dimensions: Problemin boyutu.
+        limit: İyileşmeyen bir kaynağın terk edilmeden önceki deneme sayısı (varsayılan: num_bees * n_dimensions).
+        evaluator: Toplu değerlendirmeleri dağıtan değerlendirici (degerlendirme modülü).
+        rng: Tohum, numpy.random.Generator ya da rastgele.BufferedRandom.
+        profiler: Aşama süreleri için izleme.Profiler (None: izleme kapalı).
+        dtype: Konum ve değer dizilerinin tipi (ör. np.float32; varsayılan float64).
+        """
+        self.objective = as_batch_objective(objective, evaluator=evaluator)
+        self.profiler = profiler or NULL_PROFILER
+        self.dtype = float_dtype(dtype)
+        self.low = np.broadcast_to(np.asarray(search_space[0], dtype=float), (n_dimensions,))
+        self.high = np.broadcast_to(np.asarray(search_space[1], dtype=float), (n_dimensions,))
+        self.num_bees = num_bees
+        self.n_dimensions = n_dimensions
+        self.limit = num_bees * n_dimensions if limit is None else limit
+        self.rng = make_rng(rng)
+        self.iteration = 0
+
+        # Başlangıç popülasyonunu oluştur ve tüm kaynakları tek çağrıda değerlendir
+        self.positions = self.rng.uniform(self.low, self.high, size=(num_bees, n_dimensions)).astype(self.dtype,
+                                                                                                      copy=False)
+        self.values = None
+        self.trials = np.zeros(num_bees, dtype=int)
+        self.best_position = np.empty(n_dimensions, dtype=self.dtype)
+        self.best_value = np.inf
+        if objective is not None:
+            self._initialize(self.objective(self.positions))
+
+    def _initialize(self, values):
+        self.values = values.astype(self.dtype, copy=False)
+        best = np.argmin(self.values)
+        self.best_position = self.positions[best].copy()
+        self.best_value = self.values[best]
+
+    def bees(self):
+        """Kaynakların Bee nesneleri olarak kopyası (yalnızca inceleme için)."""
+        return [Bee(position, value, trials)
+                for position, value, trials in zip(self.positions.copy(), self.values, self.trials)]
+
+    def _candidates(self, sources):
+        # Her kaynak için rastgele bir komşu kaynak ve boyut seçilerek yeni aday üretilir:
+        # v_ij = x_ij + phi * (x_ij - x_kj), k != i
+        count = len(sources)
+        rows = np.arange(count)
+        partners = self.rng.integers(0, self.num_bees - 1, count)
+        partners += partners >= sources
+        dims = self.rng.integers(0, self.n_dimensions, count)
+        phi = self.rng.uniform(-1, 1, count)
+        candidates = self.positions[sources]
+        candidates[rows, dims] += phi * (candidates[rows, dims] - self.positions[partners, dims])
+        np.clip(candidates, self.low, self.high, out=candidates)
+        return candidates
+
+    def _select(self, sources, candidates, values):
+        # Açgözlü seçim: aynı kaynağı deneyen adaylardan yalnızca en iyisi değerlendirilir.
+        count = len(sources)
+        order = np.lexsort((values, sources))
+        first = np.ones(count, dtype=bool)
+        first[1:] = sources[order][1:] != sources[order][:-1]
+        winners = order[first]
+        better = winners[values[winners] < self.values[sources[winners]]]
+        improved = sources[better]
+        self.positions[improved] = candidates[better]
+        self.values[improved] = values[better]
+        # Başarısız her deneme kaynağın sayacını artırır, iyileşen kaynakların sayacı sıfırlanır.
+        np.add.at(self.trials, sources, 1)
+        self.trials[improved] = 0
+
+    def _fitness(self):
+        # Rulet seçimi için uygunluk: f >= 0 için 1 / (1 + f), aksi halde 1 + |f|
+        return np.where(self.values >= 0, 1 / (1 + np.abs(self.values)), 1 + np.abs(self.values))
+
+    def _iterate(self):
+        # İşçi, gözcü ve kâşif arı aşamalarından oluşan bir iterasyon; her aşamanın adayları ayrı ayrı istenir.
+        # Aşamalar yield'den önce kapatılır: dışarıdaki değerlendirme süresi aday üretimine yazılmaz ve
+        # aynı profiler'ı paylaşan algoritmaların (sor_bildir.interleave) aşama yığınları karışmaz.
+        profiler = self.profiler
+        if self.values is None:
+            self._initialize((yield self.positions))
+        # İşçi arılar: her kaynak bir kez denenir.
+        with profiler.phase('employed'):
+            sources = np.arange(self.num_bees)
+            candidates = self._candidates(sources)
+        values = yield candidates
+        with profiler.phase('employed_select'):
+            self._select(sources, candidates, values)
+        # Gözcü arılar: kaynaklar uygunluklarıyla orantılı (rulet) seçilir.
+        with profiler.phase('onlooker'):
+            cumulative = np.cumsum(self._fitness())
+            chosen = np.searchsorted(cumulative, self.rng.random(self.num_bees) * cumulative[-1], side='right')
+            sources = np.minimum(chosen, self.num_bees - 1)
+            candidates = self._candidates(sources)
+        values = yield candidates
+        with profiler.phase('onlooker_select'):
+            self._select(sources, candidates, values)
+        # En iyi çözümü güncelle (terk edilecek kaynaklar dahil)
+        self._update_best(np.arange(self.num_bees))
+        # Kâşif arılar: deneme sınırını aşan kaynaklar terk edilip rastgele yeniden oluşturulur.
+        abandoned = np.flatnonzero(self.trials > self.limit)
+        if len(abandoned):
+            with profiler.phase('scout'):
+                self.positions[abandoned] = self.rng.uniform(self.low, self.high,
+                                                             size=(len(abandoned), self.n_dimensions))
+            self.values[abandoned] = yield self.positions[abandoned]
+            self.trials[abandoned] = 0
+            profiler.count('scouts', len(abandoned))
+            self._update_best(abandoned)  # Son iterasyonda da en iyiyi geçen kâşifler kaybolmaz
+        self.iteration += 1
+
+    def _update_best(self, sources):
+        best = sources[np.argmin(self.values[sources])]
+        if self.values[best] < self.best_value:
+            self.best_position = self.positions[best].copy()
+            self.best_value = self.values[best]
+
+    def run(self, num_iterations, callback=None, termination=None, checkpoint=None):
+        """
+        En fazla num_iterations iterasyon çalıştırır.
+        callback: Her iterasyondan sonra callback(iterasyon, en iyi pozisyon, en iyi değer) çağrılır.
+        termination: Erken durdurma için sonlandirma.Termination (num_iterations None ise zorunludur).
+        checkpoint: Her iterasyon sonunda durumu kaydeden kontrol_noktasi.Checkpointer.
+        """
+        for i in iteration_range(num_iterations, termination):
+            self.step()
+            self.profiler.iteration(self.iteration, best=float(self.best_value),
+                                    evaluations=self.objective.n_evaluations)
+            if callback is not None:
+                callback(self.iteration, self.best_position, self.best_value)
+            if checkpoint is not None:
+                checkpoint.update(self)
+            if termination is not None and termination.should_stop(i + 1, self.best_value,
+                                                                   self.objective.n_evaluations):
+                break
+        return self.best_position, self.best_value
+
+# Eşzamansız (steady-state) BCO
+class AsyncBeeColony(SteadyState, BeeColony):
+    def __init__(self, objective, search_space, num_bees, n_dimensions=1, limit=None, evaluator=None, rng=None,
+                 profiler=None, dtype=None):
+        """
+        Eşzamansız (steady-state) BCO. İşçi, gözcü ve kâşif aşamaları nesil nesil beklenmez: her aday değeri
+        döner dönmez kendi kaynağıyla açgözlü karşılaştırılır ve yerine hemen yeni bir aday gönderilir.
+        Gönderilen adaylar sırayla bir işçi (kaynaklar sırayla) ve bir gözcü (o anki uygunluklara göre rulet)
+        denemesidir; deneme sınırını aşan kaynaklar için öncelikle bir kâşif adayı gönderilir. Bir kaynağın aynı
+        anda birden fazla denemesi işlemde olabilir; değeri gelen aday kaynağın o anki değeriyle karşılaştırılır.
+        Parametreler BeeColony ile aynıdır; değerlendirmeler evaluator'ın submit metoduyla tek tek yapılır.
+        run(iterations, n_workers=...) ile çalıştırılır; bir iterasyon 2 * num_bees değerlendirmedir.
+        """
+        super().__init__(None, search_space, num_bees, n_dimensions, limit, rng=rng, profiler=profiler, dtype=dtype)
+        self.objective = as_batch_objective(objective, evaluator=evaluator)
+        self.values = np.full(num_bees, np.inf, dtype=self.dtype)
+        self.sweep_size = 2 * num_bees
+        self._initial = deque(range(num_bees))  # Başlangıç konumu henüz gönderilmemiş kaynaklar
+        self._scouts = deque()  # Kâşif adayı gönderilecek kaynaklar
+        self._scouting = set()  # Kâşif adayı işlemde ya da sırada olan kaynaklar
+        self._next_employed = 0
+        self._onlooker_turn = False
+
+    def _next_candidate(self):
+        if self._initial:
+            source = self._initial.popleft()
+            return ('initial', source), self.positions[source].copy()
+        if self._scouts:
+            source = self._scouts.popleft()
+            with self.profiler.phase('scout'):
+                candidate = self.rng.uniform(self.low, self.high, size=self.n_dimensions).astype(self.dtype)
+            return ('scout', source), candidate
+        if self._onlooker_turn:
+            with self.profiler.phase('onlooker'):
+                cumulative = np.cumsum(self._fitness())
+                source = min(int(np.searchsorted(cumulative, self.rng.random() * cumulative[-1], side='right')),
+                             self.num_bees - 1)
+                candidate = self._candidates(np.array([source]))[0]
+        else:
+            with self.profiler.phase('employed'):
+                source = self._next_employed
+                self._next_employed = (source + 1) % self.num_bees
+                candidate = self._candidates(np.array([source]))[0]
+        self._onlooker_turn = not self._onlooker_turn
+        return ('trial', source), candidate
+
+    def _receive(self, key, candidate, value):
+        kind, source = key
+        if kind == 'scout' and self.trials[source] > self.limit:
+            # Kâşif adayı kaynağın yerine koşulsuz geçer (kaynak bu arada iyileşmediyse). Başlangıç değerleri
+            # diğer adaylar gibi karşılaştırılır: kaynağın daha önce dönen daha iyi bir denemesi ezilmez.
+            self.positions[source] = candidate
+            self.values[source] = value
+            self.trials[source] = 0
+        elif value < self.values[source]:
+            self.positions[source] = candidate
+            self.values[source] = value
+            self.trials[source] = 0
+        elif kind == 'trial':
+            self.trials[source] += 1
+        if kind == 'scout':
+            self._scouting.discard(source)
+            self.profiler.count('scouts')
+        if self.trials[source] > self.limit and source not in self._scouting:
+            self._scouting.add(source)
+            self._scouts.append(source)
+        if value < self.best_value:
+            self.best_position = candidate.copy()
+            self.best_value = value
+
+    def _best(self):
+        return self.best_position, self.best_value
+
+# BCO algoritmasının uygulanması
+def bee_colony_optimization(num_bees, num_iterations, search_space, objective=objective_function, evaluator=None,
+                            n_dimensions=1, limit=None, callback=None, rng=None, profiler=None, termination=None,
+                            checkpoint=None, dtype=None):
+    colony = BeeColony(objective, search_space, num_bees, n_dimensions, limit, evaluator, rng, profiler, dtype)
+    # Kontrol noktası varsa çalışma kaldığı iterasyondan sürdürülür.
+    if checkpoint is not None:
+        checkpoint.restore(colony)
+    remaining = None if num_iterations is None else num_iterations - colony.iteration
+    return colony.run(remaining, callback, termination, checkpoint)
+
+if __name__ == "__main__":
+    # Algoritmanın çalıştırılması
+    num_bees = 50
+    num_iterations = 20
+    search_space = [-10, 10] # Arama uzayının sınırları
+
+    def report(iteration, best_position, best_value):
+        print(f"Iterasyon: {iteration}, En İyi Değer: {best_value}, En İyi Pozisyon: {best_position}")
+
+    best_position, best_value = bee_colony_optimization(num_bees, num_iterations, search_space, callback=report)
+    print(f"Optimizasyon sonucu elde edilen en iyi pozisyon: {best_position}, En iyi değer: {best_value}")
+
+
+'''
+
+Bu kod, belirli bir arama alanında (search_space) belirli sayıda arı (num_bees) ve iterasyon (num_iterations) kullanarak bir amaç fonksiyonunu (objective_function) minimize etmeye çalışır. 
+Her iterasyonda işçi arılar kaynaklarının etrafında rastgele bir arama yapar ve daha iyi bir çözüm bulursa o yöne doğru hareket eder; 
+gözcü arılar iyi kaynakları daha sık ziyaret eder, uzun süre iyileşmeyen kaynaklar ise kâşif arılarca terk edilip yenileriyle değiştirilir. 
+Bu basit örnekte, amaç fonksiyonu olarak bir parabol kullanılmıştır, ancak BCO algoritması çok daha karmaşık fonksiyonlar ve gerçek dünya optimizasyon problemleri için de uygulanabilir.
+
+'''
\ No newline at end of file
@@ -0,0 +1,36 @@
+'''
+Birden fazla algoritmanın ortak kullandığı vektörleştirilmiş hesaplama çekirdekleri.
+
+* pairwise_sq_distances: Bir popülasyondaki tüm çiftler arasındaki kare Öklid mesafeleri (n x n).
+* update_sq_distances: Yalnızca bazı noktalar yer değiştirdiğinde mesafe matrisinin ilgili satır ve
+  sütunlarını yerinde günceller; tüm matrisin yeniden hesaplanmasını önler.
+'''
+
+import numpy as np
+
+
+def pairwise_sq_distances(population):
+    """Tüm çiftler arasındaki kare Öklid mesafeleri (n x n), tek bir matris çarpımıyla."""
+    sq_norms = np.einsum('ij,ij->i', population, population)
+    distances = sq_norms[:, None] + sq_norms[None, :] - 2 * population @ population.T
+    np.maximum(distances, 0, out=distances)  # Yuvarlama kaynaklı negatif değerler
+    return distances
+
+
+def update_sq_distances(distances, population, rows):
+    """
+    population[rows] değiştikten sonra kare mesafe matrisini yerinde günceller: O(len(rows) * n * d).
+    distances: pairwise_sq_distances ile hesaplanmış (n x n) matris.
+    population: Güncel (n, d) popülasyon.
+    rows: Konumu değişen noktaların indisleri.
+    """
+    if len(rows) == 0:
+        return distances
+    moved = population[rows]
+    block = (np.einsum('ij,ij->i', moved, moved)[:, None] + np.einsum('ij,ij->i', population, population)[None, :]
+             - 2 * moved @ population.T)
+    np.maximum(block, 0, out=block)
+    block[np.arange(len(rows)), rows] = 0
+    distances[rows] = block
+    distances[:, rows] = block.T
+    return distances
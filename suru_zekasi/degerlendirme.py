@@ -0,0 +1,341 @@
+'''
+Amaç fonksiyonlarının değerlendirilmesi için tüm algoritmaların ortak kullandığı arayüz.
+
+Her algoritma çözüm adaylarını (popülasyon x boyut) bir matris olarak gönderir ve karşılığında
+(popülasyon,) boyutlu bir uygunluk vektörü alır. Böylece pahalı amaç fonksiyonları (ör. benzetimler)
+adayları tek tek değil, toplu olarak işleyebilir.
+
+* Toplu çalışan fonksiyonlar @vectorized ile işaretlenir: f(X) -> (popülasyon,) boyutlu vektör.
+* İşaretlenmemiş fonksiyonların tek bir aday için skaler değer döndürdüğü varsayılır ve
+  BatchObjective tarafından otomatik olarak satır satır çağrılacak şekilde sarılır.
+* Pahalı fonksiyonlar CachedObjective ile sarılarak aynı (ya da çok yakın) adayların
+  tekrar değerlendirilmesi önlenebilir.
+* Değerlendirmeler bir değerlendirici (evaluator) ile paralelleştirilebilir: GIL'i bırakan ya da G/Ç
+  ağırlıklı fonksiyonlar için ThreadPoolEvaluator, saf Python ile CPU ağırlıklı fonksiyonlar için
+  ProcessPoolEvaluator, yerel bir benzetim servisini çağıran async fonksiyonlar için AsyncioEvaluator.
+  Popülasyon parçalara (chunk) bölünür ve sonuçlar adayların sırasıyla birleştirilir.
+* Eşzamansız (steady-state) algoritmalar adayları tek tek submit ile gönderir ve her biri için bir
+  concurrent.futures.Future alır; değeri gelen aday, diğerlerini beklemeden işlenir.
+
+asyncio ve süreç havuzu modülleri içe aktarılması pahalı olduğundan yalnızca ilgili değerlendirici
+kullanıldığında yüklenir.
+'''
+
+import math
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+
+def vectorized(function):
+    """Fonksiyonu toplu çalışan (popülasyon x boyut -> popülasyon) bir amaç fonksiyonu olarak işaretler."""
+    function.vectorized = True
+    return function
+
+
+class _RowEvaluator:
+    # Skaler bir fonksiyonu bir parçanın tüm satırlarına uygular (süreç havuzuna gönderilebilir).
+    def __init__(self, function):
+        self.function = function
+
+    def __call__(self, chunk):
+        return [self.function(candidate) for candidate in chunk]
+
+
+class _CandidateEvaluator:
+    # Tek bir adayı değerlendirir ve skaler değer döndürür (süreç havuzuna gönderilebilir).
+    def __init__(self, function, vectorized):
+        self.function = function
+        self.vectorized = vectorized
+
+    def __call__(self, candidate):
+        if self.vectorized:
+            return float(np.asarray(self.function(candidate[None]), dtype=float).reshape(1)[0])
+        return float(self.function(candidate))
+
+
+class SerialEvaluator:
+    def __init__(self, max_workers=None, chunksize=None):
+        """
+        Adayları çağıran süreçte sırayla değerlendirir; diğer değerlendiricilerin temel sınıfıdır.
+        max_workers: Eşzamanlı çalışan işçi sayısı (havuzlarda None: işlemci sayısı).
+        chunksize: Bir işçiye tek seferde gönderilen aday sayısı (None: adaylar işçilere eşit bölünür).
+        """
+        self.max_workers = max_workers
+        self.chunksize = chunksize
+
+    def split(self, population):
+        if self.chunksize:
+            size = self.chunksize
+        elif self.max_workers:
+            size = math.ceil(len(population) / self.max_workers)
+        else:
+            size = len(population)
+        return [population[i:i + size] for i in range(0, len(population), max(size, 1))]
+
+    def evaluate(self, function, population, vectorized):
+        """population'ı parçalara bölerek değerlendirir; sonuçlar adayların sırasıyla döndürülür."""
+        chunks = self.split(population)
+        task = function if vectorized else _RowEvaluator(function)
+        results = self.map(task, chunks)
+        return np.concatenate([np.asarray(result, dtype=float).reshape(len(chunk))
+                               for result, chunk in zip(results, chunks)] or [np.empty(0)])
+
+    def map(self, task, chunks):
+        return [task(chunk) for chunk in chunks]
+
+    def submit(self, function, candidate, vectorized):
+        """Tek bir adayı değerlendirir; değeri taşıyan (burada zaten tamamlanmış) bir Future döndürür."""
+        future = Future()
+        try:
+            future.set_result(_CandidateEvaluator(function, vectorized)(candidate))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ThreadPoolEvaluator(SerialEvaluator):
+    """Parçaları bir iş parçacığı havuzunda değerlendirir (GIL'i bırakan ya da G/Ç ağırlıklı fonksiyonlar)."""
+
+    def __init__(self, max_workers=None, chunksize=None):
+        super().__init__(max_workers or os.cpu_count(), chunksize)
+        self.executor = None
+
+    def make_executor(self):
+        return ThreadPoolExecutor(max_workers=self.max_workers)
+
+    def map(self, task, chunks):
+        if self.executor is None:
+            self.executor = self.make_executor()
+        return list(self.executor.map(task, chunks))
+
+    def submit(self, function, candidate, vectorized):
+        if self.executor is None:
+            self.executor = self.make_executor()
+        return self.executor.submit(_CandidateEvaluator(function, vectorized), candidate)
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+class ProcessPoolEvaluator(ThreadPoolEvaluator):
+    """
+    Parçaları bir süreç havuzunda değerlendirir (saf Python ile CPU ağırlıklı fonksiyonlar).
+    Fonksiyon pickle edilebilir olmalıdır (modül düzeyinde tanımlanmış).
+    """
+
+    def make_executor(self):
+        from concurrent.futures import ProcessPoolExecutor
+        return ProcessPoolExecutor(max_workers=self.max_workers)
+
+
+class AsyncioEvaluator(SerialEvaluator):
+    """
+    async tanımlanmış amaç fonksiyonlarını (ör. yerel bir benzetim servisine istek atan) eşzamanlı çalıştırır.
+    max_workers aynı anda beklenen en fazla parça sayısını sınırlar. Çalışan bir olay döngüsünün
+    içinden çağrılamaz (asyncio.run kullanılır). submit ile gönderilen adaylar arka planda bir iş parçacığında
+    çalışan ayrı bir olay döngüsünde değerlendirilir.
+    """
+    loop = None
+    thread = None
+
+    def evaluate(self, function, population, vectorized):
+        import asyncio
+        chunks = self.split(population)
+
+        async def evaluate_all():
+            limit = asyncio.Semaphore(self.max_workers or len(chunks) or 1)
+
+            async def evaluate_chunk(chunk):
+                async with limit:
+                    if vectorized:
+                        return await function(chunk)
+                    return await asyncio.gather(*(function(candidate) for candidate in chunk))
+
+            return await asyncio.gather(*(evaluate_chunk(chunk) for chunk in chunks))
+
+        results = asyncio.run(evaluate_all())
+        return np.concatenate([np.asarray(result, dtype=float).reshape(len(chunk))
+                               for result, chunk in zip(results, chunks)] or [np.empty(0)])
+
+    def submit(self, function, candidate, vectorized):
+        import asyncio
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+            self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+            self.thread.start()
+
+        async def evaluate_candidate():
+            if vectorized:
+                return float(np.asarray(await function(candidate[None]), dtype=float).reshape(1)[0])
+            return float(await function(candidate))
+
+        return asyncio.run_coroutine_threadsafe(evaluate_candidate(), self.loop)
+
+    def close(self):
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join()
+            self.loop.close()
+            self.loop = self.thread = None
+
+
+class BatchObjective:
+    def __init__(self, function, vectorized=None, evaluator=None):
+        """
+        Amaç fonksiyonunu toplu değerlendirme arayüzüne uyarlar.
+        function: Amaç fonksiyonu.
+        vectorized: Fonksiyonun toplu çalışıp çalışmadığı (None: @vectorized işaretine bakılır).
+        evaluator: Değerlendirmeleri dağıtan değerlendirici (None: çağıran süreçte sırayla).
+        """
+        self.function = function
+        self.vectorized = getattr(function, 'vectorized', False) if vectorized is None else vectorized
+        self.evaluator = evaluator
+        self.n_evaluations = 0  # Değerlendirilen toplam aday sayısı
+
+    def __call__(self, population):
+        """(popülasyon, boyut) boyutlu adayları değerlendirir ve (popülasyon,) boyutlu değer vektörü döndürür."""
+        population = np.asarray(population)
+        self.n_evaluations += len(population)
+        if self.evaluator is not None:
+            return self.evaluator.evaluate(self.function, population, self.vectorized)
+        if self.vectorized:
+            values = self.function(population)
+        else:
+            values = [self.function(candidate) for candidate in population]
+        return np.asarray(values, dtype=float).reshape(len(population))
+
+    def evaluate_one(self, candidate):
+        """Tek bir adayı değerlendirir ve skaler değer döndürür."""
+        return self(np.asarray(candidate)[None])[0]
+
+    def submit(self, candidate):
+        """
+        Tek bir adayı eşzamansız değerlendirmeye gönderir ve değerini taşıyan bir concurrent.futures.Future döndürür.
+        Değerlendirici yoksa aday hemen değerlendirilir ve tamamlanmış bir Future döndürülür.
+        """
+        self.n_evaluations += 1
+        evaluator = self.evaluator if self.evaluator is not None else _SERIAL_EVALUATOR
+        return evaluator.submit(self.function, np.asarray(candidate), self.vectorized)
+
+
+class CachedObjective(BatchObjective):
+    def __init__(self, function, tolerance=0.0, maxsize=100000, vectorized=None, evaluator=None):
+        """
+        Değerlendirme sonuçlarını LRU (en uzun süredir kullanılmayan önce atılır) önbellekte tutan BatchObjective.
+        Anahtar, adayın tolerance adımına yuvarlanmış (nicemlenmiş) halidir; aynı hücreye düşen adaylar
+        tekrar değerlendirilmez. Hücre sınırının iki yanındaki çok yakın adaylar farklı anahtar alabilir.
+        function: Amaç fonksiyonu.
+        tolerance: Nicemleme adımı (0: yalnızca birebir aynı adaylar eşleşir).
+        maxsize: Önbellekte tutulacak en fazla değer sayısı.
+        vectorized: Fonksiyonun toplu çalışıp çalışmadığı (None: @vectorized işaretine bakılır).
+        evaluator: Önbellekte bulunmayan adayları değerlendiren değerlendirici.
+        """
+        super().__init__(function, vectorized, evaluator)
+        self.tolerance = tolerance
+        self.maxsize = maxsize
+        self.cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        # submit ile gönderilen adayların değerleri değerlendiricinin iş parçacığında önbelleğe yazılır.
+        self.lock = threading.Lock()
+
+    def key(self, candidate):
+        candidate = np.asarray(candidate, dtype=float)
+        if self.tolerance:
+            return np.round(candidate / self.tolerance).astype(np.int64).tobytes()
+        return candidate.tobytes()
+
+    def __call__(self, population):
+        population = np.asarray(population)
+        values = np.empty(len(population))
+        missing = {}  # Önbellekte olmayan anahtar -> bu anahtarı paylaşan aday indisleri
+        with self.lock:
+            for i, candidate in enumerate(population):
+                key = self.key(candidate)
+                if key in self.cache:
+                    self.cache.move_to_end(key)
+                    values[i] = self.cache[key]
+                    self.hits += 1
+                elif key in missing:
+                    missing[key].append(i)  # Aynı toplu çağrı içindeki tekrar
+                    self.hits += 1
+                else:
+                    missing[key] = [i]
+                    self.misses += 1
+        if missing:
+            # Eksik adaylar tek bir toplu çağrıyla değerlendirilir.
+            computed = super().__call__(population[[indices[0] for indices in missing.values()]])
+            for (key, indices), value in zip(missing.items(), computed):
+                values[indices] = value
+                self.store(key, value)
+        return values
+
+    def submit(self, candidate):
+        """
+        Önbellekteki adaylar için tamamlanmış bir Future döndürür; diğerleri değerlendiriciye gönderilir ve
+        değerleri Future tamamlandığında önbelleğe yazılır. Sonucu henüz gelmemiş bir adayın tekrarı da
+        değerlendiriciye gönderilir (ıskalama sayılır).
+        """
+        key = self.key(candidate)
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                self.hits += 1
+                future = Future()
+                future.set_result(self.cache[key])
+                return future
+            self.misses += 1
+        future = super().submit(candidate)
+
+        def store_result(done):
+            if not done.cancelled() and done.exception() is None:
+                self.store(key, done.result())
+
+        future.add_done_callback(store_result)
+        return future
+
+    def store(self, key, value):
+        """Değeri önbelleğe yazar; önbellek doluysa en uzun süredir kullanılmayan değerler atılır."""
+        with self.lock:
+            self.cache[key] = value
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_SERIAL_EVALUATOR = SerialEvaluator()
+
+
+def as_batch_objective(function, vectorized=None, evaluator=None):
+    """
+    Fonksiyon zaten bir BatchObjective ise olduğu gibi, değilse sarılarak döndürülür.
+    evaluator verilirse değerlendirmeler bu değerlendirici üzerinden yapılır. Çağıranın BatchObjective'i
+    değiştirilmez: değerlendiricisi oluşturulurken verilmelidir, farklı bir evaluator verilirse ValueError.
+    """
+    if isinstance(function, BatchObjective):
+        if evaluator is not None and evaluator is not function.evaluator:
+            raise ValueError("BatchObjective için evaluator, nesne oluşturulurken verilmelidir "
+                             "(BatchObjective(..., evaluator=...)).")
+        return function
+    return BatchObjective(function, vectorized, evaluator)
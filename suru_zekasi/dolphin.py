@@ -0,0 +1,268 @@
+'''
+--Yunus Sürüsü Optimizasyonu (DSO - Dolphin Swarm Optimization), 
+yunusların avlanma ve sosyal davranışlarından ilham alınarak geliştirilen bir optimizasyon algoritmasıdır. 
+Bu algoritma, yunusların avlarını sürü halinde nasıl etkili bir şekilde avladıklarını ve birbirleriyle nasıl iletişim kurduklarını modelleyerek karmaşık problemlerin çözümünde kullanılır. 
+DSO, genellikle global optimizasyon problemlerinde kullanılır ve çeşitli mühendislik, araştırma ve geliştirme problemlerinde etkili çözümler üretmek için uygulanabilir.
+
+
+
+--- DSO'nun Temel Prensipleri
+1) Eşitleme Davranışı (Echolocation Behavior): 
+Yunusların çevrelerini sese dayalı olarak algılamaları. 
+Bu, DSO'da bir arama alanı içindeki çözüm adaylarının konumlarını belirlemek için kullanılır.
+
+
+
+2) Sürü Davranışı (Swarm Behavior): 
+Yunuslar, avlarını çevreleyerek ve onları daha küçük bir alana sıkıştırarak avlarlar. 
+DSO, bu davranışı optimizasyon sürecinde, çözümleri potansiyel en iyi çözüme doğru yönlendirerek modellemektedir.
+
+
+3) İletişim ve İşbirliği: 
+Yunuslar, birbirleriyle karmaşık sesler aracılığıyla iletişim kurarlar. 
+DSO'da, bu, çözüm adaylarının birbirleriyle bilgi paylaşmasını ve işbirliği yapmasını sağlayarak optimizasyon sürecini güçlendirir.
+
+
+
+-- DSO Algoritmasının Adımları
+DSO algoritması, genellikle aşağıdaki adımları içerir:
+
+1) Başlangıç Popülasyonunun Oluşturulması: 
+Rastgele seçilen çözüm adaylarıyla bir başlangıç popülasyonu oluşturulur.
+
+
+2) Eşitleme ve Arama: 
+Her yunus (çözüm adayı), çevresindeki çözümleri değerlendirerek daha iyi çözümlere doğru hareket eder.
+
+
+3) Sürü Oluşturma ve Avlanma: 
+En iyi çözümler etrafında sürüler oluşturulur ve çözümler bu en iyi noktalara doğru yönlendirilir.
+
+
+4) Güncelleme ve İterasyon: 
+Popülasyon, belirli bir durma kriteri karşılanana kadar güncellenir ve iterasyonlar devam eder.
+
+
+
+'''
+
+
+
+
+import numpy as np
+
+from .cekirdekler import pairwise_sq_distances, update_sq_distances
+from .degerlendirme import as_batch_objective
+from .hassasiyet import float_dtype, index_dtype
+from .izleme import NULL_PROFILER
+from .kontrol_noktasi import Checkpointable
+from .rastgele import make_rng
+from .sor_bildir import AskTell
+from .sonlandirma import iteration_range
+
+# Hedef fonksiyon: Bu örnekte, basit bir kare fonksiyonunu (çok boyutta küre fonksiyonu) minimizasyoruz.
+def objective_function(x):
+    return np.sum(x**2)
+
+# DSO motoru: arama, çağrı, alım ve avlanma aşamaları
+class DolphinSwarm(AskTell, Checkpointable):
+    checkpoint_arrays = ('population', 'scores', 'known', 'known_scores', 'sq_distances', 'delays', 'best_solution')
+    checkpoint_values = ('best_score', 'iteration')
+
+    def __init__(self, objective, bounds, population_size, n_dimensions=1, n_sounds=3, search_steps=3, speed=None,
+                 acceleration=5.0, radius_factor=4.0, max_delay=1000, evaluator=None, rng=None,
+                 profiler=None, dtype=None):
+        """
+        Yunus Sürüsü Optimizasyonu; popülasyon (popülasyon x boyut) dizilerde tutulur.
+        objective: Amaç fonksiyonu (skaler ya da @vectorized toplu fonksiyon); None ise değerlendirmeler ask/tell ile
+                   dışarıda yapılır ve başlangıç popülasyonu da ilk ask ile istenir.
+        bounds: (alt, üst) sınırlar; skaler ya da boyut başına dizi.
+        population_size: Yunus sayısı.
+        n_dimensions: Problemin boyutu.
+        n_sounds: Arama aşamasında her yunusun yaydığı ses (yön) sayısı.
+        search_steps: Her ses yönünde denenen adım sayısı.
+        speed: Ses hızı; bir arama adımının uzunluğu (varsayılan: sınır aralığının %5'i).
+        acceleration: Çağrı aşamasında sesin iletim süresini kısaltan ivme katsayısı.
+        radius_factor: Avlanma yarıçapını belirleyen katsayı (> 2); büyüdükçe yunuslar en iyiye daha çok yaklaşır.
+        max_delay: İletim süresi matrisinin başlangıç (ulaşmamış) değeri.
+        evaluator: Toplu değerlendirmeleri dağıtan değerlendirici (degerlendirme modülü).
+        rng: Tohum, numpy.random.Generator ya da rastgele.BufferedRandom.
+        profiler: Aşama süreleri için izleme.Profiler (None: izleme kapalı).
+        dtype: Popülasyon, skor ve mesafe dizilerinin tipi (ör. np.float32; varsayılan float64). İletim süreleri
+               max_delay'i tutabilen en küçük tamsayı tipinde saklanır.
+        """
+        self.objective = as_batch_objective(objective, evaluator=evaluator)
+        self.profiler = profiler or NULL_PROFILER
+        self.dtype = float_dtype(dtype)
+        self.low = np.broadcast_to(np.asarray(bounds[0], dtype=float), (n_dimensions,))
+        self.high = np.broadcast_to(np.asarray(bounds[1], dtype=float), (n_dimensions,))
+        self.population_size = population_size
+        self.n_dimensions = n_dimensions
+        self.n_sounds = n_sounds
+        self.search_steps = search_steps
+        self.speed = 0.05 * np.mean(self.high - self.low) if speed is None else speed
+        self.acceleration = acceleration
+        self.radius_factor = radius_factor
+        self.max_delay = max_delay
+        self.rng = make_rng(rng)
+        self.iteration = 0
+
+        # Başlangıç popülasyonunu oluştur
+        self.population = self.rng.uniform(self.low, self.high, (population_size, n_dimensions)).astype(self.dtype,
+                                                                                                         copy=False)
+        self.scores = None
+        # K: her yunusun bildiği en iyi çözüm (kendi araması ve diğerlerinden aldığı çağrılar)
+        self.known = self.population.copy()
+        self.known_scores = None
+        # Yunuslar arası kare mesafeler; yalnızca yer değiştiren yunusların satırları güncellenir.
+        self.sq_distances = pairwise_sq_distances(self.population)
+        # Çağrı iletim süreleri: delays[i, j], j'nin çağrısının i'ye ulaşmasına kalan süre
+        self.delays = np.full((population_size, population_size), max_delay, dtype=index_dtype(max_delay))
+        # Mesafeye bağlı iletim süreleri; sq_distances gibi yalnızca yer değiştiren yunusların satır ve sütunları
+        # güncellenir. max_delay'de kırpılır: daha uzun süreler zaten hiçbir bekleyen çağrıyı kısaltmaz.
+        self.travel_times = self._travel_times(self.sq_distances)
+        self.best_solution = np.empty(n_dimensions, dtype=self.dtype)
+        self.best_score = np.inf
+        if objective is not None:
+            self._initialize(self.objective(self.population))
+
+    def _initialize(self, scores):
+        self.scores = scores.astype(self.dtype, copy=False)
+        self.known_scores = self.scores.copy()
+        best = np.argmin(self.scores)
+        self.best_solution = self.population[best].copy()
+        self.best_score = self.scores[best]
+
+    def _restored(self):
+        self.travel_times = self._travel_times(self.sq_distances)
+
+    def _travel_times(self, sq_distances):
+        travel_times = np.ceil(np.sqrt(sq_distances) / (self.acceleration * self.speed))
+        return np.minimum(travel_times, self.max_delay).astype(self.delays.dtype)
+
+    def _random_directions(self, *shape):
+        directions = self.rng.normal(size=shape + (self.n_dimensions,))
+        directions /= np.linalg.norm(directions, axis=-1, keepdims=True)
+        return directions
+
+    def _search_points(self):
+        # Arama: her yunus n_sounds yöne search_steps adım ses yayar; tüm noktalar tek çağrıda değerlendirilir.
+        steps = np.arange(1, self.search_steps + 1)[None, None, :, None]
+        sounds = self._random_directions(self.population_size, self.n_sounds)[:, :, None, :] * self.speed
+        points = self.population[:, None, None, :] + sounds * steps
+        return np.clip(points, self.low, self.high).reshape(-1, self.n_dimensions).astype(self.dtype, copy=False)
+
+    def _search(self, points, scores):
+        points = points.reshape(self.population_size, -1, self.n_dimensions)
+        scores = scores.reshape(self.population_size, -1)
+        best = np.argmin(scores, axis=1)
+        rows = np.arange(self.population_size)
+        local, local_scores = points[rows, best], scores[rows, best]
+        improved = local_scores < self.known_scores
+        self.known[improved] = local[improved]
+        self.known_scores[improved] = local_scores[improved]
+
+    def _call_and_receive(self):
+        # Çağrı: j'nin bildiği çözüm i'ninkinden iyiyse, mesafeyle orantılı bir gecikmeyle i'ye iletilir.
+        better = self.known_scores[None, :] < self.known_scores[:, None]
+        np.copyto(self.delays, self.travel_times, where=better & (self.delays > self.travel_times))
+        # Alım: süresi dolan çağrılar alınır; i, ulaşan çağrılar arasından en iyi çözümü benimser.
+        self.delays -= 1
+        arrived = self.delays <= 0
+        offered = np.where(arrived & better, self.known_scores[None, :], np.inf)
+        source = np.argmin(offered, axis=1)
+        receives = np.isfinite(offered[np.arange(self.population_size), source])
+        self.known[receives] = self.known[source[receives]]
+        self.known_scores[receives] = self.known_scores[source[receives]]
+        self.delays[arrived] = self.max_delay
+
+    def _predation_candidates(self):
+        # Avlanma: her yunus bildiği en iyi çözümün etrafında, uzaklığıyla küçülen bir yarıçapta yeni konum dener.
+        radius = (1 - 2 / self.radius_factor) * np.linalg.norm(self.population - self.known, axis=1)
+        radius = np.maximum(radius, self.speed * 1e-3)
+        candidates = self.known + self._random_directions(self.population_size) * radius[:, None]
+        np.clip(candidates, self.low, self.high, out=candidates)
+        return candidates.astype(self.dtype, copy=False)
+
+    def _predation(self, candidates, scores):
+        # Yalnızca iyileşen yunuslar yer değiştirir; mesafe matrisinin yalnızca onların satırları güncellenir.
+        moved = np.flatnonzero(scores < self.scores)
+        self.population[moved] = candidates[moved]
+        self.scores[moved] = scores[moved]
+        update_sq_distances(self.sq_distances, self.population, moved)
+        if len(moved):
+            block = self._travel_times(self.sq_distances[moved])
+            self.travel_times[moved] = block
+            self.travel_times[:, moved] = block.T
+        improved = scores < self.known_scores
+        self.known[improved] = candidates[improved]
+        self.known_scores[improved] = scores[improved]
+
+    def _iterate(self):
+        # Arama, çağrı, alım ve avlanma aşamalarından oluşan bir iterasyon; arama ve avlanma adayları ayrı istenir.
+        profiler = self.profiler
+        if self.scores is None:
+            self._initialize((yield self.population))
+        # Aşamalar yield'den önce kapatılır; dışarıdaki değerlendirme süresi aşamalara yazılmaz.
+        with profiler.phase('search'):
+            points = self._search_points()
+        scores = yield points
+        with profiler.phase('search_select'):
+            self._search(points, scores)
+        with profiler.phase('call'):
+            self._call_and_receive()
+        with profiler.phase('predation'):
+            candidates = self._predation_candidates()
+        scores = yield candidates
+        with profiler.phase('predation_select'):
+            self._predation(candidates, scores)
+        best = np.argmin(self.known_scores)
+        if self.known_scores[best] < self.best_score:
+            self.best_solution = self.known[best].copy()
+            self.best_score = self.known_scores[best]
+        self.iteration += 1
+
+    def run(self, iterations, callback=None, termination=None, checkpoint=None):
+        """
+        En fazla iterations iterasyon çalıştırır.
+        callback: Her iterasyondan sonra callback(iterasyon, en iyi çözüm, en iyi skor) çağrılır.
+        termination: Erken durdurma için sonlandirma.Termination (iterations None ise zorunludur).
+        checkpoint: Her iterasyon sonunda durumu kaydeden kontrol_noktasi.Checkpointer.
+        """
+        for i in iteration_range(iterations, termination):
+            self.step()
+            self.profiler.iteration(self.iteration, best=float(self.best_score),
+                                    evaluations=self.objective.n_evaluations)
+            if callback is not None:
+                callback(self.iteration, self.best_solution, self.best_score)
+            if checkpoint is not None:
+                checkpoint.update(self)
+            if termination is not None and termination.should_stop(i + 1, self.best_score,
+                                                                   self.objective.n_evaluations):
+                break
+        return self.best_solution, self.best_score
+
+# DSO algoritmasının ana fonksiyonu
+def dolphin_swarm_optimization(objective, bounds, population_size, iterations, evaluator=None, n_dimensions=1,
+                               callback=None, rng=None, termination=None, checkpoint=None, **options):
+    swarm = DolphinSwarm(objective, bounds, population_size, n_dimensions, evaluator=evaluator, rng=rng, **options)
+    # Kontrol noktası varsa çalışma kaldığı iterasyondan sürdürülür.
+    if checkpoint is not None:
+        checkpoint.restore(swarm)
+    remaining = None if iterations is None else iterations - swarm.iteration
+    return swarm.run(remaining, callback, termination, checkpoint)
+
+if __name__ == "__main__":
+    # Parametreler
+    bounds = (-10, 10)  # Arama alanı
+    population_size = 30  # Popülasyon büyüklüğü
+    iterations = 100  # İterasyon sayısı
+
+    # Bilgi çıktısı
+    def report(i, best_solution, best_score):
+        print(f'Iterasyon {i}, En İyi Skor: {best_score}')
+
+    # DSO algoritmasını çalıştır
+    best_solution, best_score = dolphin_swarm_optimization(objective_function, bounds, population_size, iterations,
+                                                           callback=report)
+    print(f'En iyi çözüm: {best_solution}, Skor: {best_score}')
@@ -0,0 +1,242 @@
+'''
+Ateşböceği Algoritması (Firefly Algorithm), doğadaki ateşböceklerinin davranışlarından ilham alınarak geliştirilmiş bir optimizasyon algoritmasıdır. 
+Bu algoritma, özellikle sürekli optimizasyon problemlerinin çözümünde kullanılır. 
+Ateşböceklerinin birbirlerini çekici bulmalarının temel sebebi, ışık yaymalarıdır. 
+Algoritmanın temel prensibi de benzer şekilde, çözüm adaylarının birbirlerini çekmesi ve bu çekim kuvvetinin çözümlerin kalitesine bağlı olarak değişmesidir. 
+Daha iyi çözümler daha fazla "ışık" yayarak, diğer çözümleri kendilerine doğru çeker.
+
+
+--- Ateşböceği Algoritmasının Temel Adımları:
+
+1) Başlangıç Popülasyonunun Oluşturulması: 
+Rastgele seçilen çözümlerle bir başlangıç popülasyonu oluşturulur.
+
+
+
+2) Parlaklık Değerinin Hesaplanması: 
+Her bir ateşböceğinin parlaklığı (çekiciliği), çözümün kalitesine (uygunluk değerine) bağlıdır.
+
+
+
+3) Ateşböceklerinin Hareketi: 
+Her bir ateşböceği, kendisinden daha parlak olan diğer ateşböceklerine doğru hareket eder. 
+Bu hareket, çekicilik derecesine ve uzaklığa bağlıdır.
+
+
+
+4) Güncelleme ve Seçim: 
+Hareketler sonucunda elde edilen yeni çözümler değerlendirilir ve popülasyon güncellenir.
+
+
+5) Durma Kriteri: 
+Belirlenen iterasyon sayısına ulaşılana kadar veya başka bir durma kriteri karşılanana kadar 2-4 adımları tekrarlanır.
+
+'''
+import numpy as np
+
+from .cekirdekler import pairwise_sq_distances
+from .degerlendirme import as_batch_objective, vectorized
+from .hassasiyet import float_dtype
+from .izleme import NULL_PROFILER
+from .kontrol_noktasi import Checkpointable
+from .rastgele import make_rng
+from .sor_bildir import AskTell
+from .sonlandirma import iteration_range
+
+# Ateşböceği Algoritmasının Basit Bir Uygulaması
+
+def objective_function(x):
+    """Hedef fonksiyonumuz: Burada örnek olarak bir küresel fonksiyon kullanıyoruz.
+    x: Çözüm vektörü."""
+    return sum(x**2)
+
+def firefly_algorithm(objective, n_dim, n_fireflies=25, alpha=0.5, beta0=1.0, gamma=1.0, max_gen=100, evaluator=None,
+                      callback=None, profiler=None, termination=None, rng=None):
+    """
+    Ateşböceği Algoritması
+    objective: Hedef fonksiyon (skaler ya da @vectorized ile işaretlenmiş toplu fonksiyon).
+    n_dim: Çözümün boyutu.
+    n_fireflies: Ateşböceği sayısı.
+    alpha: Adım büyüklüğü.
+    beta0: Çekim kuvvetinin başlangıç değeri.
+    gamma: Işık emilim katsayısı.
+    max_gen: Maksimum iterasyon sayısı (None: durma termination'a bırakılır).
+    evaluator: Toplu değerlendirmeleri dağıtan değerlendirici (degerlendirme modülü).
+    callback: Her nesilden sonra callback(nesil, en iyi çözüm, en iyi değer) çağrılır.
+    profiler: Aşama süreleri için izleme.Profiler (None: izleme kapalı).
+    termination: Erken durdurma için sonlandirma.Termination.
+    rng: Tohum, numpy.random.Generator ya da rastgele.BufferedRandom (iç döngüdeki küçük çekilişler için önerilir).
+    """
+    objective = as_batch_objective(objective, evaluator=evaluator)
+    profiler = profiler or NULL_PROFILER
+    rng = make_rng(rng)
+    # Başlangıç popülasyonunu rastgele oluştur
+    population = rng.random((n_fireflies, n_dim))
+    
+    # Her ateşböceğinin ışık yoğunluğunu tek çağrıda hesapla
+    light_intensity = objective(population)
+    best_solution = population[np.argmin(light_intensity)]
+    best_intensity = light_intensity.min()
+    
+    # Ana döngü
+    for gen in iteration_range(max_gen, termination):
+        for i in range(n_fireflies):
+            for j in range(n_fireflies):
+                if light_intensity[i] > light_intensity[j]: # Daha parlaksa çekime uğra
+                    with profiler.phase('move'):
+                        r = np.linalg.norm(population[i] - population[j])
+                        beta = beta0 * np.exp(-gamma * r ** 2)
+                        population[i] += beta * (population[j] - population[i]) + alpha * (rng.random(n_dim) - 0.5)
+                    with profiler.phase('evaluate'):
+                        light_intensity[i] = objective.evaluate_one(population[i])
+                    if light_intensity[i] < best_intensity:
+                        best_solution = population[i]
+                        best_intensity = light_intensity[i]
+        profiler.iteration(gen + 1, best=float(best_intensity), evaluations=objective.n_evaluations)
+        if callback is not None:
+            callback(gen + 1, best_solution, best_intensity)
+        if termination is not None and termination.should_stop(gen + 1, best_intensity, objective.n_evaluations):
+            break
+    
+    return best_solution, best_intensity
+
+@vectorized
+def batch_objective_function(population):
+    """Hedef fonksiyonun toplu sürümü: (n, d) boyutlu popülasyonun her satırı için sum(x**2)."""
+    return np.sum(population ** 2, axis=1)
+
+class FireflySwarm(AskTell, Checkpointable):
+    checkpoint_arrays = ('population', 'light_intensity', 'best_solution')
+    checkpoint_values = ('best_intensity', 'iteration')
+
+    def __init__(self, objective, n_dim, n_fireflies=25, alpha=0.5, beta0=1.0, gamma=1.0, evaluator=None, rng=None,
+                 profiler=None, dtype=None):
+        """
+        Ateşböceği Algoritmasının vektörleştirilmiş sürümü.
+        Her nesilde tüm çiftler birlikte işlenir: kare mesafeler, parlaklık maskesi ve çekim (beta) matrisi
+        dizi olarak hesaplanır ve tüm ateşböcekleri tek bir matris çarpımıyla hareket ettirilir.
+        Hareketler nesil başına eşzamanlı uygulanır (özgün sürümde her hareket sırayla uygulanır).
+        objective: Hedef fonksiyon; nesil başına tüm popülasyon tek çağrıda değerlendirilir
+                   (None: değerlendirmeler ask/tell ile dışarıda yapılır).
+        rng: Tohum, numpy.random.Generator ya da rastgele.BufferedRandom.
+        profiler: Aşama süreleri için izleme.Profiler (None: izleme kapalı).
+        dtype: Popülasyon ve parlaklık dizilerinin tipi (ör. np.float32; varsayılan float64).
+        Diğer parametreler firefly_algorithm ile aynıdır.
+        """
+        self.objective = as_batch_objective(objective, evaluator=evaluator)
+        self.profiler = profiler or NULL_PROFILER
+        self.dtype = float_dtype(dtype)
+        self.n_dim = n_dim
+        self.alpha, self.beta0, self.gamma = alpha, beta0, gamma
+        self.rng = make_rng(rng)
+        self.iteration = 0
+        self.population = self.rng.random((n_fireflies, n_dim), dtype=self.dtype)
+        self.light_intensity = None
+        self.best_solution, self.best_intensity = np.empty(n_dim, dtype=self.dtype), np.inf
+        if objective is not None:
+            self._initialize(self.objective(self.population))
+
+    def _initialize(self, light_intensity):
+        self.light_intensity = light_intensity.astype(self.dtype, copy=False)
+        best = np.argmin(self.light_intensity)
+        self.best_solution, self.best_intensity = self.population[best].copy(), self.light_intensity[best]
+
+    def _iterate(self):
+        # Bir nesil: çekim matrisi, eşzamanlı hareket ve değerlendirme.
+        profiler, population = self.profiler, self.population
+        if self.light_intensity is None:
+            self._initialize((yield population))
+        with profiler.phase('attraction'):
+            # brighter[i, j]: j, i'den daha parlak (daha düşük hedef değeri) ise i, j'ye çekilir.
+            brighter = self.light_intensity[:, None] > self.light_intensity[None, :]
+            attraction = self.beta0 * np.exp(-self.gamma * pairwise_sq_distances(population)) * brighter
+        with profiler.phase('move'):
+            # Her i için sum_j beta_ij * (x_j - x_i) = (B @ X)_i - (sum_j beta_ij) * x_i
+            step = attraction @ population - attraction.sum(axis=1)[:, None] * population
+            moving = brighter.any(axis=1)
+            step[moving] += self.alpha * (self.rng.random((np.count_nonzero(moving), self.n_dim)) - 0.5)
+            population += step
+        self.light_intensity = (yield population).astype(self.dtype, copy=False)
+        best = np.argmin(self.light_intensity)
+        if self.light_intensity[best] < self.best_intensity:
+            self.best_solution, self.best_intensity = population[best].copy(), self.light_intensity[best]
+        self.iteration += 1
+
+    def run(self, max_gen, callback=None, termination=None, checkpoint=None):
+        """
+        En fazla max_gen nesil çalıştırır ve (en iyi çözüm, en iyi değer) döndürür.
+        callback: Her nesilden sonra callback(nesil, en iyi çözüm, en iyi değer) çağrılır.
+        termination: Erken durdurma için sonlandirma.Termination (max_gen None ise zorunludur).
+        checkpoint: Her nesil sonunda durumu kaydeden kontrol_noktasi.Checkpointer.
+        """
+        for gen in iteration_range(max_gen, termination):
+            self.step()
+            self.profiler.iteration(self.iteration, best=float(self.best_intensity),
+                                    evaluations=self.objective.n_evaluations)
+            if callback is not None:
+                callback(self.iteration, self.best_solution, self.best_intensity)
+            if checkpoint is not None:
+                checkpoint.update(self)
+            if termination is not None and termination.should_stop(gen + 1, self.best_intensity,
+                                                                   self.objective.n_evaluations):
+                break
+        return self.best_solution, self.best_intensity
+
+def firefly_algorithm_vectorized(objective, n_dim, n_fireflies=25, alpha=0.5, beta0=1.0, gamma=1.0, max_gen=100,
+                                 evaluator=None, callback=None, profiler=None, termination=None, rng=None,
+                                 checkpoint=None, dtype=None):
+    """
+    FireflySwarm ile vektörleştirilmiş Ateşböceği Algoritması.
+    checkpoint: kontrol_noktasi.Checkpointer; kontrol noktası varsa çalışma kaldığı nesilden sürdürülür.
+    Diğer parametreler FireflySwarm ve firefly_algorithm ile aynıdır.
+    """
+    swarm = FireflySwarm(objective, n_dim, n_fireflies, alpha, beta0, gamma, evaluator, rng, profiler, dtype)
+    if checkpoint is not None:
+        checkpoint.restore(swarm)
+    return swarm.run(None if max_gen is None else max_gen - swarm.iteration, callback, termination, checkpoint)
+
+if __name__ == "__main__":
+    # Algoritmayı çalıştır
+    n_dim = 5 # Çözümün boyutu
+    best_solution, best_intensity = firefly_algorithm(objective_function, n_dim)
+
+    print (best_solution, best_intensity)
+
+    # Vektörleştirilmiş sürüm
+    best_solution, best_intensity = firefly_algorithm_vectorized(batch_objective_function, n_dim)
+
+    print (best_solution, best_intensity)
+
+
+
+'''
+Ateşböceği Algoritması ile gerçekleştirdiğimiz optimizasyonun sonucunda, 5 boyutlu bir optimizasyon problemi için en iyi çözüm ve bu çözümün hedef fonksiyon değeri elde edildi. 
+Elde edilen en iyi çözüm vektörü [-0.0266033, 0.00660746, -0.00531903, -0.0199713, 0.00016617] şeklindedir ve bu çözümün hedef fonksiyon değeri 0.0011785664200261894 olarak hesaplanmıştır.
+Bu değer, seçtiğimiz hedef fonksiyon olan küresel fonksiyon (sum(x^2)) için elde edilebilecek minimum değerlere yakın bir sonuçtur ve
+algoritmanın optimizasyon problemine başarılı bir şekilde yakınsadığını gösterir.
+'''
+
+'''
+Yukarıdaki kodda, algoritmanın temel adımları şu şekilde gerçekleştirilmiştir:
+
+1) Başlangıç Popülasyonunun Oluşturulması: Rastgele seçilen çözümlerle bir başlangıç popülasyonu oluşturulmuştur.
+
+
+2) Parlaklık Değerinin Hesaplanması: Her bir ateşböceğinin parlaklığı, hedef fonksiyon kullanılarak hesaplanmıştır.
+
+
+3) Ateşböceklerinin Hareketi: Her bir ateşböceği, kendisinden daha parlak olan diğer ateşböceklerine doğru bir hareket gerçekleştirmiştir. 
+Bu hareket, belirlenen çekim kuvveti ve adım büyüklüğüne göre ayarlanmıştır.
+
+
+4) Güncelleme ve Seçim: Her iterasyonda, ateşböceklerinin konumları güncellenmiş ve en iyi çözüm takip edilmiştir.
+
+
+5) Durma Kriteri: Belirlenen maksimum iterasyon sayısına (bu örnekte 100) ulaşıldığında algoritma sonlandırılmıştır.
+
+
+Bu basit uygulama, Ateşböceği Algoritmasının temel prensiplerini ve bir optimizasyon problemine nasıl uygulanabileceğini göstermektedir. 
+Gerçek dünya problemlerinde, algoritmanın parametreleri (örneğin, alpha, beta0, gamma, ve n_fireflies) problemin doğasına ve karmaşıklığına göre ayarlanmalıdır.
+
+
+'''
\ No newline at end of file
@@ -0,0 +1,48 @@
+'''
+Sürekli optimizasyon algoritmalarını sınamak için standart test fonksiyonları.
+
+Fonksiyonlar toplu çalışır (@vectorized): (n, d) boyutlu aday matrisi alır, (n,) boyutlu değer döndürür.
+Hepsinin global minimumu 0'dır. TEST_FUNCTIONS her fonksiyonu önerilen arama aralığıyla birlikte verir;
+kıyaslama aracı ve komut satırı arayüzü fonksiyonları buradan adıyla seçer.
+'''
+
+import numpy as np
+
+from .degerlendirme import vectorized
+
+# Standart test fonksiyonları (toplu): (n, d) -> (n,). Hepsinin global minimumu 0'dır.
+@vectorized
+def sphere(X):
+    return np.sum(X ** 2, axis=1)
+
+
+@vectorized
+def rastrigin(X):
+    return 10 * X.shape[1] + np.sum(X ** 2 - 10 * np.cos(2 * np.pi * X), axis=1)
+
+
+@vectorized
+def rosenbrock(X):
+    return np.sum(100 * (X[:, 1:] - X[:, :-1] ** 2) ** 2 + (1 - X[:, :-1]) ** 2, axis=1)
+
+
+@vectorized
+def ackley(X):
+    d = X.shape[1]
+    return (-20 * np.exp(-0.2 * np.sqrt(np.sum(X ** 2, axis=1) / d))
+            - np.exp(np.sum(np.cos(2 * np.pi * X), axis=1) / d) + 20 + np.e)
+
+
+@vectorized
+def griewank(X):
+    i = np.sqrt(np.arange(1, X.shape[1] + 1))
+    return 1 + np.sum(X ** 2, axis=1) / 4000 - np.prod(np.cos(X / i), axis=1)
+
+
+TEST_FUNCTIONS = {
+    'sphere': (sphere, (-5.12, 5.12)),
+    'rastrigin': (rastrigin, (-5.12, 5.12)),
+    'rosenbrock': (rosenbrock, (-5.0, 10.0)),
+    'ackley': (ackley, (-32.768, 32.768)),
+    'griewank': (griewank, (-600.0, 600.0)),
+}
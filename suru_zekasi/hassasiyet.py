@@ -0,0 +1,84 @@
+'''
+Algoritma durum dizileri için sayısal hassasiyet (dtype) seçimi ve bellek muhasebesi.
+
+Tüm algoritmalar dtype parametresi alır (varsayılan float64). float32 seçildiğinde popülasyonlar, hızlar,
+kişisel en iyiler, feromon ve heuristik matrisleri ile uygunluk değerleri float32 tutulur; bellek kullanımı ve
+bellek bant genişliği yarıya iner. Karınca Kolonisinde tur indisleri için ayrıca index_dtype verilebilir
+(ör. 10k şehir için varsayılan int64 yerine int16; index_dtype(n) en küçük uygun tipi seçer).
+
+Amaç fonksiyonlarına adaylar durumun dtype'ıyla verilir. Rastgele sayılar float64 çekilip durum tipine
+dönüştürülür; bu yüzden aynı tohumla float32 ve float64 çalıştırmaları benzer ama birebir aynı olmayan
+sonuçlar üretir.
+
+Örnek:
+    swarm = ParticleSwarm(objective, 1000, 100, -5, 5, dtype=np.float32)
+    print(format_memory_report(memory_report(swarm)))
+'''
+
+import numpy as np
+
+PRECISIONS = {
+    'float64': np.float64,
+    'float32': np.float32,
+}
+
+
+def float_dtype(dtype=None):
+    """Durum dizilerinin kayan noktalı tipi: None için float64; ad ('float32') ya da numpy tipi kabul edilir."""
+    dtype = np.dtype(PRECISIONS.get(dtype, dtype) if dtype is not None else np.float64)
+    if dtype.kind != 'f':
+        raise ValueError(f"Durum dizileri kayan noktalı olmalıdır: {dtype}")
+    return dtype
+
+
+def index_dtype(n):
+    """0..n aralığındaki indisleri tutabilen en küçük işaretli tamsayı tipi (int16, int32 ya da int64)."""
+    for candidate in (np.int16, np.int32):
+        if n <= np.iinfo(candidate).max:
+            return np.dtype(candidate)
+    return np.dtype(np.int64)
+
+
+def _arrays(obj, prefix, seen):
+    # Nesnenin niteliklerindeki numpy dizileri; iç içe durum nesneleri (ör. SparsePheromone) de taranır.
+    for name, value in vars(obj).items():
+        path = prefix + name
+        if isinstance(value, np.ndarray):
+            yield path, value
+        elif hasattr(value, '__dict__') and not callable(value) and id(value) not in seen:
+            seen.add(id(value))
+            yield from _arrays(value, path + '.', seen)
+
+
+def memory_report(optimizer):
+    """
+    Algoritmanın durum dizilerinin bellek dökümü.
+    Başka bir dizinin görünümü olan diziler (base'i olan) ve paylaşılan bellekteki diziler tekrar sayılmaz.
+    Birden fazla nitelikten erişilen aynı dizi (ör. AntColonyOptimizer.candidates ve pheromone.candidates)
+    yalnızca ilk adıyla sayılır; diğer adlar alias alanında ilk adı gösterir.
+    Dönüş: Büyükten küçüğe sıralı {'name', 'shape', 'dtype', 'bytes', 'owned', 'alias'} kayıtları listesi.
+    """
+    report = []
+    first_names = {}  # id(dizi) -> diziyi ilk gösteren nitelik adı
+    for name, array in _arrays(optimizer, '', {id(optimizer)}):
+        alias = first_names.setdefault(id(array), name)
+        alias = None if alias == name else alias
+        report.append({'name': name, 'shape': array.shape, 'dtype': str(array.dtype), 'bytes': array.nbytes,
+                       'owned': array.base is None and alias is None, 'alias': alias})
+    report.sort(key=lambda entry: -entry['bytes'])
+    return report
+
+
+def total_bytes(optimizer):
+    """Algoritmanın sahip olduğu (görünüm olmayan) durum dizilerinin toplam bayt sayısı."""
+    return sum(entry['bytes'] for entry in memory_report(optimizer) if entry['owned'])
+
+
+def format_memory_report(report):
+    """memory_report çıktısını okunabilir bir tabloya çevirir."""
+    lines = [f"{'dizi':<28} {'boyut':<20} {'tip':<8} {'bayt':>14}"]
+    for entry in report:
+        note = '' if entry['owned'] else f" (= {entry['alias']})" if entry['alias'] else ' (görünüm)'
+        lines.append(f"{entry['name']:<28} {str(entry['shape']):<20} {entry['dtype']:<8} {entry['bytes']:>14,}{note}")
+    lines.append(f"{'toplam':<58} {sum(e['bytes'] for e in report if e['owned']):>14,}")
+    return '\n'.join(lines)
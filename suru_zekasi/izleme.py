@@ -0,0 +1,153 @@
+'''
+Optimizasyon algoritmaları için hafif izleme (profiling) arayüzü.
+
+Her algoritma bir profiler alır ve iterasyonlarını aşamalara böler (ör. ACO için construct/deposit/evaporate,
+Ateşböceği için move/evaluate). Profiler verilmezse NULL_PROFILER kullanılır: aşamaları hiçbir şey yapmayan
+tek bir bağlam yöneticisidir, bu yüzden izleme kapalıyken ek maliyet ihmal edilebilir düzeydedir.
+
+Profiler olayları yapılandırılmış bir akış olarak toplar:
+    {'type': 'phase', 'name': 'evaluate', 'stack': ('step', 'evaluate'), 'start': ..., 'duration': ...}
+    {'type': 'count', 'name': 'scouts', 'value': 3}
+    {'type': 'iteration', 'iteration': 5, 'best': 0.12, 'evaluations': 300}
+Olaylar sink ile (ör. bir metrik sistemine) anında iletilebilir, summary() ile özetlenebilir ya da
+Chrome trace (chrome://tracing, Perfetto) ve flame graph (flamegraph.pl, speedscope) biçimlerinde yazılabilir.
+
+Örnek:
+    profiler = Profiler()
+    swarm = ParticleSwarm(objective, 30, 10, -5, 5, profiler=profiler)
+    swarm.run(100)
+    print(profiler.summary())
+    profiler.write_chrome_trace('pso_trace.json')
+'''
+
+import json
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+
+
+class NullProfiler:
+    """Hiçbir şey kaydetmeyen profiler; izleme kapalıyken kullanılır."""
+    enabled = False
+    _null_phase = nullcontext()
+
+    def phase(self, name):
+        return self._null_phase
+
+    def count(self, name, value=1):
+        pass
+
+    def iteration(self, iteration, **values):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class _Phase:
+    # Profiler.phase bağlam yöneticisi; süreyi ölçer ve alt aşamaların süresini üst aşamadan düşer.
+    __slots__ = ('profiler', 'name', 'start', 'children')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.children = 0
+        self.profiler._stack.append(self)
+        self.start = self.profiler.clock()
+        return self
+
+    def __exit__(self, *exc_info):
+        end = self.profiler.clock()
+        profiler = self.profiler
+        stack = tuple(phase.name for phase in profiler._stack)
+        profiler._stack.pop()
+        duration = end - self.start
+        if profiler._stack:
+            profiler._stack[-1].children += duration
+        profiler._record({'type': 'phase', 'name': self.name, 'stack': stack, 'start': self.start,
+                          'duration': duration, 'self': duration - self.children})
+
+
+class Profiler(NullProfiler):
+    enabled = True
+
+    def __init__(self, sink=None, keep_events=True, clock=time.perf_counter):
+        """
+        Aşama sürelerini, sayaçları ve iterasyon olaylarını toplar.
+        sink: Her olay için sink(olay) çağrılır (ör. metrik sistemine gönderim); None ise çağrılmaz.
+        keep_events: Olayların bellekte tutulup tutulmayacağı (izleme dosyaları için gereklidir).
+        clock: Saniye cinsinden zaman döndüren saat.
+        """
+        self.sink = sink
+        self.keep_events = keep_events
+        self.clock = clock
+        self.events = []
+        self.totals = defaultdict(float)  # Aşama adı -> toplam süre
+        self.calls = defaultdict(int)  # Aşama adı -> çağrı sayısı
+        self.counters = defaultdict(int)
+        self._stack = []
+        self.origin = clock()
+
+    def _record(self, event):
+        if event['type'] == 'phase':
+            self.totals[event['name']] += event['duration']
+            self.calls[event['name']] += 1
+        if self.keep_events:
+            self.events.append(event)
+        if self.sink is not None:
+            self.sink(event)
+
+    def phase(self, name):
+        """with profiler.phase('evaluate'): ... bloğunun süresini ölçer; aşamalar iç içe kullanılabilir."""
+        return _Phase(self, name)
+
+    def count(self, name, value=1):
+        self.counters[name] += value
+        self._record({'type': 'count', 'name': name, 'value': value, 'time': self.clock()})
+
+    def iteration(self, iteration, **values):
+        """İterasyon sonu olayı (ör. en iyi değer ve toplam değerlendirme sayısı)."""
+        self._record({'type': 'iteration', 'iteration': iteration, 'time': self.clock(), **values})
+
+    def summary(self):
+        """Aşama başına çağrı sayısı, toplam ve ortalama süre ile sayaçları döndürür."""
+        phases = {name: {'calls': self.calls[name], 'total': total, 'mean': total / self.calls[name]}
+                  for name, total in sorted(self.totals.items(), key=lambda item: -item[1])}
+        return {'phases': phases, 'counters': dict(self.counters)}
+
+    def chrome_trace(self):
+        """Olayları Chrome trace biçimine (mikrosaniye) çevirir."""
+        trace = []
+        totals = defaultdict(int)  # Sayaçların o olaya kadarki toplamı (counters yalnızca son değeri tutar)
+        for event in self.events:
+            if event['type'] == 'phase':
+                trace.append({'name': event['name'], 'ph': 'X', 'pid': 0, 'tid': 0,
+                              'ts': (event['start'] - self.origin) * 1e6, 'dur': event['duration'] * 1e6})
+            elif event['type'] == 'count':
+                totals[event['name']] += event['value']
+                trace.append({'name': event['name'], 'ph': 'C', 'pid': 0, 'tid': 0,
+                              'ts': (event['time'] - self.origin) * 1e6,
+                              'args': {event['name']: totals[event['name']]}})
+            else:
+                args = {key: value for key, value in event.items() if isinstance(value, (int, float))}
+                trace.append({'name': 'iteration', 'ph': 'i', 's': 'p', 'pid': 0, 'tid': 0,
+                              'ts': (event['time'] - self.origin) * 1e6, 'args': args})
+        return {'traceEvents': trace}
+
+    def collapsed_stacks(self):
+        """Flame graph için 'üst;alt öz_süre_mikrosaniye' satırları (aynı yığınlar toplanır)."""
+        stacks = defaultdict(float)
+        for event in self.events:
+            if event['type'] == 'phase':
+                stacks[';'.join(event['stack'])] += event['self']
+        return [f'{stack} {round(duration * 1e6)}' for stack, duration in stacks.items()]
+
+    def write_chrome_trace(self, path):
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(self.chrome_trace(), file)
+
+    def write_collapsed_stacks(self, path):
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write('\n'.join(self.collapsed_stacks()) + '\n')
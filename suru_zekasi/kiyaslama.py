@@ -0,0 +1,279 @@
+'''
+Altı algoritma için ortak kıyaslama (benchmark) aracı.
+
+Sürekli optimizasyon algoritmaları (PSO, Ateşböceği, Arı Kolonisi, Yunus Sürüsü, Yapay Bağışıklık Sistemi)
+standart test fonksiyonlarında (Sphere, Rastrigin, Rosenbrock, Ackley, Griewank) farklı boyutlarda,
+Karınca Kolonisi ise rastgele üretilmiş TSP örneklerinde çalıştırılır. Her çalıştırma için
+duvar saati süresi, saniyedeki amaç fonksiyonu değerlendirmesi, en yüksek bellek kullanımı (peak RSS),
+algoritma durum dizilerinin bellek kullanımı ve değerlendirme sayısına göre en iyi değer kaydedilir.
+--precisions ile aynı durumlar farklı sayısal hassasiyetlerde (float64, float32) çalıştırılabilir.
+Sonuçlar commit'ler arasında karşılaştırılabilmesi için JSON olarak yazılır.
+
+Kullanım:
+    python -m suru_zekasi.kiyaslama --output sonuc.json
+    python -m suru_zekasi.kiyaslama --quick --output sonuc.json --compare onceki.json
+    python -m suru_zekasi.kiyaslama --quick --precisions float64 float32
+'''
+
+import argparse
+import importlib
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from . import ALGORITHMS
+from .degerlendirme import BatchObjective, vectorized
+from .fonksiyonlar import TEST_FUNCTIONS
+from .hassasiyet import PRECISIONS, index_dtype, total_bytes
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_algorithm(name):
+    """Algoritma alt modülünü (ör. 'pso' için suru_zekasi.pso) yükler."""
+    if name not in ALGORITHMS:
+        raise ValueError(f"Bilinmeyen algoritma: {name}")
+    return importlib.import_module(f'.{name}', __package__)
+
+
+class RecordingObjective(BatchObjective):
+    """Her iyileşmede (değerlendirme sayısı, en iyi değer) çiftini kaydeden BatchObjective."""
+    def __init__(self, function):
+        super().__init__(function)
+        self.best = np.inf
+        self.trace = []
+
+    def __call__(self, population):
+        values = super().__call__(population)
+        if len(values) and values.min() < self.best:
+            self.best = float(values.min())
+            self.trace.append((self.n_evaluations, self.best))
+        return values
+
+
+# Algoritma başına çalıştırıcılar: değerlendirme bütçesi her algoritmanın iterasyon sayısına çevrilir.
+# Durum belleğinin ölçülebilmesi için çalıştırılan algoritma nesnesi döndürülür.
+def run_pso(objective, bounds, dim, budget, seed, dtype=None):
+    module = load_algorithm('pso')
+    swarm = module.ParticleSwarm(objective, 30, dim, bounds[0], bounds[1], rng=seed, dtype=dtype)
+    swarm.run(max(budget // 30 - 1, 1))
+    return swarm
+
+
+def run_firefly(objective, bounds, dim, budget, seed, dtype=None):
+    module = load_algorithm('firefly')
+    swarm = module.FireflySwarm(objective, dim, n_fireflies=30, rng=seed, dtype=dtype)
+    swarm.run(max(budget // 30 - 1, 1))
+    return swarm
+
+
+def run_bee_colony(objective, bounds, dim, budget, seed, dtype=None):
+    module = load_algorithm('bee_colony')
+    colony = module.BeeColony(objective, bounds, 30, dim, rng=seed, dtype=dtype)
+    colony.run(max(budget // 60, 1))
+    return colony
+
+
+def run_dolphin(objective, bounds, dim, budget, seed, dtype=None):
+    module = load_algorithm('dolphin')
+    # İterasyon başına: arama (30 * 3 ses * 3 adım) + avlanma (30) değerlendirmesi
+    swarm = module.DolphinSwarm(objective, bounds, 30, dim, rng=seed, dtype=dtype)
+    swarm.run(max(budget // 300, 1))
+    return swarm
+
+
+def run_ais(objective, bounds, dim, budget, seed, dtype=None):
+    module = load_algorithm('ais')
+    low, high = bounds
+
+    # AIS afiniteyi büyütür ve [0, 1] genlerle çalışır: genler sınırlara ölçeklenir, afinite 1 / (1 + f) olur.
+    @vectorized
+    def affinity(genes):
+        return 1 / (1 + objective(low + genes * (high - low)))
+
+    system = module.ClonalSelection(100, dim, clone_factor=10, mutation_rate=0.1, affinity=affinity, rng=seed,
+                                    dtype=dtype)
+    system.run(max(budget // 100 - 1, 1))
+    return system
+
+
+CONTINUOUS_RUNNERS = {
+    'pso': run_pso,
+    'firefly': run_firefly,
+    'bee_colony': run_bee_colony,
+    'dolphin': run_dolphin,
+    'ais': run_ais,
+}
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 2 ** 10  # macOS bayt, Linux KB döndürür
+
+
+def run_continuous_case(algorithm, function, dim, budget, seed, precision='float64'):
+    objective = RecordingObjective(TEST_FUNCTIONS[function][0])
+    start = time.perf_counter()
+    optimizer = CONTINUOUS_RUNNERS[algorithm](objective, TEST_FUNCTIONS[function][1], dim, budget, seed,
+                                              PRECISIONS[precision])
+    wall_time = time.perf_counter() - start
+    return {
+        'algorithm': algorithm, 'problem': function, 'size': dim, 'seed': seed, 'precision': precision,
+        'wall_time': wall_time,
+        'evaluations': objective.n_evaluations,
+        'evaluations_per_second': objective.n_evaluations / wall_time,
+        'best_value': objective.best,
+        'peak_rss_mb': peak_rss_mb(),
+        'state_bytes': total_bytes(optimizer),
+        'trace': objective.trace,
+    }
+
+
+def run_tsp_case(n_cities, iterations, seed, precision='float64', n_ants=10):
+    module = load_algorithm('aco')
+    coordinates = np.random.default_rng(seed).random((n_cities, 2))
+    dtype = PRECISIONS[precision]
+    # float64 dışındaki hassasiyetlerde tur indisleri şehir sayısına yeten en küçük tamsayı tipinde tutulur.
+    indices = None if precision == 'float64' else index_dtype(n_cities)
+    start = time.perf_counter()
+    if n_cities <= 1000:
+        distances = np.sqrt(((coordinates[:, None] - coordinates[None]) ** 2).sum(axis=-1)).astype(dtype, copy=False)
+        aco = module.AntColonyOptimizer(distances, n_ants, 3, iterations, decay=0.9, beta=2,
+                                        n_candidates=20 if n_cities > 200 else None, rng=seed, dtype=dtype,
+                                        index_dtype=indices)
+    else:
+        # Büyük örneklerde yoğun matris yerine koordinatlardan hesaplanan mesafeler ve seyrek feromon
+        aco = module.AntColonyOptimizer(module.EuclideanDistances(coordinates, dtype=dtype), n_ants, 3, iterations,
+                                        decay=0.9, beta=2, n_candidates=10, rng=seed, dtype=dtype,
+                                        index_dtype=indices)
+    trace = []
+
+    def record(iteration, path, cost):
+        if not trace or cost < trace[-1][1]:
+            trace.append((iteration * n_ants, float(cost)))
+
+    _, best = aco.run(callback=record)
+    best = float(best)
+    wall_time = time.perf_counter() - start
+    return {
+        'algorithm': 'aco', 'problem': 'tsp', 'size': n_cities, 'seed': seed, 'precision': precision,
+        'wall_time': wall_time,
+        'evaluations': iterations * n_ants,  # Oluşturulan tur sayısı
+        'evaluations_per_second': iterations * n_ants / wall_time,
+        'best_value': best,
+        'peak_rss_mb': peak_rss_mb(),
+        'state_bytes': total_bytes(aco),
+        'trace': trace,
+    }
+
+
+def _run_in_subprocess(case):
+    # Her durum yeni bir süreçte çalıştırılır; böylece peak RSS yalnızca o duruma aittir.
+    kind, args = case
+    return run_tsp_case(*args) if kind == 'tsp' else run_continuous_case(*args)
+
+
+def run_benchmarks(algorithms, functions, dims, tsp_sizes, budget, tsp_iterations, seeds, isolate=True, log=print,
+                   precisions=('float64',)):
+    cases = []
+    for seed in seeds:
+        for algorithm in algorithms:
+            for precision in precisions:
+                if algorithm == 'aco':
+                    cases += [('tsp', (n, tsp_iterations, seed, precision)) for n in tsp_sizes]
+                else:
+                    cases += [('continuous', (algorithm, function, dim, budget, seed, precision))
+                              for function in functions for dim in dims]
+    results = []
+    context = multiprocessing.get_context('spawn')
+    for case in cases:
+        if isolate:
+            with context.Pool(1) as pool:
+                result = pool.apply(_run_in_subprocess, (case,))
+        else:
+            result = _run_in_subprocess(case)
+        log(f"{result['algorithm']:>10} {result['problem']:>10} {result['size']:>6} {result['precision']:>7} "
+            f"süre={result['wall_time']:.3f}s değ/s={result['evaluations_per_second']:.0f} "
+            f"en iyi={result['best_value']:.6g} rss={result['peak_rss_mb']:.0f}MB "
+            f"durum={result['state_bytes'] / 2 ** 20:.2f}MB")
+        results.append(result)
+    return results
+
+
+def metadata(config):
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=HERE, capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = None
+    return {
+        'commit': commit or None,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'config': config,
+    }
+
+
+def compare(old_results, new_results):
+    """
+    İki sonuç kümesini (algoritma, problem, boyut, tohum, hassasiyet) anahtarıyla eşleştirip süre ve değer
+    oranlarını yazar. Hassasiyet alanı olmayan eski sonuçlar float64 sayılır.
+    """
+    def key(result):
+        return (result['algorithm'], result['problem'], result['size'], result['seed'],
+                result.get('precision', 'float64'))
+
+    old = {key(result): result for result in old_results}
+    for result in new_results:
+        previous = old.get(key(result))
+        if previous is None:
+            continue
+        print(f"{result['algorithm']:>10} {result['problem']:>10} {result['size']:>6} {key(result)[-1]:>7} "
+              f"süre x{result['wall_time'] / previous['wall_time']:.2f} "
+              f"en iyi: {previous['best_value']:.6g} -> {result['best_value']:.6g}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Sürü zekâsı algoritmaları için kıyaslama aracı')
+    parser.add_argument('--algorithms', nargs='+', default=list(ALGORITHMS), choices=list(ALGORITHMS))
+    parser.add_argument('--functions', nargs='+', default=list(TEST_FUNCTIONS), choices=list(TEST_FUNCTIONS))
+    parser.add_argument('--dims', nargs='+', type=int, default=[10, 100, 1000])
+    parser.add_argument('--tsp-sizes', nargs='+', type=int, default=[100, 1000, 10000])
+    parser.add_argument('--budget', type=int, default=10000, help='Sürekli problemlerde değerlendirme bütçesi')
+    parser.add_argument('--tsp-iterations', type=int, default=5)
+    parser.add_argument('--seeds', nargs='+', type=int, default=[0])
+    parser.add_argument('--precisions', nargs='+', default=['float64'], choices=list(PRECISIONS),
+                        help='Durum dizilerinin sayısal hassasiyetleri')
+    parser.add_argument('--quick', action='store_true', help='Yalnızca d=10 ve 100 şehirlik TSP')
+    parser.add_argument('--no-isolate', action='store_true', help='Durumları ayrı süreçlerde çalıştırma')
+    parser.add_argument('--output', help='Sonuçların yazılacağı JSON dosyası')
+    parser.add_argument('--compare', help='Karşılaştırılacak önceki JSON sonuç dosyası')
+    args = parser.parse_args(argv)
+    if args.quick:
+        args.dims, args.tsp_sizes = [10], [100]
+
+    config = {name: value for name, value in vars(args).items() if name not in ('output', 'compare')}
+    results = run_benchmarks(args.algorithms, args.functions, args.dims, args.tsp_sizes, args.budget,
+                             args.tsp_iterations, args.seeds, isolate=not args.no_isolate,
+                             precisions=args.precisions)
+    report = {'meta': metadata(config), 'results': results}
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=1)
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            compare(json.load(file)['results'], results)
+    return report
+
+
+if __name__ == "__main__":
+    main()
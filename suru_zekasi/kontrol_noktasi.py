@@ -0,0 +1,140 @@
+'''
+Optimizasyon durumunun diske kaydedilmesi (checkpoint) ve kaldığı yerden sürdürülmesi (resume).
+
+Bir kontrol noktası bir dizindir: her durum dizisi ayrı bir .npy dosyasına, skaler değerler (en iyi değer,
+iterasyon sayacı, rastgele sayı üretecinin bit üreteci durumu, değerlendirme sayısı) state.json dosyasına yazılır.
+Diziler yüklenirken bellek eşlemeli (np.load(mmap_mode=...)) açılır; 10k x 10k'lık bir feromon matrisi
+belleğe ayrıca okunmadan doğrudan algoritmanın dizisine kopyalanır. Yeni kontrol noktası önce geçici bir
+dizine yazılır ve ardından eskisinin yerine taşınır; yazma sırasında kesilen bir çalışma eski kontrol
+noktasını bozmaz.
+
+Algoritma sınıfları Checkpointable'dan türer ve kaydedilecek dizi ve değer niteliklerinin adlarını bildirir.
+Sürdürülen bir çalışma, kesintisiz çalışmayla bit düzeyinde aynı sonucu üretir.
+
+Örnek:
+    checkpointer = Checkpointer('pso_durum', interval=100)
+    swarm = ParticleSwarm(objective, 30, 10, -5, 5, rng=0)
+    checkpointer.restore(swarm)  # Kontrol noktası varsa kaldığı yerden devam eder
+    swarm.run(10000 - swarm.iteration, checkpoint=checkpointer)
+'''
+
+import json
+import os
+import shutil
+
+import numpy as np
+
+from .rastgele import get_rng_state, set_rng_state
+
+STATE_FILE = 'state.json'
+
+
+def _to_json(value):
+    # numpy skalerleri ve küçük diziler JSON'a Python değerleri olarak yazılır.
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"JSON'a yazılamayan değer: {type(value)}")
+
+
+def save_checkpoint(directory, arrays, values):
+    """
+    arrays: Ad -> numpy dizisi (her biri directory/ad.npy dosyasına yazılır).
+    values: JSON'a yazılabilir skaler değerler.
+    """
+    directory = os.path.abspath(directory)
+    temporary = directory + '.tmp'
+    shutil.rmtree(temporary, ignore_errors=True)
+    os.makedirs(temporary)
+    for name, array in arrays.items():
+        np.save(os.path.join(temporary, name + '.npy'), array)
+    with open(os.path.join(temporary, STATE_FILE), 'w', encoding='utf-8') as file:
+        json.dump({'arrays': sorted(arrays), 'values': values}, file, default=_to_json)
+    # Eski kontrol noktası ancak yenisi tamamen yazıldıktan sonra değiştirilir.
+    previous = directory + '.old'
+    if os.path.exists(directory):
+        shutil.rmtree(previous, ignore_errors=True)
+        os.replace(directory, previous)
+    os.replace(temporary, directory)
+    shutil.rmtree(previous, ignore_errors=True)
+
+
+def load_checkpoint(directory, mmap_mode='r'):
+    """Kontrol noktasını okur; diziler bellek eşlemeli açılır. Dönüş: (diziler, değerler)."""
+    with open(os.path.join(directory, STATE_FILE), encoding='utf-8') as file:
+        state = json.load(file)
+    arrays = {name: np.load(os.path.join(directory, name + '.npy'), mmap_mode=mmap_mode)
+              for name in state['arrays']}
+    return arrays, state['values']
+
+
+def checkpoint_exists(directory):
+    return os.path.exists(os.path.join(directory, STATE_FILE))
+
+
+class Checkpointable:
+    """
+    Durumu kaydedilebilen algoritmalar için temel sınıf.
+    checkpoint_arrays: Durum dizilerinin nitelik adları.
+    checkpoint_values: Skaler durum değerlerinin nitelik adları.
+    Rastgele sayı üreteci (self.rng; Generator ya da BufferedRandom) ve amaç fonksiyonunun değerlendirme sayacı da kaydedilir.
+    """
+    checkpoint_arrays = ()
+    checkpoint_values = ()
+
+    def get_state(self):
+        arrays = {name: getattr(self, name) for name in self.checkpoint_arrays}
+        values = {name: getattr(self, name) for name in self.checkpoint_values}
+        values['rng'] = get_rng_state(self.rng)
+        objective = getattr(self, 'objective', None)
+        if objective is not None:
+            values['n_evaluations'] = objective.n_evaluations
+        return arrays, values
+
+    def set_state(self, arrays, values):
+        for name, array in arrays.items():
+            current = getattr(self, name)
+            if isinstance(current, np.ndarray) and current.shape == array.shape:
+                current[...] = array  # Yerinde kopyalama: paylaşılan ya da eşlemeli diziler korunur
+            else:
+                setattr(self, name, np.array(array))
+        for name in self.checkpoint_values:
+            setattr(self, name, values[name])
+        set_rng_state(self.rng, values['rng'])
+        if 'n_evaluations' in values:
+            self.objective.n_evaluations = values['n_evaluations']
+        self._restored()
+
+    def _restored(self):
+        # Durumdan türetilen yardımcı diziler gerekiyorsa alt sınıflarda yeniden oluşturulur.
+        pass
+
+    def save(self, directory):
+        save_checkpoint(directory, *self.get_state())
+
+    def restore(self, directory):
+        self.set_state(*load_checkpoint(directory))
+
+
+class Checkpointer:
+    def __init__(self, directory, interval=1):
+        """
+        Algoritmaların run döngüsünde her interval iterasyonda bir kontrol noktası yazar.
+        directory: Kontrol noktası dizini (her kayıtta üzerine yazılır).
+        interval: Kayıtlar arasındaki iterasyon sayısı.
+        """
+        self.directory = directory
+        self.interval = interval
+
+    def update(self, optimizer):
+        """Her iterasyonun sonunda çağrılır; zamanı geldiyse durumu kaydeder."""
+        if optimizer.iteration % self.interval == 0:
+            optimizer.save(self.directory)
+
+    def restore(self, optimizer):
+        """Kontrol noktası varsa optimizer'ın durumunu ondan yükler ve True döndürür."""
+        if not checkpoint_exists(self.directory):
+            return False
+        optimizer.restore(self.directory)
+        return True
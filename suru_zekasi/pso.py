@@ -0,0 +1,485 @@
+'''
+PSO'nun Çalışma Prensibi
+1. Başlangıç Durumu: Algoritma, her biri bir çözümü temsil eden rastgele konumlandırılmış parçacıklarla başlar.
+Her parçacık, bir hız vektörüne sahiptir ve bu, parçacığın çözüm alanındaki hareket yönünü ve hızını belirler.
+
+2. Değerlendirme: Her bir parçacığın konumu, bir amaç (fitness) fonksiyonu kullanılarak değerlendirilir.
+ Bu fonksiyon, parçacığın mevcut çözümünün kalitesini ölçer.
+
+ 
+
+3. Kişisel ve Global En İyi Değerler: Her parçacık, kendi deneyimindeki en iyi konumu (kişisel en iyi) ve sürüdeki tüm parçacıklar arasındaki en iyi konumu (global en iyi) saklar.
+
+4. Hız ve Konum Güncellemesi: Her iterasyonda, parçacıkların hızları ve konumları, hem kendi kişisel en iyi konumlarına hem de sürünün global en iyi konumuna doğru bir yönelim göstererek güncellenir. Bu, parçacıkların potansiyel olarak daha iyi çözümlere doğru "öğrenmelerini" ve "hareket etmelerini" sağlar.
+
+5. Sonlanma Kriteri: Algoritma, belirlenen bir iterasyon sayısına ulaştığında veya başka bir sonlanma kriteri karşılandığında sona erer.
+
+'''
+
+'''
+PSO, mühendislikten finansa, yapay zekâ uygulamalarından işletme problemlerine kadar geniş bir yelpazede optimizasyon problemlerinde kullanılabilir. 
+Şimdi, basit bir PSO kod örneği üzerinden bu algoritmanın nasıl implemente edilebileceğini göstereceğim.
+
+PSO algoritmasının basit bir Python implementasyonu sonucunda, amaç fonksiyonu olarak tanımladığımız ( x**2 + y**2) fonksiyonunu minimizasyon probleminde,
+ global en iyi çözümün konumu yaklaşık olarak [4.27 x 10**-5, -1.59x10**-4]   olarak bulunmuştur ve bu konumdaki amaç fonksiyonunun değeri 2.72 x 10**-8'dir.
+ Bu sonuç, algoritmanın başarılı bir şekilde çalıştığını ve global minimuma çok yakın bir noktada sonlandığını göstermektedir. 
+ Bu örnekte, algoritmanın parametreleri (atalet ağırlığı, kişisel ve sosyal katsayılar, iterasyon sayısı) basit tutulmuş olup, farklı problemlere ve durumlara göre bu parametrelerin ayarlanması gerekebilir
+
+'''
+
+
+
+
+# PSO'nun basit bir Python implementasyonu
+from collections import deque
+
+import numpy as np
+
+from .degerlendirme import as_batch_objective, vectorized
+from .hassasiyet import float_dtype
+from .izleme import NULL_PROFILER
+from .kontrol_noktasi import Checkpointable
+from .rastgele import make_rng
+from .sor_bildir import AskTell, SteadyState
+from .sonlandirma import iteration_range
+
+# Amaç fonksiyonu: Sphere fonksiyonu - x^2 + y^2 minimizasyonu
+@vectorized
+def objective_function(X):
+    return np.sum(X ** 2, axis=1)
+
+
+def neighbourhood_indices(n_particles, topology):
+    """
+    Her parçacığın komşuluğundaki (kendisi dahil) parçacık indisleri.
+    topology: 'ring' (iki yan komşu) ya da 'von_neumann' (simit ızgarada dört komşu).
+    Dönüş: (n_particles, komşu sayısı) boyutlu indis matrisi.
+    """
+    idx = np.arange(n_particles)
+    if topology == 'ring':
+        return np.stack([(idx - 1) % n_particles, idx, (idx + 1) % n_particles], axis=1)
+    if topology == 'von_neumann':
+        # Satır sayısı, n_particles'ı bölen ve karekökünü aşmayan en büyük sayıdır.
+        rows = max(r for r in range(1, int(np.sqrt(n_particles)) + 1) if n_particles % r == 0)
+        cols = n_particles // rows
+        if cols > 2 * rows:
+            # Böyle bir ızgara fazla uzunsa (ör. asal n_particles için tek satır: yukarı/aşağı komşular
+            # parçacığın kendisi olur ve topoloji halkaya döner) ceil(sqrt(n)) sütunlu sarmal ızgara kullanılır:
+            # satırlar birbirinin devamıdır, komşular i +- 1 ve i +- sütun sayısıdır (mod n).
+            cols = int(np.ceil(np.sqrt(n_particles)))
+            return np.stack([idx, (idx - cols) % n_particles, (idx + cols) % n_particles,
+                             (idx - 1) % n_particles, (idx + 1) % n_particles], axis=1)
+        row, col = np.divmod(idx, cols)
+        return np.stack([idx,
+                         ((row - 1) % rows) * cols + col, ((row + 1) % rows) * cols + col,
+                         row * cols + (col - 1) % cols, row * cols + (col + 1) % cols], axis=1)
+    raise ValueError(f"Bilinmeyen topoloji: {topology}")
+
+
+class ParticleSwarm(AskTell, Checkpointable):
+    checkpoint_arrays = ('X', 'V', 'P_best', 'P_best_val', 'G_best')
+    checkpoint_values = ('G_best_val', 'iteration')
+
+    def __init__(self, objective, n_particles, n_dimensions, x_min, x_max, v_max=None, w=0.7, c1=2.05, c2=2.05,
+                 topology='gbest', boundary='clip', evaluator=None, rng=None, profiler=None, dtype=None):
+        """
+        Tekrar kullanılabilir PSO motoru. Konumlar, hızlar ve kişisel en iyiler önceden ayrılmış dizilerde
+        tutulur ve her iterasyonda yerinde (out=) güncellenir; iterasyon başına (n x d) geçici dizi oluşmaz.
+        objective: Amaç fonksiyonu (@vectorized toplu fonksiyon ya da skaler fonksiyon); None ise değerlendirmeler
+                   ask/tell ile dışarıda yapılır ve başlangıç popülasyonu da ilk ask ile istenir.
+        n_particles: Parçacık sayısı.
+        n_dimensions: Problemin boyutu.
+        x_min, x_max: Arama uzayının sınırları (skaler ya da boyut başına dizi).
+        v_max: Hız sınırı (varsayılan: (x_max - x_min) * 0.2).
+        w: Atalet ağırlığı.
+        c1, c2: Kişisel ve sosyal katsayılar.
+        topology: 'gbest' (tüm sürü), 'ring' ya da 'von_neumann' komşuluğu.
+        boundary: Sınır dışına çıkan parçacıklar için 'clip' (sınıra sabitle), 'reflect' (sınırdan yansıt
+                  ve hızı ters çevir) ya da 'absorb' (sınıra sabitle ve hızı sıfırla).
+        evaluator: Toplu değerlendirmeleri dağıtan değerlendirici (degerlendirme modülü).
+        rng: Tohum, numpy.random.Generator ya da rastgele.BufferedRandom.
+        profiler: Aşama süreleri için izleme.Profiler (None: izleme kapalı).
+        dtype: Konum, hız ve en iyilerin tipi (ör. np.float32; varsayılan float64, bkz. hassasiyet modülü).
+        """
+        self.objective = as_batch_objective(objective, evaluator=evaluator)
+        self.profiler = profiler or NULL_PROFILER
+        self.dtype = float_dtype(dtype)
+        self.n_particles = n_particles
+        self.n_dimensions = n_dimensions
+        self.x_min = np.broadcast_to(np.asarray(x_min, dtype=float), (n_dimensions,))
+        self.x_max = np.broadcast_to(np.asarray(x_max, dtype=float), (n_dimensions,))
+        self.v_max = (self.x_max - self.x_min) * 0.2 if v_max is None else np.broadcast_to(v_max, (n_dimensions,))
+        self.w, self.c1, self.c2 = w, c1, c2
+        if boundary not in ('clip', 'reflect', 'absorb'):
+            raise ValueError(f"Bilinmeyen sınır yöntemi: {boundary}")
+        self.boundary = boundary
+        self.topology = topology
+        self.neighbours = None if topology == 'gbest' else neighbourhood_indices(n_particles, topology)
+        self.rng = make_rng(rng)
+        self.iteration = 0
+
+        shape = (n_particles, n_dimensions)
+        # Parçacıkların başlangıç konumları ve hızları
+        self.X = self.rng.uniform(self.x_min, self.x_max, size=shape).astype(self.dtype, copy=False)
+        self.V = self.rng.uniform(-self.v_max, self.v_max, size=shape).astype(self.dtype, copy=False)
+        # Kişisel en iyi konumlar ve değerler (değerler başlangıç popülasyonu değerlendirilince atanır)
+        self.P_best = self.X.copy()
+        self.P_best_val = None
+        # Global en iyi konum ve değer
+        self.G_best = np.empty(n_dimensions, dtype=self.dtype)
+        self.G_best_val = np.inf
+        # Yeniden kullanılan çalışma dizileri
+        self._random = np.empty(shape, dtype=self.dtype)
+        self._work = np.empty(shape, dtype=self.dtype)
+        self._social = self.G_best if self.neighbours is None else np.empty(shape, dtype=self.dtype)
+        if objective is not None:
+            self._initialize(self.objective(self.X))
+
+    def _initialize(self, values):
+        # Başlangıç popülasyonunun değerleriyle kişisel, global ve komşuluk en iyileri
+        self.P_best_val = values.astype(self.dtype, copy=False)
+        best = np.argmin(self.P_best_val)
+        self.G_best[...] = self.P_best[best]
+        self.G_best_val = self.P_best_val[best]
+        self._update_social()
+
+    def _restored(self):
+        if self.P_best_val is not None:
+            self._update_social()
+
+    def _update_social(self):
+        # Her parçacığın komşuluğundaki en iyi kişisel konum (gbest topolojisinde G_best).
+        if self.neighbours is None:
+            return
+        best = np.argmin(self.P_best_val[self.neighbours], axis=1)
+        leaders = self.neighbours[np.arange(self.n_particles), best]
+        np.take(self.P_best, leaders, axis=0, out=self._social)
+
+    def _apply_boundary(self, X, V):
+        # X ve V tüm sürünün dizileri ya da tek bir parçacığın satırlarıdır (yerinde güncellenir).
+        if self.boundary == 'reflect':
+            above = X > self.x_max
+            np.subtract(2 * self.x_max, X, out=X, where=above)
+            np.negative(V, out=V, where=above)
+            below = X < self.x_min
+            np.subtract(2 * self.x_min, X, out=X, where=below)
+            np.negative(V, out=V, where=below)
+        elif self.boundary == 'absorb':
+            outside = (X > self.x_max) | (X < self.x_min)
+            V[outside] = 0
+        np.clip(X, self.x_min, self.x_max, out=X)  # Yansıma sonrası hâlâ dışarıda kalanlar için de
+
+    def _iterate(self):
+        # Bir PSO iterasyonu: hız ve konum güncellemesi, değerlendirme ve en iyilerin güncellenmesi.
+        if self.P_best_val is None:
+            self._initialize((yield self.X))
+        X, V, work, random = self.X, self.V, self._work, self._random
+        profiler = self.profiler
+        with profiler.phase('move'):
+            # Hız güncellemesi: V = w*V + c1*r1*(P_best - X) + c2*r2*(sosyal en iyi - X)
+            V *= self.w
+            self.rng.random(dtype=self.dtype, out=random)
+            np.subtract(self.P_best, X, out=work)
+            work *= random
+            work *= self.c1
+            V += work
+            self.rng.random(dtype=self.dtype, out=random)
+            np.subtract(self._social, X, out=work)
+            work *= random
+            work *= self.c2
+            V += work
+            np.clip(V, -self.v_max, self.v_max, out=V)  # Hız sınırlaması
+
+            # Konum güncellemesi ve sınır işlemi
+            X += V
+            self._apply_boundary(X, V)
+
+        current_val = yield X
+
+        with profiler.phase('update'):
+            # Kişisel en iyilerin güncellenmesi
+            better_mask = current_val < self.P_best_val
+            np.copyto(self.P_best, X, where=better_mask[:, None])
+            np.copyto(self.P_best_val, current_val, where=better_mask)
+
+            # Global ve komşuluk en iyilerinin güncellenmesi
+            best = np.argmin(self.P_best_val)
+            if self.P_best_val[best] < self.G_best_val:
+                self.G_best[...] = self.P_best[best]
+                self.G_best_val = self.P_best_val[best]
+            self._update_social()
+        self.iteration += 1
+
+    def run(self, iterations, callback=None, termination=None, checkpoint=None):
+        """
+        En fazla iterations iterasyon çalıştırır ve (G_best, G_best_val) döndürür.
+        callback: Her iterasyondan sonra callback(iterasyon, G_best, G_best_val) çağrılır.
+        termination: Erken durdurma için sonlandirma.Termination (iterations None ise zorunludur).
+        checkpoint: Her iterasyon sonunda durumu kaydeden kontrol_noktasi.Checkpointer.
+        """
+        for i in iteration_range(iterations, termination):
+            self.step()
+            self.profiler.iteration(self.iteration, best=float(self.G_best_val),
+                                    evaluations=self.objective.n_evaluations)
+            if callback is not None:
+                callback(self.iteration, self.G_best, self.G_best_val)
+            if checkpoint is not None:
+                checkpoint.update(self)
+            if termination is not None and termination.should_stop(i + 1, self.G_best_val,
+                                                                   self.objective.n_evaluations):
+                break
+        return self.G_best.copy(), self.G_best_val
+
+
+class AsyncParticleSwarm(SteadyState, ParticleSwarm):
+    def __init__(self, objective, n_particles, n_dimensions, x_min, x_max, v_max=None, w=0.7, c1=2.05, c2=2.05,
+                 topology='gbest', boundary='clip', evaluator=None, rng=None, profiler=None, dtype=None):
+        """
+        Eşzamansız (steady-state) PSO. Nesil beklenmez: her parçacık kendi değerlendirmesi döner dönmez kişisel ve
+        global en iyileri günceller ve yeniden gönderilirken o anki en güncel global (ya da komşuluk) en iyisine
+        göre hareket ettirilir. Her parçacığın aynı anda en fazla bir değerlendirmesi işlemdedir; parçacıklar
+        değerleri geliş sırasıyla yeniden gönderilir. Değerlendirme süreleri çok farklı olduğunda N işçideki
+        verim (değerlendirme/saniye) seri çalışmanın yaklaşık N katıdır.
+        Parametreler ParticleSwarm ile aynıdır; değerlendirmeler evaluator'ın submit metoduyla tek tek yapılır
+        (ör. degerlendirme.ThreadPoolEvaluator ya da ProcessPoolEvaluator). run(iterations, n_workers=...)
+        ile çalıştırılır; bir iterasyon n_particles değerlendirmedir.
+        """
+        super().__init__(None, n_particles, n_dimensions, x_min, x_max, v_max, w, c1, c2, topology, boundary,
+                         rng=rng, profiler=profiler, dtype=dtype)
+        self.objective = as_batch_objective(objective, evaluator=evaluator)
+        self.P_best_val = np.full(n_particles, np.inf, dtype=self.dtype)
+        self.sweep_size = n_particles
+        self._ready = deque(range(n_particles))  # Gönderilmeyi bekleyen parçacıklar
+        self._started = np.zeros(n_particles, dtype=bool)  # İlk konumu değerlendirmeye gönderilmiş parçacıklar
+
+    def _move(self, i):
+        # Tek bir parçacığın hız ve konum güncellemesi; sosyal en iyi o anki en güncel değerdir.
+        if self.neighbours is None:
+            social = self.G_best
+        else:
+            neighbours = self.neighbours[i]
+            social = self.P_best[neighbours[np.argmin(self.P_best_val[neighbours])]]
+        x, v = self.X[i], self.V[i]
+        random = self.rng.random(2 * self.n_dimensions)
+        v *= self.w
+        v += self.c1 * random[:self.n_dimensions] * (self.P_best[i] - x)
+        v += self.c2 * random[self.n_dimensions:] * (social - x)
+        np.clip(v, -self.v_max, self.v_max, out=v)
+        x += v
+        self._apply_boundary(x, v)
+
+    def _next_candidate(self):
+        i = self._ready.popleft()
+        if self._started[i]:
+            with self.profiler.phase('move'):
+                self._move(i)
+        self._started[i] = True
+        return i, self.X[i].copy()
+
+    def _receive(self, i, candidate, value):
+        if value < self.P_best_val[i]:
+            self.P_best[i] = candidate
+            self.P_best_val[i] = value
+            if value < self.G_best_val:
+                self.G_best[...] = candidate
+                self.G_best_val = value
+        self._ready.append(i)
+
+    def _best(self):
+        return self.G_best.copy(), self.G_best_val
+
+
+class BatchedParticleSwarm(AskTell, Checkpointable):
+    checkpoint_arrays = ('X', 'V', 'P_best', 'P_best_val', 'G_best', 'G_best_val', 'stall', 'active', 'w', 'c1', 'c2',
+                         'v_max', 'best_positions', 'best_values', 'iterations', 'converged')
+    checkpoint_values = ('iteration', 'initialized')
+
+    def __init__(self, objective, n_swarms, n_particles, n_dimensions, x_min, x_max, v_max=None, w=0.7, c1=2.05,
+                 c2=2.05, tolerance=0.0, patience=None, target=None, evaluator=None, rng=None, profiler=None,
+                 dtype=None):
+        """
+        Birbirinden bağımsız n_swarms adet (gbest) sürüyü (sürü x parçacık x boyut) dizilerinde tutar ve hepsini
+        iterasyon başına tek bir vektörleştirilmiş güncellemeyle ilerletir. Çok sayıda yeniden başlatma ya da
+        hiperparametre taraması yapılırken küçük sürülerde baskın olan Python yükü sürüler arasında paylaşılır.
+        Yakınsayan sürüler dizilerden çıkarılır ve sonraki iterasyonlarda hesaplama maliyeti oluşturmaz.
+        objective: Amaç fonksiyonu; tüm etkin sürülerin parçacıkları tek çağrıda değerlendirilir
+                   (None: değerlendirmeler ask/tell ile dışarıda yapılır).
+        n_swarms: Sürü sayısı.
+        n_particles, n_dimensions, x_min, x_max: ParticleSwarm ile aynıdır.
+        v_max, w, c1, c2: Skaler ya da sürü başına (n_swarms,) boyutlu hiperparametreler.
+        tolerance, patience: G_best_val arka arkaya patience iterasyon boyunca tolerance'tan fazla
+                             iyileşmeyen sürü yakınsamış sayılır (patience=None: kapalı).
+        target: G_best_val bu değere ulaşan sürü yakınsamış sayılır.
+        evaluator: Toplu değerlendirmeleri dağıtan değerlendirici (degerlendirme modülü).
+        rng: Tohum, numpy.random.Generator ya da rastgele.BufferedRandom.
+        profiler: Aşama süreleri için izleme.Profiler (None: izleme kapalı).
+        dtype: Durum dizilerinin tipi (ör. np.float32; varsayılan float64).
+        """
+        self.objective = as_batch_objective(objective, evaluator=evaluator)
+        self.profiler = profiler or NULL_PROFILER
+        self.dtype = float_dtype(dtype)
+        self.n_swarms = n_swarms
+        self.n_particles = n_particles
+        self.n_dimensions = n_dimensions
+        self.x_min = np.broadcast_to(np.asarray(x_min, dtype=float), (n_dimensions,))
+        self.x_max = np.broadcast_to(np.asarray(x_max, dtype=float), (n_dimensions,))
+        self.tolerance = tolerance
+        self.patience = patience
+        self.target = target
+        self.rng = make_rng(rng)
+
+        def per_swarm(value):
+            return np.broadcast_to(np.asarray(value, dtype=float), (n_swarms,)).reshape(n_swarms, 1, 1).copy()
+
+        self.w, self.c1, self.c2 = per_swarm(w), per_swarm(c1), per_swarm(c2)
+        if v_max is None:
+            self.v_max = np.broadcast_to((self.x_max - self.x_min) * 0.2, (n_swarms, 1, n_dimensions)).copy()
+        else:
+            self.v_max = np.broadcast_to(per_swarm(v_max), (n_swarms, 1, n_dimensions)).copy()
+
+        shape = (n_swarms, n_particles, n_dimensions)
+        self.X = self.rng.uniform(self.x_min, self.x_max, size=shape).astype(self.dtype, copy=False)
+        self.V = (self.rng.uniform(-1, 1, size=shape) * self.v_max).astype(self.dtype, copy=False)
+        self.P_best = self.X.copy()
+        self.P_best_val = np.full((n_swarms, n_particles), np.inf, dtype=self.dtype)
+        self.G_best = self.X[:, 0].copy()
+        self.G_best_val = np.full(n_swarms, np.inf, dtype=self.dtype)
+        self.stall = np.zeros(n_swarms, dtype=int)
+        self.active = np.arange(n_swarms)  # Dizilerdeki satırların özgün sürü numaraları
+        self._random = np.empty(shape, dtype=self.dtype)
+        self._work = np.empty(shape, dtype=self.dtype)
+
+        # Sürü başına sonuçlar; yakınsayan sürüler çıkarılırken doldurulur.
+        self.best_positions = self.G_best.copy()
+        self.best_values = self.G_best_val.copy()
+        self.iterations = np.zeros(n_swarms, dtype=int)
+        self.converged = np.zeros(n_swarms, dtype=bool)
+        self.iteration = 0
+        self.initialized = False
+        if objective is not None:
+            self._initialize(self.objective(self.X.reshape(-1, n_dimensions)))
+
+    def _initialize(self, values):
+        # Başlangıç popülasyonunun değerleriyle kişisel ve sürü en iyileri
+        self.P_best_val[...] = values.reshape(self.P_best_val.shape)
+        best = np.argmin(self.P_best_val, axis=1)
+        rows = np.arange(len(best))
+        self.G_best[...] = self.P_best[rows, best]
+        self.G_best_val[...] = self.P_best_val[rows, best]
+        self.best_positions[...] = self.G_best
+        self.best_values[...] = self.G_best_val
+        self.initialized = True
+
+    def _restored(self):
+        # Çalışma dizileri kaydedilen (sıkıştırılmış olabilecek) durumun boyutuna göre yeniden ayrılır.
+        self._random = np.empty(self.X.shape, dtype=self.X.dtype)
+        self._work = np.empty(self.X.shape, dtype=self.X.dtype)
+
+    def _store(self, rows):
+        swarms = self.active[rows]
+        self.best_positions[swarms] = self.G_best[rows]
+        self.best_values[swarms] = self.G_best_val[rows]
+
+    def _compact(self, keep):
+        # Yakınsayan sürüler tüm durum dizilerinden çıkarılır.
+        for name in ('X', 'V', 'P_best', 'P_best_val', 'G_best', 'G_best_val', 'stall', 'active',
+                     'w', 'c1', 'c2', 'v_max', '_random', '_work'):
+            setattr(self, name, getattr(self, name)[keep])
+
+    def _iterate(self):
+        # Tüm etkin sürüler için bir PSO iterasyonu; adaylar (etkin sürü x parçacık, boyut) matrisi olarak verilir.
+        if not self.initialized:
+            self._initialize((yield self.X.reshape(-1, self.n_dimensions)))
+        X, V, work, random = self.X, self.V, self._work, self._random
+        profiler = self.profiler
+        with profiler.phase('move'):
+            V *= self.w
+            self.rng.random(dtype=self.dtype, out=random)
+            np.subtract(self.P_best, X, out=work)
+            work *= random
+            work *= self.c1
+            V += work
+            self.rng.random(dtype=self.dtype, out=random)
+            np.subtract(self.G_best[:, None, :], X, out=work)
+            work *= random
+            work *= self.c2
+            V += work
+            np.clip(V, -self.v_max, self.v_max, out=V)
+            X += V
+            np.clip(X, self.x_min, self.x_max, out=X)
+
+        n_active = len(self.active)
+        current_val = (yield X.reshape(-1, self.n_dimensions)).reshape(n_active, self.n_particles)
+
+        with profiler.phase('update'):
+            better_mask = current_val < self.P_best_val
+            np.copyto(self.P_best, X, where=better_mask[..., None])
+            np.copyto(self.P_best_val, current_val, where=better_mask)
+
+            rows = np.arange(n_active)
+            best = np.argmin(self.P_best_val, axis=1)
+            best_val = self.P_best_val[rows, best]
+            improved = best_val < self.G_best_val
+            self.stall = np.where(self.G_best_val - best_val > self.tolerance, 0, self.stall + 1)
+            self.G_best[improved] = self.P_best[rows[improved], best[improved]]
+            self.G_best_val[improved] = best_val[improved]
+            self.iterations[self.active] += 1
+
+        # Sürü başına yakınsama maskesi
+        done = np.zeros(n_active, dtype=bool)
+        if self.patience is not None:
+            done |= self.stall >= self.patience
+        if self.target is not None:
+            done |= self.G_best_val <= self.target
+        if done.any():
+            with profiler.phase('compact'):
+                self._store(done)
+                self.converged[self.active[done]] = True
+                self._compact(~done)
+            profiler.count('converged_swarms', int(done.sum()))
+        self.iteration += 1
+
+    def run(self, iterations, callback=None, termination=None, checkpoint=None):
+        """
+        En fazla iterations iterasyon çalıştırır (yakınsayan sürüler daha erken durur).
+        callback: Her iterasyondan sonra callback(iterasyon, etkin sürülerin G_best'leri, G_best_val'leri) çağrılır.
+        termination: Tüm sürüler için ortak sonlandirma.Termination (ör. değerlendirme ya da süre bütçesi);
+                     en iyi değer olarak sürülerin en iyisi kullanılır.
+        checkpoint: Her iterasyon sonunda durumu kaydeden kontrol_noktasi.Checkpointer.
+        Dönüş: (n_swarms, n_dimensions) en iyi konumlar ve (n_swarms,) en iyi değerler.
+        """
+        for i in iteration_range(iterations, termination):
+            if not len(self.active):
+                break
+            self.step()
+            self.profiler.iteration(self.iteration, active=len(self.active), evaluations=self.objective.n_evaluations)
+            if callback is not None:
+                callback(self.iteration, self.G_best, self.G_best_val)
+            if checkpoint is not None:
+                checkpoint.update(self)
+            if termination is not None:
+                best = min(self.best_values.min(), self.G_best_val.min(initial=np.inf))
+                if termination.should_stop(i + 1, best, self.objective.n_evaluations):
+                    break
+        self._store(np.ones(len(self.active), dtype=bool))
+        return self.best_positions.copy(), self.best_values.copy()
+
+
+if __name__ == "__main__":
+    # PSO parametreleri
+    n_particles = 30
+    n_dimensions = 2
+    x_min, x_max = -10, 10
+    v_max = (x_max - x_min) * 0.2
+    iterations = 100
+    w = 0.7  # atalet ağırlığı
+    c1, c2 = 2.05, 2.05  # kişisel ve sosyal katsayılar
+    evaluator = None  # Değerlendiriciler: degerlendirme.ThreadPoolEvaluator, ProcessPoolEvaluator, AsyncioEvaluator
+
+    # PSO döngüsü
+    swarm = ParticleSwarm(objective_function, n_particles, n_dimensions, x_min, x_max, v_max, w, c1, c2,
+                          evaluator=evaluator)
+    G_best, G_best_val = swarm.run(iterations)
+
+    # Sonuç
+    print (G_best, G_best_val)
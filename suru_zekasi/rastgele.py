@@ -0,0 +1,143 @@
+'''
+Algoritmaların ortak kullandığı rastgele sayı kaynakları.
+
+Tüm algoritmalar rng parametresiyle bir tohum (int), numpy.random.Generator ya da BufferedRandom alır;
+global np.random durumu kullanılmaz. Böylece aynı tohumla yapılan çalıştırmalar paralel çalışmada da
+tekrarlanabilir ve paralel işçilere spawn ile birbirinden bağımsız akışlar verilebilir.
+
+BufferedRandom, küçük ve sık çekilişlerin (ör. adım başına birkaç sayı) çağrı maliyetini azaltmak için
+düzgün ve normal dağılımlı sayıları büyük bloklar halinde önceden çeker ve istenen kadarını bloktan dilimler.
+Generator ile aynı çağrı biçimlerini (random, uniform, normal, integers) destekler; ancak ürettiği sayılar
+aynı tohumlu bir Generator'ınkilerden farklıdır.
+
+Örnek:
+    rng = BufferedRandom(seed=42)
+    swarm = ParticleSwarm(objective, 30, 10, -5, 5, rng=rng)
+    workers = BufferedRandom(seed=42).spawn(8)  # İşçi başına bağımsız akışlar
+'''
+
+import math
+
+import numpy as np
+
+
+class _Buffer:
+    # Bir dağılımın önceden çekilmiş bloğu, sıradaki konum ve bloğun çekildiği andaki üreteç durumu.
+    __slots__ = ('values', 'position', 'size', 'refill_state')
+
+    def __init__(self):
+        self.values = np.empty(0)
+        self.position = 0
+        self.size = 0
+        self.refill_state = None
+
+
+class BufferedRandom:
+    def __init__(self, seed=None, block_size=1 << 16):
+        """
+        seed: Tohum, SeedSequence ya da alttaki numpy.random.Generator.
+        block_size: Bir seferde önceden çekilen sayı adedi; bundan büyük istekler doğrudan üreteçten karşılanır.
+        """
+        self.generator = seed if isinstance(seed, np.random.Generator) else np.random.default_rng(seed)
+        self.block_size = block_size
+        self._uniform = _Buffer()
+        self._normal = _Buffer()
+
+    def _draw(self, buffer, count):
+        if buffer is self._uniform:
+            return self.generator.random(count)
+        return self.generator.standard_normal(count)
+
+    def _take(self, buffer, count):
+        # Bloktan count sayı; dilim bir görünümdür ve blok bu sayılar için bir daha kullanılmadığından
+        # çağıran tarafından değiştirilebilir.
+        position = buffer.position
+        end = position + count
+        if end > buffer.size:
+            if count > self.block_size:
+                return self._draw(buffer, count)
+            # Bloğun kalanı atılır ve yeni blok çekilir.
+            buffer.refill_state = self.generator.bit_generator.state
+            buffer.values = self._draw(buffer, self.block_size)
+            buffer.size = self.block_size
+            position, end = 0, count
+        buffer.position = end
+        return buffer.values[position:end]
+
+    def _sample(self, buffer, size, *parameters):
+        # size ve parametrelerin yayınlanmış (broadcast) boyutu kadar sayı; size None ve parametreler skalerse skaler.
+        if size is None:
+            shape = np.broadcast(*parameters).shape if parameters else ()
+        else:
+            shape = (size,) if isinstance(size, (int, np.integer)) else tuple(size)
+        values = self._take(buffer, math.prod(shape)).reshape(shape)
+        return values[()] if size is None and not shape else values
+
+    def random(self, size=None, dtype=np.float64, out=None):
+        """[0, 1) aralığında düzgün dağılımlı sayılar (Generator.random gibi; dtype ve out desteklenir)."""
+        if out is not None:
+            out[...] = self._take(self._uniform, out.size).reshape(out.shape)
+            return out
+        if size.__class__ is int:  # Sık kullanılan (n,) boyutlu istekler için kısa yol
+            values = self._take(self._uniform, size)
+        else:
+            values = self._sample(self._uniform, size)
+        return values if dtype is np.float64 else np.asarray(values).astype(dtype)[()]
+
+    def uniform(self, low=0.0, high=1.0, size=None):
+        return low + np.subtract(high, low) * self._sample(self._uniform, size, low, high)
+
+    def normal(self, loc=0.0, scale=1.0, size=None):
+        return loc + np.multiply(scale, self._sample(self._normal, size, loc, scale))
+
+    def standard_normal(self, size=None):
+        return self._sample(self._normal, size)
+
+    def integers(self, low, high=None, size=None):
+        """[low, high) aralığında tamsayılar; düzgün sayıların ölçeklenmesiyle üretilir."""
+        if high is None:
+            low, high = 0, low
+        values = low + np.floor(self._sample(self._uniform, size, low, high) * np.subtract(high, low)).astype(np.int64)
+        return values[()] if np.ndim(values) == 0 else values
+
+    def spawn(self, n_children):
+        """Paralel işçiler için birbirinden bağımsız n_children adet BufferedRandom."""
+        return [BufferedRandom(child, self.block_size) for child in self.generator.spawn(n_children)]
+
+    @property
+    def state(self):
+        """JSON'a yazılabilir durum: bloklar yerine, blokların çekildiği andaki üreteç durumları saklanır."""
+        return {'generator': self.generator.bit_generator.state,
+                'buffers': {name: [buffer.refill_state, buffer.position]
+                            for name, buffer in (('uniform', self._uniform), ('normal', self._normal))}}
+
+    @state.setter
+    def state(self, state):
+        for name, buffer in (('uniform', self._uniform), ('normal', self._normal)):
+            buffer.refill_state, buffer.position = state['buffers'][name]
+            if buffer.refill_state is None:
+                buffer.values, buffer.size = np.empty(0), 0
+            else:
+                # Blok, çekildiği andaki üreteç durumundan yeniden üretilir.
+                self.generator.bit_generator.state = buffer.refill_state
+                buffer.values, buffer.size = self._draw(buffer, self.block_size), self.block_size
+        self.generator.bit_generator.state = state['generator']
+
+
+def make_rng(rng=None):
+    """Tohum, SeedSequence, Generator ya da BufferedRandom'dan algoritmaların kullanacağı üreteci döndürür."""
+    if isinstance(rng, (BufferedRandom, np.random.Generator)):
+        return rng
+    return np.random.default_rng(rng)
+
+
+def get_rng_state(rng):
+    """Üretecin JSON'a yazılabilir durumu (kontrol noktaları için)."""
+    return rng.state if isinstance(rng, BufferedRandom) else rng.bit_generator.state
+
+
+def set_rng_state(rng, state):
+    if isinstance(rng, BufferedRandom):
+        rng.state = state
+    else:
+        rng.bit_generator.state = state
@@ -0,0 +1,98 @@
+'''
+Optimizasyon algoritmaları için ortak sonlandırma (durdurma) kriterleri.
+
+Algoritmalar sabit sayıda iterasyon yerine, iyileşme durduğunda ya da bütçe bittiğinde erken durabilir.
+Termination nesnesi her iterasyonun sonunda en iyi değer ve toplam değerlendirme sayısıyla çağrılır;
+kontrol yalnızca birkaç karşılaştırmadan oluşur (saat yalnızca max_time verildiyse okunur).
+
+Kriterler (herhangi biri sağlandığında durulur):
+* max_iterations: En fazla iterasyon sayısı.
+* max_evaluations: En fazla amaç fonksiyonu değerlendirmesi (iterasyon sonunda kontrol edilir, bu yüzden
+  son iterasyonun değerlendirmeleri kadar aşılabilir).
+* max_time: Saniye cinsinden duvar saati süresi.
+* target: En iyi değer bu değere ulaştığında.
+* patience: En iyi değer arka arkaya patience iterasyon boyunca max(tolerance, rtol * |en iyi|) kadar
+  iyileşmediğinde (durağanlık penceresi).
+
+Örnek:
+    termination = Termination(patience=20, rtol=1e-6, max_evaluations=50000)
+    swarm.run(None, termination=termination)
+    print(termination.reason)
+'''
+
+import itertools
+import math
+import time
+
+
+class Termination:
+    def __init__(self, max_iterations=None, max_evaluations=None, max_time=None, target=None, patience=None,
+                 tolerance=0.0, rtol=0.0, maximize=False, clock=time.perf_counter):
+        """
+        max_iterations, max_evaluations, max_time, target, patience: Modül açıklamasındaki kriterler (None: kapalı).
+        tolerance, rtol: Durağanlık için mutlak ve göreli en küçük iyileşme miktarı.
+        maximize: Amaç büyütülüyorsa (ör. AIS afinitesi) True; iyileşme ve target buna göre yorumlanır.
+        clock: Saniye cinsinden zaman döndüren saat.
+        """
+        self.max_iterations = max_iterations
+        self.max_evaluations = max_evaluations
+        self.max_time = max_time
+        self.target = target
+        self.patience = patience
+        self.tolerance = tolerance
+        self.rtol = rtol
+        self.maximize = maximize
+        self.clock = clock
+        self.start()
+
+    def start(self):
+        """Sayaçları ve saati sıfırlar; algoritmalar çalışmaya başlarken çağırır."""
+        self.start_time = self.clock()
+        self.best = math.inf  # İç gösterimde her zaman küçültme yönündedir
+        self.stall = 0
+        self.iteration = 0
+        self.reason = None
+
+    def elapsed(self):
+        return self.clock() - self.start_time
+
+    def should_stop(self, iteration, best, evaluations=0):
+        """
+        Bir iterasyon sonunda çağrılır; durulması gerekiyorsa True döndürür ve nedeni self.reason'a yazar.
+        iteration: Tamamlanan iterasyon sayısı.
+        best: Şu ana kadarki en iyi değer.
+        evaluations: Şu ana kadarki toplam değerlendirme sayısı.
+        """
+        self.iteration = iteration
+        value = -best if self.maximize else best
+        if self.best - value > max(self.tolerance, self.rtol * abs(self.best) if self.best < math.inf else 0.0):
+            self.stall = 0
+        else:
+            self.stall += 1
+        self.best = min(self.best, value)
+
+        if self.target is not None and self.best <= (-self.target if self.maximize else self.target):
+            self.reason = 'target'
+        elif self.patience is not None and self.stall >= self.patience:
+            self.reason = 'stagnation'
+        elif self.max_iterations is not None and iteration >= self.max_iterations:
+            self.reason = 'max_iterations'
+        elif self.max_evaluations is not None and evaluations >= self.max_evaluations:
+            self.reason = 'max_evaluations'
+        elif self.max_time is not None and self.elapsed() >= self.max_time:
+            self.reason = 'max_time'
+        return self.reason is not None
+
+
+def iteration_range(iterations, termination=None):
+    """
+    Algoritma döngüleri için iterasyon aralığı: iterations None ise sınırsızdır ve durma termination'a bırakılır.
+    termination verilirse sayaçları sıfırlanır.
+    """
+    if termination is not None:
+        termination.start()
+    if iterations is not None:
+        return range(iterations)
+    if termination is None:
+        raise ValueError("iterations None ise bir Termination verilmelidir.")
+    return itertools.count()
@@ -0,0 +1,205 @@
+'''
+Algoritmaların dışarıdan adım adım sürülmesi için ask/tell (sor/bildir) arayüzü.
+
+Algoritma döngüsü kendi amaç fonksiyonunu çağırmak yerine, değerlendirilecek adayları dışarı verir ve
+değerlerini geri alır. Böylece değerlendirmeler bir iş kuyruğundan eşzamansız gelebilir, birden fazla
+algoritma aynı süreçte iç içe çalıştırılabilir ve işçiler nesiller arasında boşta beklemez.
+
+    batch = optimizer.ask()          # (aday sayısı, boyut) boyutlu aday matrisi
+    optimizer.tell(values)           # (aday sayısı,) boyutlu değerler; iterasyon bittiyse True döner
+
+Bir iterasyon birden fazla değerlendirme aşamasından oluşabilir (ör. Arı Kolonisi: işçi, gözcü ve kâşif arılar;
+Yunus Sürüsü: arama ve avlanma). Her aşama ayrı bir ask/tell çiftidir. Amaç fonksiyonu olmadan (objective=None)
+oluşturulan algoritmalarda başlangıç popülasyonu da ilk ask ile istenir.
+
+Üreteç arayüzü:
+    stream = optimizer.stream()
+    batch = next(stream)
+    while ...:
+        batch = stream.send(evaluate(batch))
+
+Kontrol noktaları yalnızca iterasyon sınırlarında (tell True döndürdükten sonra) alınmalıdır.
+
+SteadyState, nesil kavramı olmayan eşzamansız (steady-state) algoritmaların ortak çalıştırma döngüsüdür:
+adaylar tek tek değerlendirmeye gönderilir ve değeri gelen aday, diğerlerini beklemeden hemen işlenip yerine
+yenisi gönderilir. Değerlendirme süreleri birbirinden çok farklı olduğunda işçiler en yavaş değerlendirmeyi
+beklerken boşta kalmaz.
+'''
+
+import math
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import numpy as np
+
+
+class AskTell:
+    """
+    Alt sınıflar _iterate() üreteç metodunu tanımlar: bir iterasyondaki her değerlendirme aşamasında aday
+    matrisini yield eder ve değerleri yield ifadesinin sonucu olarak alır; iterasyon bitince döner.
+    step() aynı üreteci algoritmanın kendi amaç fonksiyonuyla sürer.
+    """
+    _iteration_steps = None  # Süren iterasyonun üreteci
+    _batch = None  # Değerlendirilmeyi bekleyen aday matrisi
+    _asked = False
+
+    def _evaluate(self, batch):
+        return self.objective(batch)
+
+    def ask(self):
+        """Değerlendirilecek bir sonraki aday matrisini döndürür."""
+        if self._asked:
+            raise RuntimeError("Önceki aday matrisi için tell çağrılmadı.")
+        if self._batch is None:
+            self._iteration_steps = self._iterate()
+            self._batch = next(self._iteration_steps)
+        self._asked = True
+        return self._batch
+
+    def tell(self, values):
+        """
+        Son ask ile verilen adayların değerlerini bildirir. İterasyon tamamlandıysa True döndürür.
+        Değerlendirmeler amaç fonksiyonunun sayacına (n_evaluations) eklenir.
+        """
+        if not self._asked:
+            raise RuntimeError("tell'den önce ask çağrılmalıdır.")
+        objective = getattr(self, 'objective', None)
+        if objective is not None:
+            objective.n_evaluations += len(self._batch)
+        # Değerler kopyalanır; algoritma onları kendi durum dizilerinde tutabilir.
+        return self._advance(np.array(values, dtype=float))
+
+    def _advance(self, values):
+        self._asked = False
+        values = np.asarray(values, dtype=float).reshape(len(self._batch))
+        try:
+            self._batch = self._iteration_steps.send(values)
+            return False
+        except StopIteration:
+            self._batch = self._iteration_steps = None
+            return True
+
+    def step(self):
+        """Bir iterasyonu algoritmanın kendi amaç fonksiyonuyla tamamlar."""
+        while True:
+            batch = self.ask()
+            with self.profiler.phase('evaluate'):
+                values = self._evaluate(batch)
+            if self._advance(values):
+                break
+
+    def stream(self):
+        """ask/tell'in üreteç biçimi: aday matrisleri yield eder, değerleri send ile alır."""
+        while True:
+            values = yield self.ask()
+            self.tell(values)
+
+
+def interleave(optimizers, evaluate, iterations, executor=None, callback=None):
+    """
+    Birden fazla algoritmayı ask/tell ile aynı anda ilerletir. Her algoritmanın bir aday matrisi sürekli
+    değerlendirmededir; biri bitince o algoritmaya bildirilir ve hemen bir sonraki matrisi gönderilir.
+    Böylece bir algoritmanın nesil geçişi sırasında işçiler diğer algoritmaların adaylarıyla meşgul kalır.
+    optimizers: ask/tell destekleyen algoritmalar.
+    evaluate: Aday matrisini değerlendiren fonksiyon ya da algoritma başına fonksiyon listesi.
+    iterations: Algoritma başına iterasyon sayısı.
+    executor: Değerlendirmelerin gönderildiği concurrent.futures yürütücüsü (None: sırayla, aynı iş parçacığında).
+    callback: Bir algoritmanın her iterasyonu bittiğinde callback(algoritma indisi, algoritma) çağrılır.
+    """
+    evaluators = evaluate if isinstance(evaluate, (list, tuple)) else [evaluate] * len(optimizers)
+    remaining = [iterations] * len(optimizers)
+    if executor is None:
+        active = [i for i in range(len(optimizers)) if remaining[i] > 0]
+        while active:
+            for i in list(active):
+                if optimizers[i].tell(evaluators[i](optimizers[i].ask())):
+                    remaining[i] -= 1
+                    if callback is not None:
+                        callback(i, optimizers[i])
+                    if not remaining[i]:
+                        active.remove(i)
+        return
+
+    pending = {}
+
+    def submit(i):
+        pending[executor.submit(evaluators[i], optimizers[i].ask())] = i
+
+    for i in range(len(optimizers)):
+        if remaining[i] > 0:
+            submit(i)
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            i = pending.pop(future)
+            if optimizers[i].tell(future.result()):
+                remaining[i] -= 1
+                if callback is not None:
+                    callback(i, optimizers[i])
+            if remaining[i]:
+                submit(i)
+
+
+class SteadyState:
+    """
+    Eşzamansız algoritmalar için çalıştırma döngüsü. Alt sınıflar şunları tanımlar:
+    sweep_size: Bir iterasyon sayılan değerlendirme sayısı (ör. parçacık sayısı).
+    _next_candidate(): Değerlendirilecek sıradaki aday; (anahtar, aday) döndürür.
+    _receive(anahtar, aday, değer): Değeri gelen adayı işler.
+    _best(): (en iyi çözüm, en iyi değer).
+    Kontrol noktası desteklenmez: işlemdeki değerlendirmeler ve gönderim kuyrukları kaydedilemediğinden
+    kaldığı yerden sürdürülen bir çalışma farklı bir durumla devam ederdi; save ve restore hata verir.
+    """
+
+    def get_state(self):
+        raise NotImplementedError(f"{type(self).__name__} kontrol noktasını desteklemez: işlemdeki "
+                                  "değerlendirmeler ve gönderim kuyrukları kaydedilemez.")
+
+    def set_state(self, arrays, values):
+        self.get_state()  # Aynı hatayı verir
+
+    def run(self, iterations, callback=None, termination=None, n_workers=None):
+        """
+        Aynı anda n_workers değerlendirmeyi işlemde tutarak iterations * sweep_size değerlendirme yapar ve
+        (en iyi çözüm, en iyi değer) döndürür. Adaylar amaç fonksiyonunun değerlendiricisine submit ile gönderilir.
+        callback: Her sweep_size değerlendirmede bir callback(iterasyon, en iyi çözüm, en iyi değer) çağrılır.
+        termination: Erken durdurma için sonlandirma.Termination; her iterasyon sonunda kontrol edilir
+                     (iterations None ise zorunludur). Durulduğunda işlemdeki değerlendirmeler yine işlenir.
+        n_workers: İşlemdeki en fazla değerlendirme sayısı (None: değerlendiricinin işçi sayısı; en fazla sweep_size).
+        """
+        objective = self.objective
+        if n_workers is None:
+            n_workers = getattr(objective.evaluator, 'max_workers', None) or 1
+        n_workers = min(n_workers, self.sweep_size)
+        if termination is not None:
+            termination.start()
+        elif iterations is None:
+            raise ValueError("iterations None ise bir Termination verilmelidir.")
+        budget = math.inf if iterations is None else iterations * self.sweep_size
+        pending = {}  # Future -> (anahtar, aday)
+        submitted = completed = 0
+        stop = False
+        while submitted < budget and len(pending) < n_workers:
+            key, candidate = self._next_candidate()
+            pending[objective.submit(candidate)] = (key, candidate)
+            submitted += 1
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                key, candidate = pending.pop(future)
+                with self.profiler.phase('update'):
+                    self._receive(key, candidate, future.result())
+                completed += 1
+                if completed % self.sweep_size == 0:
+                    self.iteration += 1
+                    position, value = self._best()
+                    self.profiler.iteration(self.iteration, best=float(value), evaluations=objective.n_evaluations)
+                    if callback is not None:
+                        callback(self.iteration, position, value)
+                    if termination is not None and termination.should_stop(completed // self.sweep_size, value,
+                                                                           objective.n_evaluations):
+                        stop = True
+                if not stop and submitted < budget:
+                    key, candidate = self._next_candidate()
+                    pending[objective.submit(candidate)] = (key, candidate)
+                    submitted += 1
+        return self._best()
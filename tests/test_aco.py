@@ -0,0 +1,208 @@
+import numpy as np
+import pytest
+
+from suru_zekasi.aco import (AntColonyOptimizer, BatchAntColonySolver, DistanceProvider, EuclideanDistances,
+                             HaversineDistances, build_candidate_list, improve_tour)
+
+
+def _points(n, seed):
+    return np.random.default_rng(seed).random((n, 2))
+
+
+def _distances(points):
+    return np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1))
+
+
+def _tour_cost(distances, tour):
+    tour = np.asarray(tour)
+    return distances[tour, np.roll(tour, -1)].sum()
+
+
+@pytest.mark.parametrize('moves', [('2opt',), ('oropt',), ('2opt', 'oropt')])
+@pytest.mark.parametrize('seed', range(5))
+def test_improve_tour_delta_matches_cost_change(moves, seed):
+    distances = _distances(_points(60, seed))
+    tour = np.random.default_rng(seed).permutation(60)
+    improved, delta = improve_tour(tour, distances, build_candidate_list(distances, 8), moves)
+    assert sorted(improved) == list(range(60))
+    assert delta < 0
+    assert _tour_cost(distances, improved) - _tour_cost(distances, tour) == pytest.approx(delta, abs=1e-9)
+
+
+def test_improve_tour_keeps_short_tours():
+    distances = _distances(_points(4, 0))
+    assert improve_tour([0, 2, 1, 3], distances, build_candidate_list(distances, 3)) == ([0, 2, 1, 3], 0.0)
+
+
+def test_distance_provider_matches_dense_matrix():
+    points = _points(30, 2)
+    provider = EuclideanDistances(points)
+    dense = _distances(points)
+    assert len(provider) == 30 and provider.shape == (30, 30)
+    np.testing.assert_allclose(provider[[0, 5]], dense[[0, 5]])
+    np.testing.assert_allclose(provider[np.arange(30), np.arange(30)[::-1]], dense[np.arange(30), np.arange(30)[::-1]])
+    np.testing.assert_array_equal(build_candidate_list(provider, 5), build_candidate_list(dense, 5))
+
+
+def test_haversine_distances():
+    # Ekvatorda 1 derece boylam farkı: 2 * pi * R / 360
+    provider = HaversineDistances([[0.0, 0.0], [0.0, 1.0]])
+    assert provider[0, 1] == pytest.approx(2 * np.pi * 6371.0 / 360)
+
+
+def test_distance_provider_is_abstract():
+    with pytest.raises(TypeError):
+        DistanceProvider(_points(3, 0))
+
+
+def test_improve_tour_with_distance_provider():
+    points = _points(40, 1)
+    tour = np.random.default_rng(1).permutation(40)
+    provider = EuclideanDistances(points)
+    dense = _distances(points)
+    improved, delta = improve_tour(tour, provider, build_candidate_list(provider, 8))
+    assert (improved, delta) == pytest.approx(improve_tour(tour, dense, build_candidate_list(dense, 8)))
+
+
+def test_batch_solver_returns_valid_tours():
+    rng = np.random.default_rng(0)
+    distances = [_distances(_points(int(n), i)) for i, n in enumerate(rng.integers(5, 30, 20))]
+    distances += [np.zeros((1, 1)), np.array([[0, 2], [2, 0.]])]
+    tours, costs = BatchAntColonySolver(n_ants=8, n_iterations=10, beta=2, rng=1).solve(distances)
+    for matrix, tour, cost in zip(distances, tours, costs):
+        n = len(matrix)
+        assert tour[0] == tour[-1] == 0
+        assert sorted(tour[:-1]) == list(range(n))
+        assert matrix[tour[:-1], tour[1:]].sum() == pytest.approx(cost)
+
+
+def test_batch_solver_matches_single_solver():
+    # Aynı parametrelerle toplu çözücü, örnekleri tek tek çözen AntColonyOptimizer kadar iyi turlar bulmalıdır.
+    distances = [_distances(_points(n, n)) for n in (12, 20, 25, 30, 40)]
+    _, costs = BatchAntColonySolver(n_ants=10, n_best=3, n_iterations=40, decay=0.9, beta=2, rng=1).solve(distances)
+    single = [AntColonyOptimizer(matrix, 10, 3, 40, 0.9, beta=2, rng=i).run()[1] for i, matrix in enumerate(distances)]
+    assert np.mean(costs) <= 1.05 * np.mean(single)
+
+
+def test_batch_solver_padded_input_matches_list_input():
+    distances = [_distances(_points(n, n)) for n in (8, 15, 11)]
+    padded, sizes = BatchAntColonySolver.pad(distances)
+    tours, costs = BatchAntColonySolver(n_iterations=10, beta=2, rng=3).solve(distances)
+    padded_tours, padded_costs = BatchAntColonySolver(n_iterations=10, beta=2, rng=3).solve(padded, sizes)
+    np.testing.assert_array_equal(padded_costs, costs)
+    for tour, padded_tour in zip(tours, padded_tours):
+        np.testing.assert_array_equal(padded_tour, tour)
+
+
+def test_sparse_pheromone_keeps_dtype():
+    optimizer = AntColonyOptimizer(EuclideanDistances(_points(30, 0), dtype=np.float32), 5, 2, 3, 0.9,
+                                   n_candidates=5, dtype=np.float32, rng=1)
+    optimizer.run()
+    assert optimizer.pheromone[[0, 1]].dtype == np.float32
+    assert optimizer.pheromone.values.dtype == np.float32
+
+
+@pytest.mark.parametrize('options', [{}, {'n_candidates': 5}, {'local_search': ('2opt',)}])
+def test_generate_all_paths_matches_ask(options):
+    distances = _distances(_points(25, 4))
+    paths, costs = AntColonyOptimizer(distances, 6, 2, 1, 0.9, rng=2, **options).generate_all_paths()
+    asked = AntColonyOptimizer(distances, 6, 2, 1, 0.9, rng=2, **options).ask()
+    assert paths.shape == (6, 26)
+    for path in paths:
+        assert path[0] == path[-1] == 0 and sorted(path[:-1]) == list(range(25))
+    np.testing.assert_allclose(costs, distances[paths[:, :-1], paths[:, 1:]].sum(axis=1))
+    if not options.get('local_search'):
+        np.testing.assert_array_equal(paths, asked)
+
+
+def test_candidate_list_is_nearest_first():
+    distances = _distances(_points(30, 5))
+    candidates = build_candidate_list(distances, 4, block_size=7)
+    for city, row in enumerate(candidates):
+        order = np.argsort(distances[city], kind='stable')
+        np.testing.assert_array_equal(row, order[order != city][:4])
+
+
+def test_candidate_fallback_when_all_candidates_visited():
+    from suru_zekasi.izleme import Profiler
+
+    distances = _distances(_points(20, 6))
+    profiler = Profiler()
+    optimizer = AntColonyOptimizer(distances, 4, 2, 5, 0.9, n_candidates=2, profiler=profiler, rng=0)
+    optimizer.update_attractiveness()
+    # 0'ın iki adayı da ziyaret edilmiş: seçim tüm şehirlerdeki ziyaret edilmemişler arasından yapılır.
+    visited = np.zeros((4, 20), dtype=bool)
+    visited[:, 0] = True
+    visited[:, optimizer.candidates[0]] = True
+    moves = optimizer.select_next_cities(np.zeros(4, dtype=np.intp), visited)
+    assert not visited[np.arange(4), moves].any()
+    assert profiler.counters['candidate_fallbacks'] == 4
+    path, cost = optimizer.run()
+    assert sorted(path[:-1]) == list(range(20))
+    assert cost == pytest.approx(distances[path[:-1], path[1:]].sum())
+
+
+def _reference_deposit(pheromone, distances, paths, symmetric):
+    # Kenar kenar döngüyle feromon bırakma (vektörleştirilmiş deposit ile karşılaştırmak için).
+    for path in paths:
+        for start, end in zip(path[:-1], path[1:]):
+            pheromone[start, end] += 1.0 / distances[start, end]
+            if symmetric:
+                pheromone[end, start] += 1.0 / distances[start, end]
+    return pheromone
+
+
+@pytest.mark.parametrize('symmetric', [False, True])
+def test_deposit_matches_edge_loop(symmetric):
+    distances = _distances(_points(12, 7))
+    optimizer = AntColonyOptimizer(distances, 4, 2, 1, 0.9, symmetric=symmetric, rng=0)
+    paths = np.stack([np.r_[0, np.random.default_rng(i).permutation(np.arange(1, 12)), 0] for i in range(3)])
+    paths[1] = paths[0]  # Tekrar eden kenarlara bırakılan feromon birikir
+    expected = _reference_deposit(optimizer.pheromone.copy(), distances, paths, symmetric)
+    optimizer.deposit(paths)
+    np.testing.assert_allclose(optimizer.pheromone, expected)
+    if symmetric:
+        np.testing.assert_allclose(optimizer.pheromone, optimizer.pheromone.T)
+
+
+def test_sparse_deposit_matches_dense():
+    points = _points(30, 8)
+    candidates = build_candidate_list(_distances(points), 29)  # Tüm kenarlar aday: seyrek ve yoğun aynıdır
+    dense = AntColonyOptimizer(_distances(points), 4, 2, 1, 0.9, candidates=candidates, symmetric=True,
+                               sparse_pheromone=False, rng=0)
+    sparse = AntColonyOptimizer(EuclideanDistances(points), 4, 2, 1, 0.9, candidates=candidates, symmetric=True,
+                                rng=0)
+    paths = dense.construct_paths()
+    dense.deposit(paths)
+    sparse.deposit(paths)
+    np.testing.assert_allclose(sparse.pheromone[np.arange(30)], dense.pheromone)
+
+
+@pytest.mark.parametrize('sparse', [False, True])
+def test_mmas_bounds_clamp_pheromone(sparse):
+    points = _points(20, 9)
+    distances = EuclideanDistances(points) if sparse else _distances(points)
+    optimizer = AntColonyOptimizer(distances, 8, 4, 30, 0.5, n_candidates=5 if sparse else None,
+                                   tau_min=0.02, tau_max=0.5, rng=1)
+    optimizer.run()
+    values = optimizer.pheromone.values if sparse else optimizer.pheromone
+    assert values.min() >= 0.02 and values.max() <= 0.5
+    assert values.max() == 0.5  # Sık kullanılan kenarlar üst sınıra ulaşır
+    if sparse:
+        assert optimizer.pheromone.base == 0.02  # Aday olmayan kenarlar da alt sınırda kalır
+    else:
+        assert values.min() == 0.02
+
+
+@pytest.mark.parametrize('options', [{}, {'n_candidates': 6, 'local_search': ('2opt',)}])
+def test_parallel_colonies_do_not_depend_on_worker_count(options):
+    from suru_zekasi.aco import run_parallel_colonies
+
+    distances = _distances(_points(25, 10))
+    results = [run_parallel_colonies(distances, 3, 6, exchange_interval=2, seed=4, max_workers=workers, n_ants=5,
+                                     n_best=2, decay=0.9, beta=2, **options) for workers in (1, 3)]
+    (path, cost, costs), (other_path, other_cost, other_costs) = results
+    np.testing.assert_array_equal(other_path, path)
+    assert other_cost == cost
+    np.testing.assert_array_equal(other_costs, costs)
+    assert cost == costs.min() == pytest.approx(distances[path[:-1], path[1:]].sum())
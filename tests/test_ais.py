@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from suru_zekasi.ais import ClonalSelection, clonal_selection_and_mutation
+from suru_zekasi.izleme import Profiler
+
+# Her satır kendi numarasıyla dolu olduğundan klonların hangi antikordan geldiği okunabilir.
+_GENES = np.repeat(np.arange(5.0)[:, None], 4, axis=1)
+_AFFINITIES = np.array([3.0, 2.0, 5.0, 1.0, 4.0])
+
+
+@pytest.mark.parametrize('max_clones', [None, 0, 1, 3, 4, 5, 14, 15, 40])
+def test_max_clones_keeps_first_clones_in_selection_order(max_clones):
+    clones = clonal_selection_and_mutation(_GENES, _AFFINITIES, 1.0, 0.0, max_clones=max_clones, rng=0)
+    expected = np.repeat(_GENES, [3, 2, 5, 1, 4], axis=0)[:max_clones]
+    np.testing.assert_array_equal(clones, expected)
+
+
+def test_truncated_clones_are_mutated():
+    clones = clonal_selection_and_mutation(_GENES, _AFFINITIES, 1.0, 0.5, max_clones=6, rng=0)
+    parents = np.repeat(_GENES, [3, 2, 5, 1, 4], axis=0)[:6]
+    assert clones.shape == (6, 4)
+    # Her klonda genlerin yarısı [0, 1) aralığından yeniden çekilir, diğerleri ebeveynden kalır.
+    assert ((clones != parents).sum(axis=1) <= 2).all()
+    assert ((clones == parents) | ((clones >= 0) & (clones < 1))).all()
+
+
+def test_clonal_selection_keeps_population_size():
+    profiler = Profiler()
+    system = ClonalSelection(20, 10, clone_factor=10.0, rng=0, profiler=profiler)
+    genes, affinities = system.run(3)
+    assert genes.shape == (20, 10) and affinities.shape == (20,)
+    # Seçilen 4 antikorun her biri ~50 klon üretir; popülasyon büyüklüğünü aşan klonlar atılır.
+    assert profiler.counters['clones'] == 3 * 20
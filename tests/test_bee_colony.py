@@ -0,0 +1,18 @@
+import numpy as np
+
+from suru_zekasi.bee_colony import BeeColony
+
+
+def test_scout_improvement_is_recorded_in_final_iteration():
+    colony = BeeColony(None, (-5, 5), 6, 2, limit=0, rng=0)
+    assert len(colony.ask()) == 6  # Başlangıç popülasyonu
+    colony.tell(np.arange(6.0))
+    # İşçi ve gözcü denemeleri hiçbir kaynağı iyileştirmez; tüm kaynaklar terk edilir.
+    assert not colony.tell(np.full(len(colony.ask()), 100.0))
+    assert not colony.tell(np.full(len(colony.ask()), 100.0))
+    scouts = colony.ask()
+    assert len(scouts) == 6
+    assert colony.tell(np.arange(6.0) - 10)
+    assert colony.best_value == -10
+    np.testing.assert_array_equal(colony.best_position, scouts[0])
+    assert colony.best_value == colony.values.min()
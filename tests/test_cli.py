@@ -0,0 +1,72 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from suru_zekasi.__main__ import main, run_job
+
+
+def _rows(path):
+    with open(path, encoding='utf-8') as file:
+        return [json.loads(line) for line in file]
+
+
+def _problem(path, sizes):
+    rng = np.random.default_rng(0)
+    with open(path, 'w', encoding='utf-8') as file:
+        for i, n in enumerate(sizes):
+            file.write(json.dumps({'id': f'r{i}', 'coordinates': rng.random((n, 2)).tolist()}) + '\n')
+
+
+def test_import_is_lazy():
+    code = ("import sys, suru_zekasi; assert 'numpy' not in sys.modules; "
+            "suru_zekasi.ParticleSwarm; "
+            "assert 'suru_zekasi.pso' in sys.modules and 'suru_zekasi.aco' not in sys.modules")
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=Path(__file__).resolve().parents[1])
+
+
+@pytest.mark.parametrize('algorithm', ['pso', 'firefly', 'bee_colony', 'dolphin', 'ais'])
+def test_continuous_job(algorithm, tmp_path):
+    output = tmp_path / 'out.jsonl'
+    assert main([algorithm, '--function', 'sphere', '--dim', '3', '--iterations', '5', '--seed', '1',
+                 '--output', str(output)]) == 0
+    [row] = _rows(output)
+    assert row['algorithm'] == algorithm and row['problem'] == 'sphere' and row['size'] == 3
+    assert len(row['best_solution']) == 3 and np.isfinite(row['best_value'])
+    assert set(row['timings']) >= {'setup', 'run', 'total'}
+
+
+def test_config_and_overrides(tmp_path):
+    config = tmp_path / 'jobs.json'
+    config.write_text(json.dumps([{'algorithm': 'pso', 'function': 'ackley', 'dim': 4, 'iterations': 3},
+                                  {'algorithm': 'dolphin', 'iterations': 3, 'options': {'population_size': 8}}]))
+    output = tmp_path / 'out.jsonl'
+    main(['--config', str(config), '--dim', '2', '--seed', '3', '--output', str(output)])
+    rows = _rows(output)
+    assert [row['algorithm'] for row in rows] == ['pso', 'dolphin']
+    assert [row['size'] for row in rows] == [2, 2]
+
+
+def test_aco_rows_report_import_once(tmp_path):
+    _problem(tmp_path / 'problem.jsonl', [8, 9, 10])
+    rows = list(run_job({'algorithm': 'aco', 'problem': str(tmp_path / 'problem.jsonl'), 'iterations': 3,
+                         'seed': 0}, profile=True))
+    assert [row['problem'] for row in rows] == ['r0', 'r1', 'r2']
+    assert ['import' in row['timings'] for row in rows] == [True, False, False]
+    assert all(row['phases'] for row in rows)
+
+
+def test_batch_rows_share_chunk_profile(tmp_path):
+    _problem(tmp_path / 'problem.jsonl', [5, 6, 7, 8] * 70)  # 280 örnek: iki parça
+    rows = list(run_job({'algorithm': 'aco', 'problem': str(tmp_path / 'problem.jsonl'), 'iterations': 2,
+                         'seed': 0, 'batch': True}, profile=True))
+    assert len(rows) == 280
+    assert ['import' in row['timings'] for row in rows].count(True) == 1 and 'import' in rows[0]['timings']
+    assert [row['chunk'] for row in rows] == [0] * 256 + [1] * 24
+    first, second = rows[0], rows[256]
+    assert first['phases'] and second['phases'] and first['phases'] != second['phases']
+    assert all(row['phases'] == first['phases'] for row in rows[:256])
+    assert all(row['phases'] == second['phases'] for row in rows[256:])
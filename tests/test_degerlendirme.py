@@ -0,0 +1,143 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
+
+from suru_zekasi.degerlendirme import (AsyncioEvaluator, BatchObjective, CachedObjective, ProcessPoolEvaluator,
+                                       SerialEvaluator, ThreadPoolEvaluator, as_batch_objective, vectorized)
+
+
+class _CountingFunction:
+    # Skaler amaç fonksiyonu; gerçekten değerlendirilen adayları sayar.
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, candidate):
+        self.calls += 1
+        return float(np.sum(np.asarray(candidate) ** 2))
+
+
+def test_cached_objective_counts_hits_and_misses():
+    function = _CountingFunction()
+    objective = CachedObjective(function)
+    values = objective(np.array([[1.0, 2.0], [3.0, 4.0], [1.0, 2.0]]))
+    np.testing.assert_array_equal(values, [5.0, 25.0, 5.0])
+    # Aynı toplu çağrıdaki tekrar da isabet sayılır ve yalnızca bir kez değerlendirilir.
+    assert (objective.hits, objective.misses, function.calls) == (1, 2, 2)
+    np.testing.assert_array_equal(objective(np.array([[3.0, 4.0], [0.0, 1.0]])), [25.0, 1.0])
+    assert (objective.hits, objective.misses, function.calls) == (2, 3, 3)
+    assert objective.n_evaluations == function.calls
+    objective.clear()
+    assert (objective.hits, objective.misses, len(objective.cache)) == (0, 0, 0)
+
+
+def test_cached_objective_tolerance_and_maxsize():
+    function = _CountingFunction()
+    objective = CachedObjective(function, tolerance=0.1, maxsize=2)
+    objective(np.array([[1.0, 1.0], [1.01, 1.0]]))
+    assert (objective.hits, objective.misses) == (1, 1)
+    objective(np.array([[2.0, 2.0], [3.0, 3.0]]))
+    assert len(objective.cache) == 2
+    objective(np.array([[1.0, 1.0]]))  # En eski değer atıldı
+    assert (objective.hits, objective.misses) == (1, 4)
+
+
+@pytest.mark.parametrize('evaluator', [None, SerialEvaluator(), ThreadPoolEvaluator(2)])
+def test_cached_objective_submit_uses_cache(evaluator):
+    function = _CountingFunction()
+    objective = CachedObjective(function, evaluator=evaluator)
+    objective(np.array([[1.0, 2.0]]))
+    assert objective.submit(np.array([1.0, 2.0])).result() == 5.0
+    assert (objective.hits, objective.misses, function.calls) == (1, 1, 1)
+    future = objective.submit(np.array([3.0, 4.0]))
+    assert future.result() == 25.0
+    assert (objective.hits, objective.misses, function.calls) == (1, 2, 2)
+    if evaluator is not None:
+        evaluator.close()  # Değer, işçi iş parçacığındaki geri çağırmayla önbelleğe yazılır
+    np.testing.assert_array_equal(objective(np.array([[3.0, 4.0]])), [25.0])
+    assert (objective.hits, objective.misses, function.calls) == (2, 2, 2)
+
+
+def test_as_batch_objective_does_not_replace_evaluator():
+    objective = CachedObjective(_CountingFunction())
+    assert as_batch_objective(objective) is objective
+    with pytest.raises(ValueError):
+        as_batch_objective(objective, evaluator=SerialEvaluator())
+    assert objective.evaluator is None
+
+
+def test_as_batch_objective_wraps_functions():
+    @vectorized
+    def sphere(X):
+        return np.sum(X ** 2, axis=1)
+
+    evaluator = SerialEvaluator()
+    objective = as_batch_objective(sphere, evaluator=evaluator)
+    assert isinstance(objective, BatchObjective)
+    assert objective.vectorized and objective.evaluator is evaluator
+    np.testing.assert_array_equal(objective(np.eye(2)), [1.0, 1.0])
+
+
+def _row_value(candidate):
+    # Süreç havuzuna gönderilebilmesi için modül düzeyinde; önce gönderilen adaylar daha geç biter.
+    time.sleep(0.01 * (1 - candidate[0] / 10))
+    return float(candidate[0] * 10 + candidate[1])
+
+
+@vectorized
+def _chunk_values(chunk):
+    time.sleep(0.01 * (1 - chunk[0, 0] / 10))
+    return chunk[:, 0] * 10 + chunk[:, 1]
+
+
+async def _async_row_value(candidate):
+    await asyncio.sleep(0.01 * (1 - candidate[0] / 10))
+    return float(candidate[0] * 10 + candidate[1])
+
+
+@vectorized
+async def _async_chunk_values(chunk):
+    await asyncio.sleep(0.01 * (1 - chunk[0, 0] / 10))
+    return chunk[:, 0] * 10 + chunk[:, 1]
+
+
+_POPULATION = np.stack([np.arange(10.0), np.ones(10)], axis=1)
+_EXPECTED = np.arange(10.0) * 10 + 1
+
+
+@pytest.mark.parametrize('max_workers, chunksize, sizes', [(None, None, [10]), (3, None, [4, 4, 2]),
+                                                           (3, 3, [3, 3, 3, 1]), (20, None, [1] * 10)])
+def test_split_sizes(max_workers, chunksize, sizes):
+    chunks = SerialEvaluator(max_workers, chunksize).split(_POPULATION)
+    assert [len(chunk) for chunk in chunks] == sizes
+    np.testing.assert_array_equal(np.concatenate(chunks), _POPULATION)
+
+
+@pytest.mark.parametrize('make', [SerialEvaluator, ThreadPoolEvaluator, ProcessPoolEvaluator])
+@pytest.mark.parametrize('chunksize', [None, 1, 3])
+def test_pool_evaluators_keep_candidate_order(make, chunksize):
+    with make(max_workers=3, chunksize=chunksize) as evaluator:
+        np.testing.assert_array_equal(evaluator.evaluate(_row_value, _POPULATION, False), _EXPECTED)
+        np.testing.assert_array_equal(evaluator.evaluate(_chunk_values, _POPULATION, True), _EXPECTED)
+        assert evaluator.evaluate(_row_value, _POPULATION[:0], False).shape == (0,)
+        futures = [evaluator.submit(_row_value, candidate, False) for candidate in _POPULATION]
+        assert [future.result() for future in futures] == list(_EXPECTED)
+
+
+@pytest.mark.parametrize('chunksize', [None, 1, 3])
+def test_asyncio_evaluator_keeps_candidate_order(chunksize):
+    with AsyncioEvaluator(max_workers=2, chunksize=chunksize) as evaluator:
+        np.testing.assert_array_equal(evaluator.evaluate(_async_row_value, _POPULATION, False), _EXPECTED)
+        np.testing.assert_array_equal(evaluator.evaluate(_async_chunk_values, _POPULATION, True), _EXPECTED)
+        futures = [evaluator.submit(_async_chunk_values, candidate, True) for candidate in _POPULATION]
+        assert [future.result() for future in futures] == list(_EXPECTED)
+
+
+def test_objective_counts_evaluations_through_evaluator():
+    with ThreadPoolEvaluator(max_workers=2) as evaluator:
+        objective = BatchObjective(_row_value, evaluator=evaluator)
+        np.testing.assert_array_equal(objective(_POPULATION), _EXPECTED)
+        assert objective.submit(_POPULATION[3]).result() == 31.0
+        assert objective.evaluate_one(_POPULATION[4]) == 41.0
+        assert objective.n_evaluations == 12
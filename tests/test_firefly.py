@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from suru_zekasi.firefly import FireflySwarm, firefly_algorithm, firefly_algorithm_vectorized
+from suru_zekasi.fonksiyonlar import sphere
+
+
+def _legacy_generation(population, light_intensity, beta0, gamma):
+    # Özgün çift döngünün hareket formülü; hareketler nesil başındaki konumlarla eşzamanlı uygulanır.
+    moved = population.copy()
+    for i in range(len(population)):
+        for j in range(len(population)):
+            if light_intensity[i] > light_intensity[j]:
+                r = np.linalg.norm(population[i] - population[j])
+                moved[i] += beta0 * np.exp(-gamma * r ** 2) * (population[j] - population[i])
+    return moved
+
+
+@pytest.mark.parametrize('n_fireflies', [2, 10, 25])
+def test_vectorized_move_matches_legacy_loop(n_fireflies):
+    swarm = FireflySwarm(sphere, 4, n_fireflies, alpha=0.0, beta0=0.8, gamma=1.5, rng=3)
+    expected = _legacy_generation(swarm.population.copy(), swarm.light_intensity, 0.8, 1.5)
+    swarm.step()
+    np.testing.assert_allclose(swarm.population, expected, rtol=1e-12, atol=1e-12)
+    np.testing.assert_array_equal(swarm.light_intensity, sphere(swarm.population))
+
+
+def test_two_fireflies_match_legacy_algorithm():
+    # İki ateşböceğinde tek hareket vardır; sıralı ve eşzamanlı güncelleme aynı sonucu verir.
+    values = []
+    firefly_algorithm(sphere, 3, n_fireflies=2, alpha=0.0, max_gen=1, rng=5,
+                      callback=lambda gen, solution, value: values.append(value))
+    swarm = FireflySwarm(sphere, 3, 2, alpha=0.0, rng=5)
+    swarm.step()
+    assert values == [swarm.best_intensity]
+
+
+def test_vectorized_converges_like_legacy():
+    _, legacy = firefly_algorithm(sphere, 3, n_fireflies=15, alpha=0.05, max_gen=30, rng=1)
+    _, vectorized = firefly_algorithm_vectorized(sphere, 3, n_fireflies=15, alpha=0.05, max_gen=30, rng=1)
+    assert vectorized < 0.05 and legacy < 0.05
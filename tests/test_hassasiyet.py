@@ -0,0 +1,41 @@
+import numpy as np
+import pytest
+
+from suru_zekasi.aco import AntColonyOptimizer, EuclideanDistances
+from suru_zekasi.fonksiyonlar import sphere
+from suru_zekasi.hassasiyet import float_dtype, format_memory_report, index_dtype, memory_report, total_bytes
+from suru_zekasi.pso import ParticleSwarm
+
+
+def test_float_dtype():
+    assert float_dtype() == np.float64
+    assert float_dtype('float32') == np.float32
+    assert float_dtype(np.float32) == np.float32
+    with pytest.raises(ValueError):
+        float_dtype(np.int32)
+
+
+def test_index_dtype():
+    assert index_dtype(10000) == np.int16
+    assert index_dtype(40000) == np.int32
+    assert index_dtype(2 ** 40) == np.int64
+
+
+def test_float32_halves_swarm_memory():
+    double = ParticleSwarm(sphere, 100, 20, -5, 5, rng=0)
+    single = ParticleSwarm(sphere, 100, 20, -5, 5, rng=0, dtype=np.float32)
+    assert single.X.dtype == single.V.dtype == np.float32
+    assert total_bytes(single) * 2 == pytest.approx(total_bytes(double), rel=0.05)
+
+
+def test_shared_arrays_are_counted_once():
+    points = np.random.default_rng(0).random((1000, 2))
+    optimizer = AntColonyOptimizer(EuclideanDistances(points), 5, 2, 1, 0.9, n_candidates=10)
+    assert optimizer.pheromone.candidates is optimizer.candidates
+    report = {entry['name']: entry for entry in memory_report(optimizer)}
+    assert report['candidates']['owned'] and report['candidates']['alias'] is None
+    assert not report['pheromone.candidates']['owned']
+    assert report['pheromone.candidates']['alias'] == 'candidates'
+    assert total_bytes(optimizer) == sum(entry['bytes'] for name, entry in report.items()
+                                         if name != 'pheromone.candidates')
+    assert '(= candidates)' in format_memory_report(memory_report(optimizer))
@@ -0,0 +1,22 @@
+from suru_zekasi.izleme import Profiler
+
+
+def test_chrome_trace_counters_are_running_totals():
+    profiler = Profiler()
+    profiler.count('scouts', 2)
+    with profiler.phase('move'):
+        profiler.count('scouts', 3)
+    profiler.count('restarts')
+    counters = [event for event in profiler.chrome_trace()['traceEvents'] if event['ph'] == 'C']
+    assert [event['args'] for event in counters] == [{'scouts': 2}, {'scouts': 5}, {'restarts': 1}]
+    assert [event['name'] for event in profiler.chrome_trace()['traceEvents'] if event['ph'] == 'X'] == ['move']
+
+
+def test_phases_nest():
+    profiler = Profiler()
+    with profiler.phase('outer'):
+        with profiler.phase('inner'):
+            pass
+    stacks = [line.rsplit(' ', 1)[0] for line in profiler.collapsed_stacks()]
+    assert sorted(stacks) == ['outer', 'outer;inner']
+    assert profiler.summary()['phases']['inner']['calls'] == 1
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from suru_zekasi import ALGORITHMS
+from suru_zekasi.kiyaslama import load_algorithm, main
+
+_KEYS = {'algorithm', 'problem', 'size', 'seed', 'precision', 'wall_time', 'evaluations', 'evaluations_per_second',
+         'best_value', 'peak_rss_mb', 'state_bytes', 'trace'}
+
+
+def test_load_algorithm():
+    assert load_algorithm('pso').__name__ == 'suru_zekasi.pso'
+    with pytest.raises(ValueError):
+        load_algorithm('kiyaslama')
+
+
+def test_quick_smoke_run(tmp_path, capsys):
+    output = tmp_path / 'sonuc.json'
+    argv = ['--quick', '--no-isolate', '--functions', 'sphere', '--budget', '200', '--tsp-iterations', '2',
+            '--precisions', 'float64', 'float32', '--output', str(output)]
+    report = main(argv)
+    results = report['results']
+    assert [(result['algorithm'], result['precision']) for result in results] == \
+           [(algorithm, precision) for algorithm in ALGORITHMS for precision in ('float64', 'float32')]
+    for result in results:
+        assert set(result) == _KEYS
+        assert result['size'] == (100 if result['algorithm'] == 'aco' else 10)
+        assert result['evaluations'] > 0 and result['state_bytes'] > 0
+        assert result['trace'] and result['trace'][-1][1] == result['best_value']
+    assert json.loads(output.read_text(encoding='utf-8'))['meta']['config']['budget'] == 200
+
+    # Aynı dosyayla karşılaştırmada her durum için bir ilerleme ve bir karşılaştırma satırı yazılır.
+    capsys.readouterr()
+    main(argv[:-2] + ['--compare', str(output)])
+    assert len(capsys.readouterr().out.splitlines()) == 2 * len(results)
+
+
+def test_isolated_case_runs_in_subprocess():
+    report = main(['--quick', '--algorithms', 'pso', '--functions', 'sphere', '--budget', '100'])
+    [result] = report['results']
+    assert result['algorithm'] == 'pso' and 0 < result['evaluations'] <= 100
@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from suru_zekasi.aco import AntColonyOptimizer
+from suru_zekasi.ais import ClonalSelection
+from suru_zekasi.bee_colony import BeeColony
+from suru_zekasi.dolphin import DolphinSwarm
+from suru_zekasi.firefly import FireflySwarm
+from suru_zekasi.fonksiyonlar import rastrigin
+from suru_zekasi.kontrol_noktasi import Checkpointer
+from suru_zekasi.pso import BatchedParticleSwarm, ParticleSwarm
+from suru_zekasi.rastgele import BufferedRandom
+
+
+def _distances(n=40, seed=0):
+    points = np.random.default_rng(seed).random((n, 2))
+    return np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1))
+
+
+def _run(optimizer, iterations, checkpoint=None):
+    if isinstance(optimizer, AntColonyOptimizer):
+        optimizer.n_iterations = optimizer.iteration + iterations
+        optimizer.run(checkpoint=checkpoint)
+    else:
+        optimizer.run(iterations, checkpoint=checkpoint)
+
+
+# (oluşturucu, karşılaştırılan durum dizileri); BufferedRandom'un tampon durumu da kaydedilmelidir.
+OPTIMIZERS = {
+    'pso': (lambda rng: ParticleSwarm(rastrigin, 20, 5, -5, 5, topology='ring', rng=rng),
+            lambda o: (o.X, o.V, o.G_best)),
+    'pso_batched': (lambda rng: BatchedParticleSwarm(rastrigin, 4, 10, 5, -5, 5, patience=30, rng=rng),
+                    lambda o: (o.best_positions, o.best_values)),
+    'bee_colony': (lambda rng: BeeColony(rastrigin, (-5, 5), 20, 5, rng=rng),
+                   lambda o: (o.positions, o.values, o.trials)),
+    'dolphin': (lambda rng: DolphinSwarm(rastrigin, (-5, 5), 20, 5, rng=rng),
+                lambda o: (o.population, o.known, o.delays)),
+    'firefly': (lambda rng: FireflySwarm(rastrigin, 5, 20, rng=rng),
+                lambda o: (o.population,)),
+    'ais': (lambda rng: ClonalSelection(40, 8, rng=rng),
+            lambda o: (o.genes, o.affinities)),
+    'aco': (lambda rng: AntColonyOptimizer(_distances(), 8, 3, None, 0.9, beta=2, rng=rng),
+            lambda o: (o.pheromone, o.shortest_path)),
+}
+
+
+@pytest.mark.parametrize('buffered', [False, True])
+@pytest.mark.parametrize('name', sorted(OPTIMIZERS))
+def test_resume_is_bit_identical(name, buffered, tmp_path):
+    make, state = OPTIMIZERS[name]
+    seed = (lambda: BufferedRandom(1, block_size=500)) if buffered else (lambda: 1)
+    reference = make(seed())
+    _run(reference, 20)
+    # Kontrol noktası her 5 iterasyonda alınır; 12. iterasyonda kesilen çalışma 10'dan sürdürülür.
+    interrupted = make(seed())
+    _run(interrupted, 12, Checkpointer(tmp_path, interval=5))
+    resumed = make(seed())
+    assert Checkpointer(tmp_path).restore(resumed)
+    assert resumed.iteration == 10
+    _run(resumed, 10)
+    for expected, actual in zip(state(reference), state(resumed)):
+        np.testing.assert_array_equal(np.asarray(actual), np.asarray(expected))
+
+
+def test_float32_resume_keeps_dtype(tmp_path):
+    reference = ParticleSwarm(rastrigin, 20, 5, -5, 5, rng=1, dtype=np.float32)
+    reference.run(5)
+    reference.save(tmp_path)
+    reference.run(5)
+    resumed = ParticleSwarm(rastrigin, 20, 5, -5, 5, rng=1, dtype=np.float32)
+    resumed.restore(tmp_path)
+    resumed.run(5)
+    assert resumed.X.dtype == np.float32
+    np.testing.assert_array_equal(resumed.X, reference.X)
+
+
+def test_async_runners_refuse_checkpoints(tmp_path):
+    from suru_zekasi.bee_colony import AsyncBeeColony
+    from suru_zekasi.pso import AsyncParticleSwarm
+
+    for optimizer in (AsyncParticleSwarm(rastrigin, 10, 3, -5, 5, rng=1),
+                      AsyncBeeColony(rastrigin, (-5, 5), 10, 3, rng=1)):
+        optimizer.run(2)
+        with pytest.raises(NotImplementedError):
+            optimizer.save(tmp_path / 'async')
+        with pytest.raises(NotImplementedError):
+            Checkpointer(tmp_path / 'async', interval=1).update(optimizer)
+        assert not (tmp_path / 'async').exists()
+    ParticleSwarm(rastrigin, 10, 3, -5, 5, rng=1).save(tmp_path / 'sync')
+    with pytest.raises(NotImplementedError):
+        AsyncParticleSwarm(rastrigin, 10, 3, -5, 5, rng=1).restore(tmp_path / 'sync')
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from suru_zekasi.degerlendirme import vectorized
+from suru_zekasi.fonksiyonlar import rastrigin, sphere
+from suru_zekasi.pso import BatchedParticleSwarm, ParticleSwarm, neighbourhood_indices
+
+
+def _assert_symmetric(neighbours):
+    for i, row in enumerate(neighbours):
+        assert i in row
+        for j in row:
+            assert i in neighbours[j]
+
+
+def test_ring_topology():
+    neighbours = neighbourhood_indices(5, 'ring')
+    np.testing.assert_array_equal(neighbours[0], [4, 0, 1])
+    _assert_symmetric(neighbours)
+
+
+def test_von_neumann_topology_on_square_grid():
+    neighbours = neighbourhood_indices(12, 'von_neumann')  # 3 x 4 simit ızgara
+    np.testing.assert_array_equal(neighbours[0], [0, 8, 4, 3, 1])
+    np.testing.assert_array_equal(neighbours[5], [5, 1, 9, 4, 6])
+    _assert_symmetric(neighbours)
+
+
+@pytest.mark.parametrize('n_particles', [7, 11, 13, 31, 97])
+def test_von_neumann_topology_for_prime_swarm_sizes(n_particles):
+    # Tek satırlı ızgarada yukarı/aşağı komşular parçacığın kendisi olurdu; dört ayrı komşu beklenir.
+    neighbours = neighbourhood_indices(n_particles, 'von_neumann')
+    assert neighbours.shape == (n_particles, 5)
+    assert all(len(set(row)) == 5 for row in neighbours.tolist())
+    _assert_symmetric(neighbours)
+
+
+def test_unknown_topology_and_boundary():
+    with pytest.raises(ValueError):
+        neighbourhood_indices(10, 'star')
+    with pytest.raises(ValueError):
+        ParticleSwarm(sphere, 10, 2, -1, 1, boundary='wrap')
+
+
+@pytest.mark.parametrize('topology', ['gbest', 'ring', 'von_neumann'])
+def test_topologies_optimize(topology):
+    swarm = ParticleSwarm(sphere, 30, 5, -5, 5, topology=topology, rng=0)
+    _, value = swarm.run(100)
+    assert value < 1e-2
+    if topology != 'gbest':
+        # Komşuluk en iyisi, komşuların kişisel en iyilerinin en küçüğüdür.
+        leaders = swarm.neighbours[np.arange(30), np.argmin(swarm.P_best_val[swarm.neighbours], axis=1)]
+        np.testing.assert_array_equal(swarm._social, swarm.P_best[leaders])
+
+
+@pytest.mark.parametrize('boundary', ['clip', 'reflect', 'absorb'])
+def test_boundaries_keep_particles_inside(boundary):
+    swarm = ParticleSwarm(rastrigin, 30, 4, [-1, -2, -3, -4], [1, 2, 3, 4], v_max=10, boundary=boundary, rng=1)
+    for _ in range(20):
+        swarm.step()
+        assert np.all(swarm.X >= swarm.x_min) and np.all(swarm.X <= swarm.x_max)
+
+
+def test_boundary_velocity_handling():
+    swarm = ParticleSwarm(sphere, 1, 1, 0, 1, boundary='reflect')
+    X, V = np.array([1.25, -0.5]), np.array([0.5, -0.5])
+    swarm._apply_boundary(X, V)
+    np.testing.assert_array_equal(X, [0.75, 0.5])
+    np.testing.assert_array_equal(V, [-0.5, 0.5])
+    swarm.boundary = 'absorb'
+    X, V = np.array([1.25, 0.5]), np.array([0.5, 0.25])
+    swarm._apply_boundary(X, V)
+    np.testing.assert_array_equal(X, [1.0, 0.5])
+    np.testing.assert_array_equal(V, [0.0, 0.25])
+    swarm.boundary = 'clip'
+    X, V = np.array([-0.5]), np.array([-0.5])
+    swarm._apply_boundary(X, V)
+    np.testing.assert_array_equal(X, [0.0])
+    np.testing.assert_array_equal(V, [-0.5])
+
+
+def test_batched_swarm_compacts_converged_swarms():
+    # 1. sürü hiç iyileşmez ve patience iterasyon sonra dizilerden çıkarılır; diğerleri her iterasyonda iyileşir.
+    swarm = BatchedParticleSwarm(None, 4, 3, 2, -5, 5, patience=3, rng=0)
+    for k in range(6):
+        batch = swarm.ask()
+        assert batch.shape == (3 * len(swarm.active), 2)
+        values = np.full((len(swarm.active), 3), -float(k))
+        values[swarm.active == 1] = 7.0
+        swarm.tell(values.ravel())
+        if k >= 3:
+            np.testing.assert_array_equal(swarm.active, [0, 2, 3])
+    assert swarm.X.shape == swarm.V.shape == swarm.P_best.shape == (3, 3, 2)
+    assert swarm.G_best_val.shape == swarm.stall.shape == swarm.w.shape[:1] == (3,)
+    np.testing.assert_array_equal(swarm.converged, [False, True, False, False])
+    np.testing.assert_array_equal(swarm.iterations, [5, 3, 5, 5])
+    assert swarm.best_values[1] == 7.0
+    np.testing.assert_array_equal(swarm.G_best_val, [-5.0, -5.0, -5.0])
+
+
+def test_batched_swarm_evaluates_only_active_swarms():
+    sizes = []
+
+    @vectorized
+    def objective(X):
+        sizes.append(len(X))
+        return sphere(X)
+
+    swarm = BatchedParticleSwarm(objective, 6, 10, 2, -5, 5, target=1e-2, rng=1)
+    positions, values = swarm.run(200)
+    assert not len(swarm.active) and swarm.converged.all()
+    assert all(size % 10 == 0 for size in sizes) and sizes == sorted(sizes, reverse=True) and sizes[-1] < 60
+    assert (values <= 1e-2).all()
+    np.testing.assert_allclose(sphere(positions), values)
+    assert swarm.objective.n_evaluations == sum(sizes)
@@ -0,0 +1,46 @@
+import json
+
+import numpy as np
+import pytest
+
+from suru_zekasi.rastgele import BufferedRandom, get_rng_state, make_rng, set_rng_state
+
+
+def _draws(rng):
+    # Blok sınırlarını aşan, blok boyutundan büyük ve iki dağılımı karıştıran çekilişler
+    return [rng.random(7), rng.normal(size=(3, 4)), rng.uniform(-1, 1, size=20), rng.integers(5, size=9),
+            rng.random(40), rng.standard_normal(13), rng.random(dtype=np.float32, out=np.empty((2, 5), np.float32))]
+
+
+@pytest.mark.parametrize('warmup', [0, 3, 16, 17, 40, 100])
+def test_buffered_state_round_trip(warmup):
+    rng = BufferedRandom(0, block_size=16)
+    rng.random(warmup)
+    rng.normal(size=warmup // 2)
+    state = json.loads(json.dumps(get_rng_state(rng)))  # Durum JSON'a yazılabilir olmalıdır
+    expected = _draws(rng)
+
+    # Aynı nesneye ve farklı tohumlu yeni bir nesneye geri yükleme aynı sayıları verir.
+    for target in (rng, BufferedRandom(99, block_size=16)):
+        set_rng_state(target, state)
+        for actual, values in zip(_draws(target), expected):
+            np.testing.assert_array_equal(actual, values)
+
+
+def test_fresh_state_round_trip():
+    rng = BufferedRandom(3, block_size=8)
+    state = rng.state
+    assert state['buffers'] == {'uniform': [None, 0], 'normal': [None, 0]}
+    expected = _draws(rng)
+    rng.state = state
+    for actual, values in zip(_draws(rng), expected):
+        np.testing.assert_array_equal(actual, values)
+
+
+def test_generator_state_round_trip():
+    rng = make_rng(5)
+    rng.random(10)
+    state = get_rng_state(rng)
+    expected = rng.random(10)
+    set_rng_state(rng, state)
+    np.testing.assert_array_equal(rng.random(10), expected)
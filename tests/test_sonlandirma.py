@@ -0,0 +1,78 @@
+import pytest
+
+from suru_zekasi.fonksiyonlar import sphere
+from suru_zekasi.pso import ParticleSwarm
+from suru_zekasi.sonlandirma import Termination, iteration_range
+
+
+class _Clock:
+    # Her okumada bir saniye ilerleyen sahte saat
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+def _stop_iteration(termination, values, evaluations_per_iteration=10):
+    # Durulan iterasyonu döndürür (durulmadıysa None).
+    for i, value in enumerate(values, 1):
+        if termination.should_stop(i, value, i * evaluations_per_iteration):
+            return i
+    return None
+
+
+@pytest.mark.parametrize('kwargs, values, iteration, reason', [
+    ({}, [5, 4, 3, 2, 1], None, None),
+    ({'max_iterations': 3}, [5, 4, 3, 2, 1], 3, 'max_iterations'),
+    ({'max_evaluations': 25}, [5, 4, 3, 2, 1], 3, 'max_evaluations'),
+    ({'max_time': 2.5}, [5, 4, 3, 2, 1], 3, 'max_time'),
+    ({'target': 2}, [5, 4, 3, 2, 1], 4, 'target'),
+    ({'patience': 2}, [5, 4, 4, 4, 1], 4, 'stagnation'),
+    ({'patience': 2, 'tolerance': 1.5}, [5, 4, 3, 2, 1], 3, 'stagnation'),
+    ({'patience': 2, 'rtol': 0.3}, [10, 5, 3, 2.5, 2], 5, 'stagnation'),
+    ({'target': 3, 'maximize': True}, [1, 2, 3, 4, 5], 3, 'target'),
+    ({'patience': 2, 'maximize': True}, [1, 2, 1, 2, 3], 4, 'stagnation'),
+])
+def test_reasons(kwargs, values, iteration, reason):
+    termination = Termination(clock=_Clock(), **kwargs)
+    assert _stop_iteration(termination, values) == iteration
+    assert termination.reason == reason
+
+
+def test_reason_priority():
+    # Aynı iterasyonda birden çok kriter sağlanırsa hedef, durağanlık ve bütçelerden önce gelir.
+    termination = Termination(max_iterations=1, max_evaluations=1, patience=1, target=0)
+    assert termination.should_stop(1, 0, 1) and termination.reason == 'target'
+    termination = Termination(max_iterations=2, max_evaluations=1, patience=1)
+    termination.should_stop(1, 0, 1)
+    assert termination.should_stop(2, 0, 2) and termination.reason == 'stagnation'
+    termination = Termination(max_iterations=1, max_evaluations=1)
+    assert termination.should_stop(1, 0, 1) and termination.reason == 'max_iterations'
+
+
+def test_start_resets_state():
+    termination = Termination(patience=1)
+    _stop_iteration(termination, [1, 1])
+    assert termination.reason == 'stagnation'
+    termination.start()
+    assert (termination.reason, termination.stall, termination.iteration) == (None, 0, 0)
+    assert not termination.should_stop(1, 1)
+
+
+def test_iteration_range():
+    assert iteration_range(3) == range(3)
+    with pytest.raises(ValueError):
+        iteration_range(None)
+    termination = Termination(max_iterations=1)
+    termination.should_stop(1, 0)
+    assert next(iter(iteration_range(None, termination))) == 0 and termination.reason is None
+
+
+def test_run_stops_with_reason():
+    termination = Termination(max_evaluations=300)
+    swarm = ParticleSwarm(sphere, 30, 5, -5, 5, rng=0)
+    swarm.run(None, termination=termination)
+    assert termination.reason == 'max_evaluations'
+    assert swarm.objective.n_evaluations == 300 and termination.iteration == 9
@@ -0,0 +1,169 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from suru_zekasi.aco import AntColonyOptimizer
+from suru_zekasi.ais import ClonalSelection
+from suru_zekasi.bee_colony import AsyncBeeColony, BeeColony
+from suru_zekasi.degerlendirme import ThreadPoolEvaluator
+from suru_zekasi.dolphin import DolphinSwarm
+from suru_zekasi.firefly import FireflySwarm
+from suru_zekasi.fonksiyonlar import sphere
+from suru_zekasi.izleme import Profiler
+from suru_zekasi.pso import AsyncParticleSwarm, BatchedParticleSwarm, ParticleSwarm
+from suru_zekasi.sonlandirma import Termination
+from suru_zekasi.sor_bildir import interleave
+
+# (oluşturucu, karşılaştırılan durum dizileri); objective=None ile oluşturulanlar ask/tell ile sürülür.
+OPTIMIZERS = [
+    (lambda objective: ParticleSwarm(objective, 20, 5, -5, 5, rng=1), lambda o: (o.X, o.G_best)),
+    (lambda objective: BatchedParticleSwarm(objective, 4, 10, 3, -5, 5, patience=30, rng=2),
+     lambda o: (o.X, o.V, o.G_best_val)),
+    (lambda objective: BeeColony(objective, [-5, 5], 20, 3, limit=5, rng=3), lambda o: (o.positions, o.values)),
+    (lambda objective: DolphinSwarm(objective, (-5, 5), 10, 3, rng=4), lambda o: (o.population, o.known)),
+    (lambda objective: FireflySwarm(objective, 3, 15, rng=5), lambda o: (o.population,)),
+]
+
+
+def _assert_same_state(state, expected, actual):
+    for a, b in zip(state(expected), state(actual)):
+        np.testing.assert_array_equal(np.asarray(b), np.asarray(a))
+
+
+@pytest.mark.parametrize('make, state', OPTIMIZERS)
+def test_ask_tell_matches_step(make, state):
+    reference = make(sphere)
+    for _ in range(10):
+        reference.step()
+    driven = make(sphere)
+    iterations = 0
+    while iterations < 10:
+        iterations += driven.tell(sphere(driven.ask()))
+    _assert_same_state(state, reference, driven)
+    assert driven.objective.n_evaluations == reference.objective.n_evaluations
+
+
+@pytest.mark.parametrize('pooled', [False, True])
+def test_interleave_matches_run(pooled):
+    references = [make(sphere) for make, _ in OPTIMIZERS]
+    for reference in references:
+        reference.run(10)
+    optimizers = [make(None) for make, _ in OPTIMIZERS]
+    finished = []
+    executor = ThreadPoolExecutor(2) if pooled else None
+    try:
+        interleave(optimizers, sphere, 10, executor=executor, callback=lambda i, o: finished.append(i))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    assert [o.iteration for o in optimizers] == [10] * len(OPTIMIZERS)
+    assert len(finished) == 10 * len(OPTIMIZERS)
+    for (_, state), reference, optimizer in zip(OPTIMIZERS, references, optimizers):
+        _assert_same_state(state, reference, optimizer)
+
+
+def test_aco_ask_tell_matches_run():
+    points = np.random.default_rng(0).random((20, 2))
+    distances = np.sqrt(((points[:, None] - points[None]) ** 2).sum(-1))
+    _, cost = AntColonyOptimizer(distances, 8, 3, 10, 0.9, rng=7).run()
+    driven = AntColonyOptimizer(distances, 8, 3, 10, 0.9, rng=7)
+    while driven.iteration < 10:
+        paths = driven.ask()
+        driven.tell(distances[paths[:, :-1], paths[:, 1:]].sum(axis=1))
+    assert driven.best_cost == cost
+
+
+def test_tell_requires_ask():
+    swarm = ParticleSwarm(None, 10, 2, -1, 1, rng=0)
+    with pytest.raises(RuntimeError):
+        swarm.tell(np.zeros(10))
+    batch = swarm.ask()
+    with pytest.raises(RuntimeError):
+        swarm.ask()
+    swarm.tell(sphere(batch))
+
+
+def test_clonal_selection_without_affinity():
+    reference = ClonalSelection(30, 6, affinity=lambda genes: 1 / (1 + np.sum(genes ** 2)), rng=1)
+    reference.run(5)
+    driven = ClonalSelection(30, 6, affinity=None, rng=1)
+    while driven.iteration < 5:
+        genes = driven.ask()
+        driven.tell(1 / (1 + np.sum(genes ** 2, axis=1)))
+    np.testing.assert_allclose(driven.genes, reference.genes)
+
+
+class _InFlight:
+    # Aynı anda işlemde olan değerlendirmelerin en yüksek sayısını kaydeden skaler sphere
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.current = self.peak = 0
+
+    def __call__(self, x):
+        with self.lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        time.sleep(0.001 * (1 + len(x) % 3))
+        with self.lock:
+            self.current -= 1
+        return float(np.sum(x ** 2))
+
+
+# (oluşturucu, iterasyon başına değerlendirme, sınanan durum: konumlar ve değerleri)
+ASYNC_RUNNERS = [
+    (lambda objective, evaluator: AsyncParticleSwarm(objective, 12, 3, -5, 5, evaluator=evaluator, rng=0), 12,
+     lambda o: (o.P_best, o.P_best_val)),
+    (lambda objective, evaluator: AsyncBeeColony(objective, [-5, 5], 6, 3, limit=3, evaluator=evaluator, rng=0), 12,
+     lambda o: (o.positions, o.values)),
+]
+
+
+@pytest.mark.parametrize('make, sweep_size, state', ASYNC_RUNNERS)
+@pytest.mark.parametrize('n_workers', [1, 3])
+def test_async_runner_budget_and_state(make, sweep_size, state, n_workers):
+    objective = _InFlight()
+    calls = []
+    with ThreadPoolEvaluator(max_workers=3) as evaluator:
+        runner = make(objective, evaluator)
+        position, value = runner.run(6, callback=lambda i, x, v: calls.append((i, v)), n_workers=n_workers)
+    assert runner.objective.n_evaluations == 6 * sweep_size and runner.iteration == 6
+    assert objective.peak <= n_workers and objective.current == 0
+    assert [i for i, _ in calls] == list(range(1, 7))
+    assert all(a >= b for (_, a), (_, b) in zip(calls, calls[1:]))
+    # Kaydedilen her değer kendi konumunun değeridir; kâşifler kaynakları kötüleştirebildiğinden en iyi çözüm
+    # bunlardan daha iyi olabilir.
+    positions, values = state(runner)
+    np.testing.assert_allclose(sphere(positions), values)
+    assert value <= values.min() and np.sum(position ** 2) == pytest.approx(value)
+
+
+def test_async_runner_with_serial_evaluator_is_reproducible():
+    results = [AsyncParticleSwarm(sphere, 10, 3, -5, 5, rng=4).run(20) for _ in range(2)]
+    np.testing.assert_array_equal(results[0][0], results[1][0])
+    assert results[0][1] == results[1][1] < 1e-1
+
+
+@pytest.mark.parametrize('make, sweep_size, state', ASYNC_RUNNERS)
+def test_async_runner_termination_drains_pending(make, sweep_size, state):
+    objective = _InFlight()
+    termination = Termination(max_evaluations=2 * sweep_size)
+    with ThreadPoolEvaluator(max_workers=3) as evaluator:
+        runner = make(objective, evaluator)
+        runner.run(None, termination=termination, n_workers=3)
+    assert termination.reason == 'max_evaluations' and objective.current == 0
+    # Durulduğu anda işlemde olan değerlendirmeler de işlenir ve sayılır.
+    assert 2 * sweep_size <= runner.objective.n_evaluations < 2 * sweep_size + 3
+    with pytest.raises(ValueError):
+        runner.run(None)
+
+
+def test_async_bee_colony_sends_scouts():
+    profiler = Profiler()
+    colony = AsyncBeeColony(sphere, [-5, 5], 4, 2, limit=1, rng=1, profiler=profiler)
+    colony.run(30)
+    assert profiler.counters['scouts'] > 0
+    # Deneme sınırını aşan her kaynağın kâşif adayı sırada ya da işlemdedir.
+    assert set(np.flatnonzero(colony.trials > colony.limit)) <= colony._scouting